@@ -0,0 +1,138 @@
+"""Compares storing big events with and without payload compression.
+
+Run with `python -m benchmarks.compression` from the repository root.
+SQLAlchemy backend uses a temporary SQLite database, table size is a sum
+of stored payload lengths and the database file size after `VACUUM`.
+"""
+
+import json
+import random
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import MetaData, create_engine, text
+from sqlalchemy.orm import Session, as_declarative
+
+from event_sourcery.event_store import (
+    Event,
+    EventStore,
+    InMemoryBackendFactory,
+    StreamId,
+)
+from event_sourcery.event_store.event import Compression
+from event_sourcery.event_store.in_memory import Config as InMemoryConfig
+from event_sourcery_sqlalchemy import Config as SQLAlchemyConfig
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory, configure_models
+
+STREAMS = 50
+EVENTS_PER_STREAM = 20
+WORDS = [
+    "order", "placed", "paid", "shipped", "customer", "address", "street",
+    "invoice", "line", "item", "quantity", "price", "discount", "tax", "note",
+]  # fmt: skip
+
+
+class DocumentUpdated(Event):
+    title: str
+    lines: list[dict[str, str | int]]
+
+
+@as_declarative()
+class Base:
+    metadata: MetaData
+
+
+configure_models(Base)
+
+
+def a_document(rng: random.Random) -> DocumentUpdated:
+    return DocumentUpdated(
+        title=" ".join(rng.choices(WORDS, k=8)),
+        lines=[
+            {
+                "description": " ".join(rng.choices(WORDS, k=12)),
+                "quantity": rng.randint(1, 100),
+                "price": rng.randint(100, 100_000),
+            }
+            for _ in range(200)
+        ],
+    )
+
+
+def run(store: EventStore, commit: Callable[[], None]) -> tuple[float, float]:
+    rng = random.Random(0)  # noqa: S311
+    streams = [StreamId() for _ in range(STREAMS)]
+
+    started = time.perf_counter()
+    for stream_id in streams:
+        store.append(
+            *(a_document(rng) for _ in range(EVENTS_PER_STREAM)),
+            stream_id=stream_id,
+        )
+        commit()
+    appended = time.perf_counter()
+    for stream_id in streams:
+        store.load_stream(stream_id)
+    loaded = time.perf_counter()
+
+    return appended - started, loaded - appended
+
+
+def in_memory(compression: Compression | None) -> tuple[float, float, int]:
+    factory = InMemoryBackendFactory(_config=InMemoryConfig(compression=compression))
+    append_time, load_time = run(factory.build().event_store, lambda: None)
+    size = sum(
+        len(json.dumps(record.entry.data)) for record in factory._storage.records
+    )
+    return append_time, load_time, size
+
+
+@contextmanager
+def sqlite_session() -> Iterator[tuple[Session, Path]]:
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "benchmark.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as session:
+            yield session, path
+        engine.dispose()
+
+
+def sqlalchemy(compression: Compression | None) -> tuple[float, float, int, int]:
+    with sqlite_session() as (session, path):
+        factory = SQLAlchemyBackendFactory(
+            session,
+            _config=SQLAlchemyConfig(compression=compression),
+        )
+        append_time, load_time = run(factory.build().event_store, session.commit)
+        size = session.scalar(
+            text("SELECT sum(length(data)) FROM event_sourcery_events")
+        )
+        session.execute(text("VACUUM"))
+        return append_time, load_time, size, path.stat().st_size
+
+
+def main() -> None:
+    print(f"{STREAMS} streams x {EVENTS_PER_STREAM} events")
+    for name, compression in (
+        ("none", None),
+        ("zlib", Compression(algorithm="zlib")),
+    ):
+        append_time, load_time, size = in_memory(compression)
+        print(
+            f"in-memory  {name:5} append {append_time:6.2f}s "
+            f"load {load_time:6.2f}s payloads {size / 2**20:7.2f} MiB"
+        )
+        append_time, load_time, size, file_size = sqlalchemy(compression)
+        print(
+            f"sqlalchemy {name:5} append {append_time:6.2f}s "
+            f"load {load_time:6.2f}s payloads {size / 2**20:7.2f} MiB "
+            f"file {file_size / 2**20:7.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Measures cost of records on the backend-to-Serde path.
+
+Run with `python -m benchmarks.records` from the repository root.
+For each stage reports time and memory retained per record. Memory is
+traced in a separate run, as tracing slows allocations down.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from uuid import uuid4
+
+from event_sourcery.event_store import Event, RawEvent, RecordedRaw, StreamId
+from event_sourcery.event_store.event import Serde
+
+RECORDS = 200_000
+
+
+class ItemAdded(Event):
+    sku: str
+    quantity: int
+
+
+def measure(name: str, build: Callable[[int], Any]) -> list[Any]:
+    gc.collect()
+    started = time.perf_counter()
+    built = [build(index) for index in range(RECORDS)]
+    elapsed = time.perf_counter() - started
+
+    del built
+    gc.collect()
+    tracemalloc.start()
+    built = [build(index) for index in range(RECORDS)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:12} {elapsed / RECORDS * 1e6:6.2f} us/record "
+        f"{retained / RECORDS:7.1f} B/record"
+    )
+    return built
+
+
+def main() -> None:
+    serde = Serde(Event.__registry__)
+    stream_id = StreamId(category="carts")
+    created_at = datetime.now()
+    data = {"sku": "SKU-1", "quantity": 1}
+    uuids = [uuid4() for _ in range(RECORDS)]
+
+    print(f"{RECORDS} records")
+    records = measure(
+        "RecordedRaw",
+        lambda index: RecordedRaw(
+            entry=RawEvent(
+                uuid=uuids[index],
+                stream_id=stream_id,
+                created_at=created_at,
+                name=serde.registry.name_for_type(ItemAdded),
+                data=data,
+                context={},
+                version=index,
+            ),
+            position=index,
+            tenant_id="default",
+        ),
+    )
+    measure("Recorded", lambda index: serde.deserialize_record(records[index]))
+    measure("WrappedEvent", lambda index: serde.deserialize(records[index].entry))
+
+
+if __name__ == "__main__":
+    main()
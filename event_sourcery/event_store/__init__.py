@@ -1,18 +1,24 @@
 __all__ = [
+    "AsyncBackend",
+    "AsyncEventStore",
     "Backend",
     "BackendFactory",
+    "BatchListener",
     "Dispatcher",
     "Entry",
     "Event",
     "Context",
     "EventRegistry",
+    "LazyWrappedEvent",
     "EventStore",
     "ExplicitVersioning",
     "InMemoryBackendFactory",
     "Listener",
     "WrappedEvent",
     "NO_VERSIONING",
+    "PollingPolicy",
     "Position",
+    "PostCommitDispatcher",
     "RawEvent",
     "Recorded",
     "RecordedRaw",
@@ -28,25 +34,33 @@ __all__ = [
 ]
 
 from event_sourcery.event_store import exceptions, factory, interfaces, subscription
-from event_sourcery.event_store.dispatcher import Dispatcher, Listener
+from event_sourcery.event_store.dispatcher import (
+    BatchListener,
+    Dispatcher,
+    Listener,
+    PostCommitDispatcher,
+)
 from event_sourcery.event_store.event import (
     Context,
     Entry,
     Event,
     EventRegistry,
+    LazyWrappedEvent,
     Position,
     RawEvent,
     Recorded,
     RecordedRaw,
     WrappedEvent,
 )
-from event_sourcery.event_store.event_store import EventStore
+from event_sourcery.event_store.event_store import AsyncEventStore, EventStore
 from event_sourcery.event_store.factory import (
+    AsyncBackend,
     Backend,
     BackendFactory,
     TransactionalBackend,
 )
 from event_sourcery.event_store.in_memory import InMemoryBackendFactory
+from event_sourcery.event_store.polling import PollingPolicy
 from event_sourcery.event_store.stream_id import StreamId, StreamUUID
 from event_sourcery.event_store.tenant_id import TenantId
 from event_sourcery.event_store.versioning import (
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import cache
+
+from event_sourcery.event_store.event import Position, RecordedRaw
+from event_sourcery.event_store.interfaces import CheckpointStorageStrategy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(repr=False)
+class Checkpointer:
+    """Saves the position of a named subscription every N events or T seconds.
+
+    A batch counts as processed once the next one is requested, so after a
+    crash at most the events since the last saved checkpoint are delivered
+    again. Checkpoints are saved in the background, one at a time, and the
+    last one is saved when the subscription is closed.
+    """
+
+    _strategy: CheckpointStorageStrategy
+    _name: str
+    _every: int
+    _interval: timedelta
+    _position: Position | None = field(init=False, default=None)
+    _saved: Position | None = field(init=False, default=None)
+    _unsaved: int = field(init=False, default=0)
+    _saved_at: float = field(init=False, default_factory=time.monotonic)
+    _saving: Future | None = field(init=False, default=None)
+
+    def load(self) -> Position:
+        self._saved = self._strategy.load(self._name)
+        return self._saved or Position(0)
+
+    def track(
+        self, subscription: Iterator[list[RecordedRaw]]
+    ) -> Generator[list[RecordedRaw], None, None]:
+        try:
+            for batch in subscription:
+                yield batch
+                self._processed(batch)
+        finally:
+            self.flush()
+
+    async def track_async(
+        self, subscribe: Callable[[Position], AsyncIterator[list[RecordedRaw]]]
+    ) -> AsyncGenerator[list[RecordedRaw], None]:
+        """Subscribes from the checkpoint, loaded without blocking the loop."""
+        subscription = subscribe(await asyncio.to_thread(self.load))
+        try:
+            async for batch in subscription:
+                yield batch
+                self._processed(batch)
+        finally:
+            await asyncio.to_thread(self.flush)
+
+    def flush(self) -> None:
+        if self._saving is not None:
+            self._saving.result()
+        if self._position is not None and self._position != self._saved:
+            self._save(self._position)
+
+    def _processed(self, batch: list[RecordedRaw]) -> None:
+        if batch:
+            self._position = batch[-1].position
+            self._unsaved += len(batch)
+        if self._position is not None and self._is_due(self._position):
+            self._unsaved = 0
+            self._saved_at = time.monotonic()
+            self._saving = _executor().submit(self._save, self._position)
+
+    def _is_due(self, position: Position) -> bool:
+        if position == self._saved:
+            return False
+        if self._saving is not None and not self._saving.done():
+            return False
+        return (
+            self._unsaved >= self._every
+            or time.monotonic() - self._saved_at >= self._interval.total_seconds()
+        )
+
+    def _save(self, position: Position) -> None:
+        try:
+            self._strategy.save(self._name, position)
+        except Exception:
+            logger.exception("Failed to save checkpoint of %r subscription", self._name)
+        else:
+            self._saved = position
+
+
+@cache
+def _executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoints")
@@ -1,9 +1,14 @@
+import logging
+from asyncio import AbstractEventLoop
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from functools import partial
 
 from event_sourcery.event_store.event import (
     Event,
     Position,
+    Recorded,
     RecordedRaw,
     Serde,
     WrappedEvent,
@@ -11,31 +16,132 @@ from event_sourcery.event_store.event import (
 from event_sourcery.event_store.stream_id import StreamId
 from event_sourcery.event_store.tenant_id import TenantId
 
+logger = logging.getLogger(__name__)
+
 Listener = Callable[[WrappedEvent, StreamId, TenantId, Position | None], None]
+BatchListener = Callable[[Mapping[type[Event], list[Recorded]]], None]
+OnCommit = Callable[[Callable[[], None]], None]
 
 
 class Dispatcher:
+    """Calls listeners registered to types of dispatched events or their bases.
+
+    Listeners are called once per record. Batch listeners are called once per
+    dispatch, with all records of types they are registered to grouped by
+    event type, so they can write each group in bulk. Listeners registered to
+    a type and its base get each record once. Listeners of each event name are
+    resolved once, following the MRO of its type, and cached until listeners
+    change. Records are deserialized only if they have listeners, so names
+    missing from the registry are skipped.
+    """
+
     def __init__(self, serde: Serde) -> None:
         self._listeners: dict[type[Event], set[Listener]] = defaultdict(set)
+        self._batch_listeners: dict[type[Event], set[BatchListener]] = defaultdict(set)
+        self._resolved: dict[str, tuple[list[Listener], list[BatchListener]]] = {}
         self._serde = serde
 
     def dispatch(self, *raws: RecordedRaw) -> None:
+        batches: dict[BatchListener, dict[type[Event], list[Recorded]]] = {}
         for raw in raws:
+            listeners, batch_listeners = self._listeners_for(raw.entry.name)
+            if not listeners and not batch_listeners:
+                continue
             record = self._serde.deserialize_record(raw)
-            for event_type, listeners in self._listeners.items():
-                if not isinstance(record.wrapped_event.event, event_type):
-                    continue
-                for listener in listeners:
-                    listener(
-                        record.wrapped_event,
-                        record.stream_id,
-                        record.tenant_id,
-                        record.position,
-                    )
+            for listener in listeners:
+                listener(
+                    record.wrapped_event,
+                    record.stream_id,
+                    record.tenant_id,
+                    record.position,
+                )
+            for batch_listener in batch_listeners:
+                groups = batches.setdefault(batch_listener, {})
+                groups.setdefault(record.wrapped_event.event_type, []).append(record)
+        for batch_listener, records in batches.items():
+            batch_listener(records)
+
+    def _listeners_for(self, name: str) -> tuple[list[Listener], list[BatchListener]]:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        try:
+            mro = self._serde.registry.type_for_name(name).__mro__
+        except KeyError:
+            return [], []
+        listeners = self._resolved[name] = (
+            list(
+                dict.fromkeys(
+                    listener
+                    for base in mro
+                    for listener in self._listeners.get(base, ())
+                )
+            ),
+            list(
+                dict.fromkeys(
+                    listener
+                    for base in mro
+                    for listener in self._batch_listeners.get(base, ())
+                )
+            ),
+        )
+        return listeners
 
     def register(self, listener: Listener, to: type[Event]) -> None:
         self._listeners[to].add(listener)
+        self._resolved.clear()
 
     def remove(self, listener: Listener, to: type[Event]) -> None:
         if listener in self._listeners[to]:
             self._listeners[to].remove(listener)
+            self._resolved.clear()
+
+    def register_batch(self, listener: BatchListener, to: type[Event]) -> None:
+        self._batch_listeners[to].add(listener)
+        self._resolved.clear()
+
+    def remove_batch(self, listener: BatchListener, to: type[Event]) -> None:
+        if listener in self._batch_listeners[to]:
+            self._batch_listeners[to].remove(listener)
+            self._resolved.clear()
+
+
+def run_now(callback: Callable[[], None]) -> None:
+    callback()
+
+
+class PostCommitDispatcher(Dispatcher):
+    """Delivers dispatched records to listeners after commit, on `executor`.
+
+    Backends pass `on_commit`, which runs given callback once the current
+    transaction commits and drops it on rollback. Listeners run outside of
+    the transaction, so they must not use its connection or session.
+    Failures of listeners are logged.
+    """
+
+    def __init__(
+        self,
+        serde: Serde,
+        executor: Executor | AbstractEventLoop,
+        on_commit: OnCommit = run_now,
+    ) -> None:
+        super().__init__(serde)
+        self._executor = executor
+        self._on_commit = on_commit
+
+    def dispatch(self, *raws: RecordedRaw) -> None:
+        if any(any(self._listeners_for(raw.entry.name)) for raw in raws):
+            self._on_commit(partial(self._submit, raws))
+
+    def _submit(self, raws: tuple[RecordedRaw, ...]) -> None:
+        if isinstance(self._executor, AbstractEventLoop):
+            self._executor.call_soon_threadsafe(self._deliver, raws)
+        else:
+            self._executor.submit(self._deliver, raws)
+
+    def _deliver(self, raws: tuple[RecordedRaw, ...]) -> None:
+        try:
+            super().dispatch(*raws)
+        except Exception:
+            logger.exception("Failed to deliver %d records after commit", len(raws))
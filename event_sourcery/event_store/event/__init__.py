@@ -1,8 +1,14 @@
 __all__ = [
+    "Codec",
+    "Compression",
     "Context",
     "Entry",
     "Event",
     "EventRegistry",
+    "JsonCodec",
+    "LazyWrappedEvent",
+    "MsgpackCodec",
+    "OrjsonCodec",
     "WrappedEvent",
     "Position",
     "RawEvent",
@@ -12,10 +18,18 @@ __all__ = [
 ]
 
 
+from event_sourcery.event_store.event.codec import (
+    Codec,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+)
+from event_sourcery.event_store.event.compression import Compression
 from event_sourcery.event_store.event.dto import (
     Context,
     Entry,
     Event,
+    LazyWrappedEvent,
     Position,
     RawEvent,
     Recorded,
@@ -0,0 +1,96 @@
+import abc
+import functools
+import json
+from typing import Any, ClassVar, Literal
+
+from event_sourcery.event_store.exceptions import UnknownContentType
+
+ContentType = Literal["application/json", "application/msgpack"]
+
+
+class Codec(abc.ABC):
+    """Encodes serialized events to bytes for backends storing raw payloads.
+
+    SQL backends store payloads in JSON columns, so they take no codec.
+    """
+
+    content_type: ClassVar[ContentType]
+
+    @abc.abstractmethod
+    def encode(self, data: dict) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def decode(self, encoded: bytes) -> dict:
+        pass
+
+
+class JsonCodec(Codec):
+    content_type = "application/json"
+
+    def encode(self, data: dict) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+    def decode(self, encoded: bytes) -> dict:
+        return json.loads(encoded)  # type: ignore[no-any-return]
+
+
+class OrjsonCodec(Codec):
+    """JSON codec using `orjson`. Requires `orjson` to be installed."""
+
+    content_type = "application/json"
+
+    def __init__(self) -> None:
+        import orjson  # noqa: PLC0415
+
+        self._orjson: Any = orjson
+
+    def encode(self, data: dict) -> bytes:
+        return self._orjson.dumps(data)  # type: ignore[no-any-return]
+
+    def decode(self, encoded: bytes) -> dict:
+        return self._orjson.loads(encoded)  # type: ignore[no-any-return]
+
+
+class MsgpackCodec(Codec):
+    """Binary codec using `msgpack`. Requires `msgpack` to be installed."""
+
+    content_type = "application/msgpack"
+
+    def __init__(self) -> None:
+        import msgpack  # noqa: PLC0415
+
+        self._msgpack: Any = msgpack
+
+    def encode(self, data: dict) -> bytes:
+        return self._msgpack.packb(data)  # type: ignore[no-any-return]
+
+    def decode(self, encoded: bytes) -> dict:
+        return self._msgpack.unpackb(encoded)  # type: ignore[no-any-return]
+
+
+JSON = JsonCodec()
+
+_KNOWN_CODECS: dict[str, type[Codec]] = {
+    JsonCodec.content_type: JsonCodec,
+    MsgpackCodec.content_type: MsgpackCodec,
+}
+
+
+def codec_for(content_type: str, preferred: Codec = JSON) -> Codec:
+    """Returns a codec decoding payloads stored with the given content type.
+
+    The preferred codec is used whenever its content type matches, so
+    payloads written before switching codecs are still decoded.
+    """
+    if content_type == preferred.content_type:
+        return preferred
+    return _known_codec(content_type)
+
+
+@functools.cache
+def _known_codec(content_type: str) -> Codec:
+    try:
+        return _KNOWN_CODECS[content_type]()
+    except KeyError:
+        raise UnknownContentType(content_type) from None
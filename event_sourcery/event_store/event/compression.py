@@ -0,0 +1,87 @@
+import base64
+import json
+import zlib
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, NonNegativeInt
+
+MARKER = "$compressed"
+PAYLOAD = "$payload"
+
+Algorithm = Literal["zlib", "zstd"]
+
+
+def _zstd() -> Any:
+    import zstandard  # noqa: PLC0415
+
+    return zstandard
+
+
+class Compression(BaseModel):
+    """Compresses event data estimated to be bigger than `threshold` bytes.
+
+    Compressed data is stored as `{"$compressed": algorithm, "$payload": base64}`,
+    so it is decompressed when read regardless of current configuration.
+    Zstandard requires `zstandard` to be installed.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    threshold: NonNegativeInt = 16 * 1024
+    algorithm: Algorithm = "zlib"
+    level: int = 6
+
+    def compress(self, data: dict) -> dict:
+        if _estimated_size(data, self.threshold) <= self.threshold:
+            return data
+
+        encoded = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        match self.algorithm:
+            case "zlib":
+                compressed = zlib.compress(encoded, self.level)
+            case "zstd":
+                compressed = _zstd().ZstdCompressor(level=self.level).compress(encoded)
+        return {
+            MARKER: self.algorithm,
+            PAYLOAD: base64.b64encode(compressed).decode("ascii"),
+        }
+
+
+def _estimated_size(data: dict, limit: int) -> int:
+    """Estimates size of data encoded as JSON, stops counting once past `limit`.
+
+    Counts characters of strings and a few bytes of other values, so data is
+    encoded only once, by the backend, when it's not compressed.
+    """
+    size = 0
+    values: list[Any] = [data]
+    while values and size <= limit:
+        value = values.pop()
+        if isinstance(value, str):
+            size += len(value) + 3
+        elif isinstance(value, dict):
+            size += 2
+            values.extend(value)
+            values.extend(value.values())
+        elif isinstance(value, list):
+            size += 2
+            values.extend(value)
+        else:
+            size += 8
+    return size
+
+
+def is_compressed(data: dict) -> bool:
+    return MARKER in data
+
+
+def decompress(data: dict) -> dict:
+    compressed = base64.b64decode(data[PAYLOAD])
+    match data[MARKER]:
+        case "zlib":
+            encoded = zlib.decompress(compressed)
+        case "zstd":
+            encoded = _zstd().ZstdDecompressor().decompress(compressed)
+        case algorithm:
+            raise ValueError(f"Unknown compression algorithm: {algorithm}")
+    return json.loads(encoded)  # type: ignore[no-any-return]
@@ -1,6 +1,7 @@
 import dataclasses
+from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Any, ClassVar, Generic, TypeAlias, TypeVar
+from typing import Any, ClassVar, Generic, TypeAlias, TypeVar, cast
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel
@@ -10,8 +11,8 @@ from event_sourcery.event_store.stream_id import StreamId
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT, TenantId
 
 
-@dataclasses.dataclass(frozen=True)
-class RawEvent(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class RawEvent:
     uuid: UUID
     stream_id: StreamId
     created_at: datetime
@@ -24,8 +25,8 @@ class RawEvent(BaseModel):
 Position: TypeAlias = int
 
 
-@dataclasses.dataclass(frozen=True)
-class RecordedRaw(BaseModel):
+@dataclasses.dataclass(frozen=True, slots=True)
+class RecordedRaw:
     entry: RawEvent
     position: Position
     tenant_id: TenantId = DEFAULT_TENANT
@@ -39,9 +40,13 @@ class Event(BaseModel, extra="forbid"):
     class OrderCancelled(Event):
         order_id: OrderId
     ```
+
+    When the schema of an event changes, bump its `__schema_version__` and
+    register an upcaster migrating stored data (see `EventRegistry.upcaster`).
     """
 
     __registry__: ClassVar = EventRegistry()
+    __schema_version__: ClassVar[int] = 1
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         cls.__registry__.add(cls)
@@ -55,7 +60,7 @@ class Context(BaseModel, extra="allow"):
     causation_id: UUID | None = None
 
 
-@dataclasses.dataclass()
+@dataclasses.dataclass(slots=True)
 class WrappedEvent(Generic[TEvent]):
     """Wrapper for events with all relevant metadata.
 
@@ -81,16 +86,104 @@ class WrappedEvent(Generic[TEvent]):
 
     @classmethod
     def wrap(cls, event: TEvent, version: int | None) -> "WrappedEvent[TEvent]":
-        return WrappedEvent[TEvent](event=event, version=version)
+        return WrappedEvent(event=event, version=version)
+
+    @property
+    def event_type(self) -> type[TEvent]:
+        return type(self.event)
 
 
-@dataclasses.dataclass(frozen=True)
+class LazyWrappedEvent(WrappedEvent[TEvent]):
+    """WrappedEvent validating its event and context on first access.
+
+    Metadata is available right away, so records can be routed by stream, position
+    or event type without paying for validation of events that are discarded.
+    Constructed like `WrappedEvent`, e.g. by `dataclasses.replace`, it wraps an
+    already decoded event.
+    """
+
+    __slots__ = ("_context", "_data", "_decode", "_event", "_event_type")
+    _context: Context | dict
+    _data: dict | None
+    _decode: Callable[[dict], TEvent]
+    _event: TEvent | None
+    _event_type: type[TEvent]
+
+    @classmethod
+    def decoding(
+        cls,
+        event_type: type[TEvent],
+        decode: Callable[[dict], TEvent],
+        data: dict,
+        version: int | None,
+        uuid: UUID,
+        created_at: datetime,
+        context: Context | dict,
+    ) -> "LazyWrappedEvent[TEvent]":
+        wrapped = cls.__new__(cls)
+        wrapped._event_type = event_type
+        wrapped._decode = decode
+        wrapped._data = data
+        wrapped._event = None
+        wrapped._context = context
+        wrapped.version = version
+        wrapped.uuid = uuid
+        wrapped.created_at = created_at
+        return wrapped
+
+    @property
+    def event(self) -> TEvent:
+        if self._data is not None:
+            self._event = self._decode(self._data)
+            self._data = None
+        return cast(TEvent, self._event)
+
+    @event.setter
+    def event(self, event: TEvent) -> None:
+        self._event = event
+        self._data = None
+
+    @property
+    def context(self) -> Context:
+        if isinstance(self._context, dict):
+            self._context = Context.model_validate(self._context)
+        return self._context
+
+    @context.setter
+    def context(self, context: Context) -> None:
+        self._context = context
+
+    @property
+    def event_type(self) -> type[TEvent]:
+        if self._data is None:
+            return type(self.event)
+        return self._event_type
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._data is None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WrappedEvent):
+            return NotImplemented
+        return (
+            self.event,
+            self.version,
+            self.uuid,
+            self.created_at,
+            self.context,
+        ) == (other.event, other.version, other.uuid, other.created_at, other.context)
+
+    __hash__ = WrappedEvent.__hash__
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Entry:
     wrapped_event: WrappedEvent
     stream_id: StreamId
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Recorded(Entry):
     position: Position
     tenant_id: TenantId = DEFAULT_TENANT
@@ -1,9 +1,13 @@
+import copy
 import inspect
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, TypeAlias
 
 from event_sourcery.event_store.exceptions import (
     ClassModuleUnavailable,
     DuplicatedEvent,
+    MissingUpcaster,
+    UnknownSchemaVersion,
 )
 
 if TYPE_CHECKING:
@@ -17,16 +21,37 @@ def event_name(cls: type) -> str:
     return f"{event_module.__name__}.{cls.__qualname__}"
 
 
+Upcaster: TypeAlias = Callable[[dict], dict]
+
+
+def _chain(upcasters: list[Upcaster]) -> Upcaster:
+    def upcast(data: dict) -> dict:
+        data = copy.deepcopy(data)
+        for upcaster in upcasters:
+            data = upcaster(data)
+        return data
+
+    return upcast
+
+
 class EventRegistry:
     """Keeps mappings between event types and their names.
 
     Normally, there is no need to use it directly. If one needs to have multiple
     registries or wants more granular control, they can pass an instance
-    of EventRegistry to BackendFactory."""
+    of EventRegistry to BackendFactory.
+
+    Registry also keeps schema versions of events, taken from their
+    `__schema_version__` attribute, and upcasters migrating data of older
+    versions. Upcasters are composed into chains, cached per name and version.
+    """
 
     def __init__(self) -> None:
         self._types_to_names: dict[type[Event], str] = {}
         self._names_to_types: dict[str, type[Event]] = {}
+        self._schema_versions: dict[type[Event], int] = {}
+        self._upcasters: dict[tuple[type[Event], int], Upcaster] = {}
+        self._chains: dict[tuple[str, int], Upcaster | None] = {}
 
     def add(self, event: type["Event"]) -> type["Event"]:
         """Add event subclass to the registry."""
@@ -39,8 +64,63 @@ class EventRegistry:
 
         self._types_to_names[event] = name
         self._names_to_types[name] = event
+        self._schema_versions[event] = getattr(event, "__schema_version__", 1)
         return event  # for use as a decorator
 
+    def upcaster(
+        self,
+        event: type["Event"],
+        version: int,
+    ) -> Callable[[Upcaster], Upcaster]:
+        """Register function migrating data of `event` from `version` to the next one.
+
+        Example usage:
+        ```
+        @registry.upcaster(OrderPlaced, version=1)
+        def add_currency(data: dict) -> dict:
+            return {**data, "currency": "USD"}
+        ```
+        """
+
+        def register(upcaster: Upcaster) -> Upcaster:
+            self._upcasters[event, version] = upcaster
+            self._chains.clear()
+            return upcaster
+
+        return register
+
+    def schema_version_for_type(self, event: type["Event"]) -> int:
+        return self._schema_versions[event]
+
+    def upcaster_for(self, name: str, version: int) -> Upcaster | None:
+        """Returns a chain of upcasters migrating data to the current version.
+
+        Returns None if data of given version does not need migration.
+        """
+        try:
+            return self._chains[name, version]
+        except KeyError:
+            chain = self._chains[name, version] = self._compose(name, version)
+            return chain
+
+    def _compose(self, name: str, version: int) -> Upcaster | None:
+        event = self._names_to_types[name]
+        current = self._schema_versions[event]
+        if version == current:
+            return None
+        if version > current:
+            raise UnknownSchemaVersion(f"{name} has no schema version {version}")
+
+        try:
+            upcasters = [
+                self._upcasters[event, step] for step in range(version, current)
+            ]
+        except KeyError as error:
+            raise MissingUpcaster(
+                f"{name} has no upcaster from version {error.args[0][1]}"
+            ) from None
+        return _chain(upcasters)
+
     def type_for_name(self, name: str) -> type["Event"]:
         return self._names_to_types[name]
 
@@ -1,62 +1,181 @@
-import dataclasses
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
-from typing import cast
+from functools import cache, partial
+from types import UnionType
+from typing import TypeAlias, Union, cast, get_args, get_origin
 
+from pydantic import BaseModel
+
+from event_sourcery.event_store.event.compression import (
+    Compression,
+    decompress,
+    is_compressed,
+)
 from event_sourcery.event_store.event.dto import (
     Context,
     Event,
+    LazyWrappedEvent,
     RawEvent,
     Recorded,
     RecordedRaw,
     WrappedEvent,
 )
-from event_sourcery.event_store.event.registry import EventRegistry
+from event_sourcery.event_store.event.registry import EventRegistry, Upcaster
 from event_sourcery.event_store.stream_id import StreamId
 
+SCHEMA_VERSION = "$schema_version"
+
+JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+Constructor: TypeAlias = Callable[[dict], BaseModel]
+
+
+def _is_constructible(model: type[BaseModel]) -> bool:
+    decorators = model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return False
+    if model.model_config.get("extra") == "allow" or model.__private_attributes__:
+        return False
+
+    for field in model.model_fields.values():
+        if field.alias is not None or field.default_factory is not None:
+            return False
+        if get_origin(field.annotation) in (Union, UnionType):
+            annotation_types = set(get_args(field.annotation))
+        else:
+            annotation_types = {field.annotation}
+        if not annotation_types <= JSON_SCALARS:
+            return False
+    return True
+
+
+def _constructor(model: type[BaseModel]) -> Constructor:
+    """Does what `model_construct` does, with defaults computed upfront."""
+    defaults = {
+        name: field.default
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+    def construct(data: dict) -> BaseModel:
+        instance = model.__new__(model)
+        object.__setattr__(instance, "__dict__", {**defaults, **data})
+        object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+@cache
+def _compile(event_type: type[BaseModel], trusted: bool) -> Constructor:
+    if trusted and _is_constructible(event_type):
+        return _constructor(event_type)
+    return event_type.model_validate
+
+
+def _decode(
+    construct: Constructor,
+    upcast: Upcaster | None,
+    data: dict,
+) -> BaseModel:
+    if is_compressed(data):
+        data = decompress(data)
+    if upcast is not None:
+        data = upcast(data)
+    return construct(data)
+
 
 @dataclass(repr=False, frozen=True)
 class Serde:
+    """Translates between `WrappedEvent` and `RawEvent`.
+
+    Constructors for each event type are compiled once and cached. In trusted
+    mode, events having only JSON scalar fields are constructed without
+    validation. Use it only for data written by Serde itself.
+
+    With `compression` given, big payloads are compressed when serialized.
+    Compressed payloads are always decompressed when deserialized.
+
+    Schema version of events other than the first one is stored in context.
+    Data of older versions is migrated with upcasters from the registry.
+    """
+
     registry: EventRegistry
+    trusted: bool = False
+    compression: Compression | None = None
 
     def deserialize(self, event: RawEvent) -> WrappedEvent:
-        event_as_dict = dataclasses.asdict(event)
-        del event_as_dict["stream_id"]
-        del event_as_dict["name"]
-        data = cast(Mapping, event_as_dict.pop("data"))
-        context = event_as_dict.pop("context", {})
-        event_as_dict["context"] = Context(**context)
         event_type = self.registry.type_for_name(event.name)
-        return WrappedEvent[event_type](  # type: ignore[valid-type]
-            **event_as_dict,
-            event=event_type(**data),
+        construct = _compile(event_type, self.trusted)
+        context, upcast = self._read_context(event)
+        return WrappedEvent(
+            event=_decode(construct, upcast, event.data),
+            version=event.version,
+            uuid=event.uuid,
+            created_at=event.created_at,
+            context=Context.model_validate(context),
         )
 
     def deserialize_many(self, events: Sequence[RawEvent]) -> list[WrappedEvent]:
         return [self.deserialize(event) for event in events]
 
     def deserialize_record(self, record: RecordedRaw) -> Recorded:
+        """Deserializes a record with the event and context validated on access."""
+        entry = record.entry
+        event_type = self.registry.type_for_name(entry.name)
+        construct = _compile(event_type, self.trusted)
+        context, upcast = self._read_context(entry)
+        decode = (
+            construct
+            if upcast is None and not is_compressed(entry.data)
+            else partial(_decode, construct, upcast)
+        )
         return Recorded(
-            wrapped_event=self.deserialize(record.entry),
+            wrapped_event=LazyWrappedEvent.decoding(
+                event_type,
+                decode,
+                entry.data,
+                version=entry.version,
+                uuid=entry.uuid,
+                created_at=entry.created_at,
+                context=context,
+            ),
             stream_id=record.entry.stream_id,
             position=record.position,
             tenant_id=record.tenant_id,
         )
 
+    def _read_context(self, event: RawEvent) -> tuple[dict, Upcaster | None]:
+        context, schema_version = event.context, 1
+        if SCHEMA_VERSION in context:
+            context = context.copy()
+            schema_version = context.pop(SCHEMA_VERSION)
+        upcast = self.registry.upcaster_for(event.name, schema_version)
+        return context, upcast
+
     def serialize(
         self,
         event: WrappedEvent,
         stream_id: StreamId,
     ) -> RawEvent:
         model = cast(Event, event.event)
+        data = model.model_dump(mode="json")
+        if self.compression is not None:
+            data = self.compression.compress(data)
+        context = event.context.model_dump(mode="json")
+        schema_version = self.registry.schema_version_for_type(type(model))
+        if schema_version != 1:
+            context[SCHEMA_VERSION] = schema_version
         return RawEvent(
             uuid=event.uuid,
             stream_id=stream_id,
             created_at=event.created_at,
             version=event.version,
-            name=self.registry.name_for_type(type(event.event)),
-            data=model.model_dump(mode="json"),
-            context=event.context.model_dump(mode="json"),
+            name=self.registry.name_for_type(type(model)),
+            data=data,
+            context=context,
         )
 
     def serialize_many(
@@ -1,14 +1,18 @@
-from collections.abc import Sequence
-from functools import singledispatchmethod
-from typing import cast
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping, Sequence
+from functools import singledispatch, singledispatchmethod
+from typing import TypeAlias, cast
 
 from event_sourcery.event_store.event import (
     Event,
     Position,
+    RawEvent,
     Serde,
     WrappedEvent,
 )
-from event_sourcery.event_store.interfaces import StorageStrategy
+from event_sourcery.event_store.interfaces import (
+    AsyncStorageStrategy,
+    StorageStrategy,
+)
 from event_sourcery.event_store.stream_id import StreamId
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT, TenantId
 from event_sourcery.event_store.versioning import (
@@ -18,6 +22,66 @@ from event_sourcery.event_store.versioning import (
 )
 
 
+@singledispatch
+def _wrap_events(
+    expected_version: int | Versioning,
+    events: Sequence[Event],
+) -> Sequence[WrappedEvent]:
+    start = cast(int, expected_version) + 1
+    return [
+        WrappedEvent.wrap(event=event, version=version)
+        for version, event in enumerate(events, start=start)
+    ]
+
+
+@_wrap_events.register
+def _wrap_events_versioning(
+    expected_version: Versioning, events: Sequence[Event]
+) -> Sequence[WrappedEvent]:
+    return [WrappedEvent.wrap(event=event, version=None) for event in events]
+
+
+DEFAULT_PAGE_SIZE = 1000
+
+StreamsToAppend: TypeAlias = Mapping[
+    StreamId,
+    tuple[Sequence[WrappedEvent] | Sequence[Event], int | Versioning],
+]
+
+
+def _versioning(
+    expected_version: int | Versioning,
+    new_version: int | None,
+) -> Versioning:
+    if expected_version is NO_VERSIONING:
+        return NO_VERSIONING
+    return ExplicitVersioning(
+        expected_version=cast(int, expected_version),
+        initial_version=cast(int, new_version),
+    )
+
+
+def _serialize_streams(
+    serde: Serde,
+    streams: StreamsToAppend,
+) -> dict[StreamId, tuple[Versioning, list[RawEvent]]]:
+    serialized = {}
+    for stream_id, (events, expected_version) in streams.items():
+        if not events:
+            continue
+        wrapped = cast(
+            Sequence[WrappedEvent],
+            events
+            if isinstance(events[0], WrappedEvent)
+            else _wrap_events(expected_version, cast(Sequence[Event], events)),
+        )
+        serialized[stream_id] = (
+            _versioning(expected_version, wrapped[-1].version),
+            serde.serialize_many(wrapped, stream_id),
+        )
+    return serialized
+
+
 class EventStore:
     """API for working with events."""
 
@@ -52,6 +116,55 @@ class EventStore:
         events = self._storage_strategy.fetch_events(stream_id, start=start, stop=stop)
         return self._serde.deserialize_many(events)
 
+    def iter_stream(
+        self,
+        stream_id: StreamId,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[WrappedEvent]:
+        """Iterates over events from a given stream.
+
+        Yields the same events as `load_stream`, but fetches them page by page,
+        so only one page is kept in memory regardless of the stream length.
+
+        Examples:
+            >>> for event in event_store.iter_stream(StreamId(name="long_stream")):
+            ...     aggregate.apply(event)
+
+        Args:
+            stream_id: The stream identifier to iterate over.
+            page_size: Maximal number of events fetched at once.
+
+        Returns:
+            An iterator over events, empty if the stream doesn't exist.
+        """
+        for page in self._storage_strategy.fetch_pages(stream_id, page_size):
+            yield from self._serde.deserialize_many(page)
+
+    def load_streams(
+        self, stream_ids: Iterable[StreamId]
+    ) -> dict[StreamId, Sequence[WrappedEvent]]:
+        """Loads events from many streams at once.
+
+        SQL backends fetch latest snapshots and newer events for streams in batches,
+        so the number of queries doesn't grow with the number of streams.
+
+        Examples:
+            >>> event_store.load_streams([StreamId(name="existing"), StreamId()])
+            {StreamId(name="existing"): [WrappedEvent(...)], StreamId(): []}
+
+        Args:
+            stream_ids: The stream identifiers to load events from.
+
+        Returns:
+            A mapping of stream identifiers to their events. Streams that don't
+            exist are mapped to empty lists.
+        """
+        fetched = self._storage_strategy.fetch_events_many(list(stream_ids))
+        return {
+            stream_id: self._serde.deserialize_many(events)
+            for stream_id, events in fetched.items()
+        }
+
     @singledispatchmethod
     def append(
         self,
@@ -93,52 +206,48 @@ class EventStore:
         stream_id: StreamId,
         expected_version: int | Versioning = 0,
     ) -> None:
-        wrapped_events = self._wrap_events(expected_version, events)
+        wrapped_events = _wrap_events(expected_version, events)
         self.append(
             *wrapped_events,
             stream_id=stream_id,
             expected_version=expected_version,
         )
 
-    @singledispatchmethod
-    def _wrap_events(
-        self,
-        expected_version: int,
-        events: Sequence[Event],
-    ) -> Sequence[WrappedEvent]:
-        return [
-            WrappedEvent.wrap(event=event, version=version)
-            for version, event in enumerate(events, start=expected_version + 1)
-        ]
-
-    @_wrap_events.register
-    def _wrap_events_versioning(
-        self, expected_version: Versioning, events: Sequence[Event]
-    ) -> Sequence[WrappedEvent]:
-        return [WrappedEvent.wrap(event=event, version=None) for event in events]
-
     def _append(
         self,
         stream_id: StreamId,
         events: Sequence[WrappedEvent],
         expected_version: int | Versioning,
     ) -> None:
-        new_version = events[-1].version
-        versioning: Versioning
-        if expected_version is not NO_VERSIONING:
-            versioning = ExplicitVersioning(
-                expected_version=cast(int, expected_version),
-                initial_version=cast(int, new_version),
-            )
-        else:
-            versioning = NO_VERSIONING
-
         self._storage_strategy.insert_events(
             stream_id=stream_id,
-            versioning=versioning,
+            versioning=_versioning(expected_version, events[-1].version),
             events=self._serde.serialize_many(events, stream_id),
         )
 
+    def append_many(self, streams: StreamsToAppend) -> None:
+        """Appends events to many streams at once.
+
+        Expected versions of all streams are checked before anything is written,
+        so either all streams are appended or none. SQL backends do it with a
+        constant number of queries regardless of the number of streams.
+
+        Examples:
+            >>> event_store.append_many({
+            ...     StreamId(): ([WrappedEvent(...)], 0),
+            ...     StreamId(name="existing"): ([Event(...)], 3),
+            ... })
+            None
+
+        Args:
+            streams: Events (WrappedEvent or Event) with the expected version
+                for each of the stream identifiers to append to.
+
+        Returns:
+            None
+        """
+        self._storage_strategy.insert_many(_serialize_streams(self._serde, streams))
+
     def delete_stream(self, stream_id: StreamId) -> None:
         """Deletes a stream with a given ID.
 
@@ -191,6 +300,16 @@ class EventStore:
         """
         return self._storage_strategy.current_position
 
+    @property
+    def tenant_position(self) -> Position | None:
+        """Returns the position of the last event of the tenant store is scoped to.
+
+        Examples:
+            >>> event_store.scoped_for_tenant("tenant_1").tenant_position
+            Position(12)
+        """
+        return self._storage_strategy.current_tenant_position
+
     def scoped_for_tenant(self, tenant_id: TenantId = DEFAULT_TENANT) -> "EventStore":
         """Factory method to create a new event store instance scoped to a tenant.
 
@@ -208,3 +327,194 @@ class EventStore:
             storage_strategy=self._storage_strategy.scoped_for_tenant(tenant_id),
             serde=self._serde,
         )
+
+
+class AsyncEventStore:
+    """Asyncio API for working with events.
+
+    Mirrors `EventStore`, but every call to the storage is awaited, so loading
+    and appending streams does not block the event loop.
+    """
+
+    def __init__(self, storage_strategy: AsyncStorageStrategy, serde: Serde) -> None:
+        self._storage_strategy = storage_strategy
+        self._serde = serde
+
+    async def load_stream(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> Sequence[WrappedEvent]:
+        """Loads events from a given stream.
+
+        Examples:
+            >>> await event_store.load_stream(stream_id=StreamId(name="existing_stream"))
+            [WrappedEvent(..., version=1), ..., WrappedEvent(..., version=3)]
+
+        Args:
+            stream_id: The stream identifier to load events from.
+            start: The stream version to start loading from (including).
+            stop: The stream version to stop loading at (excluding).
+
+        Returns:
+            A sequence of events or empty list if the stream doesn't exist.
+        """
+        events = await self._storage_strategy.fetch_events(
+            stream_id, start=start, stop=stop
+        )
+        return self._serde.deserialize_many(events)
+
+    async def iter_stream(
+        self,
+        stream_id: StreamId,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[WrappedEvent]:
+        """Iterates over events from a given stream page by page.
+
+        Args:
+            stream_id: The stream identifier to iterate over.
+            page_size: Maximal number of events fetched at once.
+
+        Returns:
+            An async iterator over events, empty if the stream doesn't exist.
+        """
+        async for page in self._storage_strategy.fetch_pages(stream_id, page_size):
+            for event in self._serde.deserialize_many(page):
+                yield event
+
+    async def load_streams(
+        self, stream_ids: Iterable[StreamId]
+    ) -> dict[StreamId, Sequence[WrappedEvent]]:
+        """Loads events from many streams at once.
+
+        Args:
+            stream_ids: The stream identifiers to load events from.
+
+        Returns:
+            A mapping of stream identifiers to their events. Streams that don't
+            exist are mapped to empty lists.
+        """
+        fetched = await self._storage_strategy.fetch_events_many(list(stream_ids))
+        return {
+            stream_id: self._serde.deserialize_many(events)
+            for stream_id, events in fetched.items()
+        }
+
+    @singledispatchmethod
+    async def append(
+        self,
+        first: WrappedEvent,
+        *events: WrappedEvent,
+        stream_id: StreamId,
+        expected_version: int | Versioning = 0,
+    ) -> None:
+        """Appends events to a stream with a given ID.
+
+        Examples:
+            >>> await event_store.append(WrappedEvent(...), stream_id=StreamId())
+            None
+
+        Args:
+            first: The first event to append (WrappedEvent or Event).
+            *events: The rest of the events to append (same type as first argument).
+            stream_id: The stream identifier to append events to.
+            expected_version: The expected version of the stream
+
+        Returns:
+            None
+        """
+        all_events = (first, *events)
+        await self._storage_strategy.insert_events(
+            stream_id=stream_id,
+            versioning=_versioning(expected_version, all_events[-1].version),
+            events=self._serde.serialize_many(all_events, stream_id),
+        )
+
+    @append.register
+    async def _append_events(
+        self,
+        *events: Event,
+        stream_id: StreamId,
+        expected_version: int | Versioning = 0,
+    ) -> None:
+        wrapped_events = _wrap_events(expected_version, events)
+        await self.append(
+            *wrapped_events,
+            stream_id=stream_id,
+            expected_version=expected_version,
+        )
+
+    async def append_many(self, streams: StreamsToAppend) -> None:
+        """Appends events to many streams at once.
+
+        Args:
+            streams: Events (WrappedEvent or Event) with the expected version
+                for each of the stream identifiers to append to.
+
+        Returns:
+            None
+        """
+        await self._storage_strategy.insert_many(
+            _serialize_streams(self._serde, streams)
+        )
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        """Deletes a stream with a given ID.
+
+        If a stream does not exist, this method does nothing.
+
+        Args:
+            stream_id: The stream identifier to delete.
+
+        Returns:
+            None
+        """
+        await self._storage_strategy.delete_stream(stream_id)
+
+    async def save_snapshot(self, stream_id: StreamId, snapshot: WrappedEvent) -> None:
+        """Saves a snapshot of the stream.
+
+        Args:
+            stream_id: The stream identifier to save the snapshot.
+            snapshot: The snapshot to save.
+
+        Returns:
+            None
+        """
+        serialized = self._serde.serialize(event=snapshot, stream_id=stream_id)
+        await self._storage_strategy.save_snapshot(serialized)
+
+    async def position(self) -> Position | None:
+        """Returns the current position of the event store.
+
+        Examples:
+            >>> await event_store.position()
+            Position(15)
+        """
+        return await self._storage_strategy.current_position()
+
+    async def tenant_position(self) -> Position | None:
+        """Returns the position of the last event of the tenant store is scoped to.
+
+        Examples:
+            >>> await event_store.scoped_for_tenant("tenant_1").tenant_position()
+            Position(12)
+        """
+        return await self._storage_strategy.current_tenant_position()
+
+    def scoped_for_tenant(
+        self, tenant_id: TenantId = DEFAULT_TENANT
+    ) -> "AsyncEventStore":
+        """Factory method to create a new event store instance scoped to a tenant.
+
+        Args:
+            tenant_id: The tenant identifier to work with.
+
+        Returns:
+            An event store instance scoped to the tenant.
+        """
+        return AsyncEventStore(
+            storage_strategy=self._storage_strategy.scoped_for_tenant(tenant_id),
+            serde=self._serde,
+        )
@@ -47,3 +47,15 @@ class ClassModuleUnavailable(Exception):
 
 class DuplicatedEvent(Exception):
     pass
+
+
+class UnknownSchemaVersion(Exception):
+    pass
+
+
+class MissingUpcaster(Exception):
+    pass
+
+
+class UnknownContentType(Exception):
+    pass
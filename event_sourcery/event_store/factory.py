@@ -7,7 +7,7 @@ from typing_extensions import Self
 from event_sourcery.event_store import subscription
 from event_sourcery.event_store.dispatcher import Dispatcher
 from event_sourcery.event_store.event import EventRegistry, RawEvent, RecordedRaw, Serde
-from event_sourcery.event_store.event_store import EventStore
+from event_sourcery.event_store.event_store import AsyncEventStore, EventStore
 from event_sourcery.event_store.interfaces import (
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
@@ -37,6 +37,13 @@ class TransactionalBackend(Backend):
     in_transaction: Dispatcher
 
 
+class AsyncBackend:
+    serde: Serde
+    event_store: AsyncEventStore
+    in_transaction: Dispatcher
+    subscriber: subscription.PositionPhase
+
+
 class BackendFactory(abc.ABC):
     """Abstract base class to configure EventStore."""
 
@@ -0,0 +1,160 @@
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Protocol
+
+from event_sourcery.event_store.event import Position, RecordedRaw
+from event_sourcery.event_store.polling import PollingPolicy, Wakeups
+
+
+@dataclass(frozen=True)
+class Horizon:
+    """Ids up to `position` are settled once all of `writers` have finished.
+
+    Settled ids are either visible, or will never be, as they come from
+    rolled back transactions or removed streams.
+    """
+
+    position: Position
+    writers: tuple[int, ...] = ()
+
+
+class Visibility:
+    """Tells which gaps between ids of visible events may still get filled.
+
+    Without any knowledge of the database nothing is known to be settled, so
+    gaps are awaited up to the timelimit of a subscription. Backends query
+    their databases for horizons in subclasses.
+    """
+
+    def horizon(self) -> Horizon | None:
+        return None
+
+    def is_settled(self, horizon: Horizon) -> bool:
+        return not horizon.writers
+
+
+class GetBatch(Protocol):
+    def __call__(self, position: Position) -> list[RecordedRaw]: ...
+
+
+class GapDetection:
+    """Releases batches of events once gaps between their ids are settled.
+
+    The horizon is refreshed only when a batch reaches past it, so idle
+    subscriptions don't query for it. Events up to a settled horizon are
+    released at once, even if they don't fill the batch.
+    """
+
+    def __init__(
+        self,
+        get_batch: GetBatch,
+        polling: PollingPolicy,
+        visibility: Visibility,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+    ) -> None:
+        self._get_batch = get_batch
+        self._polling = polling
+        self._backoff = polling.backoff()
+        self._caught_up = False
+        self._visibility = visibility
+        self._horizon: Horizon | None = Horizon(position=start_from)
+        self._settled = True
+        self._position = start_from
+        self._batch_size = batch_size
+        self._timelimit = timelimit
+
+    def _poll(self) -> tuple[list[RecordedRaw], list[RecordedRaw]]:
+        """Gets the next batch, along with its part which is ready for release.
+
+        Settlement of the horizon is checked before the batch is read, so
+        events of writers which have ended are visible in it.
+        """
+        if self._horizon is not None and not self._settled:
+            self._settled = self._visibility.is_settled(self._horizon)
+        batch = self._get_batch(self._position)
+        ready = self._ready_part(batch)
+        if not ready and self._is_past_horizon(batch):
+            self._horizon = self._visibility.horizon()
+            self._settled = self._horizon is not None and not self._horizon.writers
+            batch = self._get_batch(self._position)
+            ready = self._ready_part(batch)
+        return batch, ready
+
+    def _ready_part(self, batch: list[RecordedRaw]) -> list[RecordedRaw]:
+        if len(batch) == self._batch_size and self._is_continuous(batch):
+            return batch
+        if self._horizon is None or not self._settled:
+            return []
+        return [record for record in batch if record.position <= self._horizon.position]
+
+    def _is_past_horizon(self, batch: list[RecordedRaw]) -> bool:
+        return (
+            self._horizon is not None
+            and len(batch) > 0
+            and batch[-1].position > self._horizon.position
+        )
+
+    def _release(self, batch: list[RecordedRaw]) -> list[RecordedRaw]:
+        self._caught_up = len(batch) < self._batch_size
+        if batch:
+            self._position = batch[-1].position
+        return batch
+
+    @staticmethod
+    def _is_continuous(batch: list[RecordedRaw]) -> bool:
+        if len(batch) < 2:
+            return False
+
+        return batch[-1].position - batch[0].position + 1 == len(batch)
+
+
+class GapDetectingIterator(GapDetection, Iterator[list[RecordedRaw]]):
+    """Polls for batches until they are released or the timelimit passes.
+
+    Sleeps between polls with `wakeups`, which may end them on new events.
+    """
+
+    def __init__(
+        self,
+        get_batch: GetBatch,
+        polling: PollingPolicy,
+        visibility: Visibility,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        wakeups: Wakeups | None = None,
+    ) -> None:
+        super().__init__(
+            get_batch=get_batch,
+            polling=polling,
+            visibility=visibility,
+            start_from=start_from,
+            batch_size=batch_size,
+            timelimit=timelimit,
+        )
+        self._wakeups = wakeups or Wakeups()
+
+    def __next__(self) -> list[RecordedRaw]:
+        deadline = time.monotonic() + self._timelimit.total_seconds()
+        if self._caught_up:
+            self._polling.throttle()
+        received = 0
+        while True:
+            generation = self._wakeups.generation
+            batch, ready = self._poll()
+            if len(batch) > received:
+                received = len(batch)
+                self._backoff.reset()
+            remaining = deadline - time.monotonic()
+            if ready:
+                return self._release(ready)
+            elif remaining <= 0:
+                return self._release(batch)
+            else:
+                delay = min(self._backoff.next_delay(), remaining)
+                self._wakeups.wait(generation, delay)
+                self._polling.throttle()
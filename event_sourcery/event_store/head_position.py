@@ -0,0 +1,70 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from event_sourcery.event_store.event import Position
+from event_sourcery.event_store.tenant_id import TenantId
+
+ALL_TENANTS = None
+
+
+@dataclass(repr=False)
+class HeadPosition:
+    """Caches positions of the last events, of all tenants and of each tenant.
+
+    Backends share one per database. Cached positions are fetched again after
+    `ttl`. Strategies advance them once inserting transactions commit, so a
+    process sees its own events without waiting for that, and rolled back
+    events never get cached.
+    """
+
+    ttl: timedelta
+    _positions: dict[TenantId | None, tuple[Position | None, float]] = field(
+        default_factory=dict, init=False
+    )
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+
+    def get(
+        self,
+        tenant_id: TenantId | None,
+        fetch: Callable[[], Position | None],
+    ) -> Position | None:
+        cached = self._positions.get(tenant_id)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self.ttl.total_seconds():
+            return cached[0]
+        position = fetch()
+        self._positions[tenant_id] = (position, now)
+        return position
+
+    def advance(self, tenant_id: TenantId, position: Position) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for key in (ALL_TENANTS, tenant_id):
+                cached, _ = self._positions.get(key, (None, now))
+                self._positions[key] = (max(position, cached or 0), now)
+
+    def advancing(self, tenant_id: TenantId, position: Position) -> "Advance":
+        """Callback advancing the position, to run after the insert commits."""
+        return Advance(self, tenant_id, position)
+
+
+@dataclass(frozen=True, repr=False)
+class Advance:
+    head: HeadPosition
+    tenant_id: TenantId
+    position: Position
+
+    def __call__(self) -> None:
+        self.head.advance(self.tenant_id, self.position)
+
+
+def has_uncommitted_events(pending_callbacks: Iterable[Callable[[], None]]) -> bool:
+    """Tells if the transaction with given callbacks pending inserted events.
+
+    Its own events are not committed yet, so it has to read positions past
+    the cache, while caching them would show them to other transactions.
+    """
+    return any(isinstance(callback, Advance) for callback in pending_callbacks)
@@ -1,36 +1,55 @@
+import asyncio
 import time
-from collections.abc import Generator, Iterator
+from asyncio import AbstractEventLoop
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import AsyncIterator, Generator, Iterator, Mapping, Sequence
+from concurrent.futures import Executor
 from contextlib import AbstractContextManager, contextmanager
 from copy import copy
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from operator import getitem
+from threading import Condition
 
 from pydantic import BaseModel, ConfigDict, PositiveInt
 from typing_extensions import Self
 
 from event_sourcery.event_store import (
+    AsyncEventStore,
     Dispatcher,
     Event,
     EventRegistry,
     EventStore,
+    PostCommitDispatcher,
     subscription,
 )
-from event_sourcery.event_store.event import Position, RawEvent, RecordedRaw, Serde
+from event_sourcery.event_store.event import (
+    Compression,
+    Position,
+    RawEvent,
+    RecordedRaw,
+    Serde,
+)
 from event_sourcery.event_store.exceptions import ConcurrentStreamWriteError
 from event_sourcery.event_store.factory import (
+    AsyncBackend,
     BackendFactory,
     NoOutboxStorageStrategy,
     TransactionalBackend,
     no_filter,
 )
 from event_sourcery.event_store.interfaces import (
+    AsyncStorageStrategy,
+    AsyncSubscriptionStrategy,
+    CheckpointStorageStrategy,
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
     StorageStrategy,
     SubscriptionStrategy,
 )
 from event_sourcery.event_store.outbox import Outbox
+from event_sourcery.event_store.partition import Partition
 from event_sourcery.event_store.stream_id import StreamId
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT, TenantId
 from event_sourcery.event_store.versioning import NO_VERSIONING, Versioning
@@ -41,11 +60,33 @@ class Storage:
     records: list[RecordedRaw] = field(default_factory=list, init=False)
     _data: dict[StreamId, list[RecordedRaw]] = field(default_factory=dict, init=False)
     _versions: dict[StreamId, int | None] = field(default_factory=dict, init=False)
+    _tenant_positions: dict[TenantId, int] = field(default_factory=dict, init=False)
+    _appended: Condition = field(default_factory=Condition, init=False)
+    _async_waiters: set[tuple[AbstractEventLoop, asyncio.Event]] = field(
+        default_factory=set, init=False
+    )
+    _category_offsets: dict[str | None, list[int]] = field(
+        default_factory=lambda: defaultdict(list), init=False
+    )
+    _name_offsets: dict[str, list[int]] = field(
+        default_factory=lambda: defaultdict(list), init=False
+    )
 
     @property
     def current_position(self) -> int | None:
         return self.records[-1].position if self.records else None
 
+    def tenant_position(self, tenant_id: TenantId) -> int | None:
+        return self._tenant_positions.get(tenant_id)
+
+    def category_offsets(self, category: str | None) -> list[int]:
+        """Sorted offsets in `records` of records in streams of the category."""
+        return self._category_offsets.get(category, [])
+
+    def name_offsets(self, name: str) -> list[int]:
+        """Sorted offsets in `records` of records of the event name."""
+        return self._name_offsets.get(name, [])
+
     def __contains__(self, stream_id: object) -> bool:
         return stream_id in self._data
 
@@ -57,11 +98,45 @@ class Storage:
             self._versions[stream_id] = 0
 
     def append(self, records: list[RecordedRaw]) -> None:
-        self.records.extend(records)
-        for record in records:
-            stream_id = record.entry.stream_id
-            self._data[stream_id].append(record)
-            self._versions[stream_id] = record.entry.version
+        with self._appended:
+            # Offsets are indexed before records are visible, so subscriptions
+            # never find a record which is missing from the indexes.
+            for offset, record in enumerate(records, start=len(self.records)):
+                self._category_offsets[record.entry.stream_id.category].append(offset)
+                self._name_offsets[record.entry.name].append(offset)
+            self.records.extend(records)
+            for record in records:
+                stream_id = record.entry.stream_id
+                self._data[stream_id].append(record)
+                self._versions[stream_id] = record.entry.version
+                self._tenant_positions[record.tenant_id] = record.position
+            self._appended.notify_all()
+            for loop, appended in self._async_waiters:
+                loop.call_soon_threadsafe(appended.set)
+
+    def wait_for_records(self, after: int, timeout: float) -> bool:
+        """Blocks until records past `after` position are appended or timeout."""
+        with self._appended:
+            return self._appended.wait_for(
+                lambda: (self.current_position or 0) > after, timeout
+            )
+
+    async def wait_for_records_async(self, after: int, timeout: float) -> bool:
+        """Awaits records past `after` position, without blocking the loop."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._appended:
+            if (self.current_position or 0) > after:
+                return True
+            self._async_waiters.add(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        else:
+            return True
+        finally:
+            with self._appended:
+                self._async_waiters.discard(waiter)
 
     def replace(self, with_snapshot: RecordedRaw) -> None:
         stream_id = with_snapshot.entry.stream_id
@@ -79,11 +154,15 @@ class Storage:
 
 
 @dataclass
-class InMemorySubscription(Iterator[list[RecordedRaw]]):
+class InMemorySubscription(
+    Iterator[list[RecordedRaw]],
+    AsyncIterator[list[RecordedRaw]],
+):
     _storage: Storage
     _current_position: int
     _batch_size: int
     _timelimit: timedelta
+    _partition: Partition | None
 
     def _pop_record(self) -> RecordedRaw | None:
         if (self._storage.current_position or 0) <= self._current_position:
@@ -92,19 +171,55 @@ class InMemorySubscription(Iterator[list[RecordedRaw]]):
         self._current_position += 1
         return record
 
+    def _pop_indexed(self, *indexes: list[int]) -> RecordedRaw | None:
+        end = len(self._storage.records)
+        found = end
+        for offsets in indexes:
+            index = bisect_left(offsets, self._current_position)
+            if index < len(offsets):
+                found = min(found, offsets[index])
+        if found >= end:
+            self._current_position = end
+            return None
+        self._current_position = found + 1
+        return self._storage.records[found]
+
     def __next__(self) -> list[RecordedRaw]:
         batch: list[RecordedRaw] = []
 
-        start = time.monotonic()
+        deadline = time.monotonic() + self._timelimit.total_seconds()
+        while True:
+            self._fill(batch)
+            remaining = deadline - time.monotonic()
+            if len(batch) == self._batch_size or remaining <= 0:
+                return batch
+            self._storage.wait_for_records(self._current_position, remaining)
+
+    async def __anext__(self) -> list[RecordedRaw]:
+        batch: list[RecordedRaw] = []
+
+        deadline = time.monotonic() + self._timelimit.total_seconds()
+        while True:
+            self._fill(batch)
+            remaining = deadline - time.monotonic()
+            if len(batch) == self._batch_size or remaining <= 0:
+                return batch
+            await self._storage.wait_for_records_async(
+                self._current_position, remaining
+            )
+
+    def _fill(self, batch: list[RecordedRaw]) -> None:
         while len(batch) < self._batch_size:
             record = self._pop_record()
-            if record is not None:
+            if record is None:
+                return
+            if self._in_partition(record):
                 batch.append(record)
-            time.sleep(0.1)
-            if time.monotonic() - start > self._timelimit.total_seconds():
-                break
 
-        return batch
+    def _in_partition(self, record: RecordedRaw) -> bool:
+        if self._partition is None:
+            return True
+        return self._partition.contains(record.entry.stream_id)
 
 
 @dataclass
@@ -112,13 +227,7 @@ class InMemoryToCategorySubscription(InMemorySubscription):
     _category: str
 
     def _pop_record(self) -> RecordedRaw | None:
-        while True:
-            record = super()._pop_record()
-            if record is None:
-                return None
-            if record.entry.stream_id.category != self._category:
-                continue
-            return record
+        return self._pop_indexed(self._storage.category_offsets(self._category))
 
 
 @dataclass
@@ -126,13 +235,7 @@ class InMemoryToEventTypesSubscription(InMemorySubscription):
     _types: list[str]
 
     def _pop_record(self) -> RecordedRaw | None:
-        while True:
-            record = super()._pop_record()
-            if record is None:
-                return None
-            if record.entry.name not in self._types:
-                continue
-            return record
+        return self._pop_indexed(*map(self._storage.name_offsets, self._types))
 
 
 @dataclass
@@ -172,6 +275,17 @@ class InMemoryOutboxStorageStrategy(OutboxStorageStrategy):
         return failure_count >= self._max_publish_attempts
 
 
+@dataclass
+class InMemoryCheckpointStorageStrategy(CheckpointStorageStrategy):
+    _checkpoints: dict[str, Position] = field(default_factory=dict, init=False)
+
+    def load(self, name: str) -> Position | None:
+        return self._checkpoints.get(name)
+
+    def save(self, name: str, position: Position) -> None:
+        self._checkpoints[name] = position
+
+
 @dataclass
 class InMemorySubscriptionStrategy(SubscriptionStrategy):
     _storage: Storage
@@ -181,8 +295,11 @@ class InMemorySubscriptionStrategy(SubscriptionStrategy):
         start_from: Position,
         batch_size: int,
         timelimit: timedelta,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
-        return InMemorySubscription(self._storage, start_from, batch_size, timelimit)
+        return InMemorySubscription(
+            self._storage, start_from, batch_size, timelimit, partition
+        )
 
     def subscribe_to_category(
         self,
@@ -190,12 +307,14 @@ class InMemorySubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         category: str,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         return InMemoryToCategorySubscription(
             self._storage,
             start_from,
             batch_size,
             timelimit,
+            partition,
             category,
         )
 
@@ -205,12 +324,64 @@ class InMemorySubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         events: list[str],
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         return InMemoryToEventTypesSubscription(
             self._storage,
             start_from,
             batch_size,
             timelimit,
+            partition,
+            events,
+        )
+
+
+@dataclass
+class InMemoryAsyncSubscriptionStrategy(AsyncSubscriptionStrategy):
+    _storage: Storage
+
+    def subscribe_to_all(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return InMemorySubscription(
+            self._storage, start_from, batch_size, timelimit, partition
+        )
+
+    def subscribe_to_category(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        category: str,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return InMemoryToCategorySubscription(
+            self._storage,
+            start_from,
+            batch_size,
+            timelimit,
+            partition,
+            category,
+        )
+
+    def subscribe_to_events(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        events: list[str],
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return InMemoryToEventTypesSubscription(
+            self._storage,
+            start_from,
+            batch_size,
+            timelimit,
+            partition,
             events,
         )
 
@@ -246,12 +417,23 @@ class InMemoryStorageStrategy(StorageStrategy):
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
     ) -> None:
+        self.insert_many({stream_id: (versioning, events)})
+
+    def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        for stream_id, (versioning, _) in streams.items():
+            self._check_version(stream_id, versioning)
+
         position = self.current_position or 0
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
-        records = [
-            RecordedRaw(entry=raw, position=position, tenant_id=self._tenant_id)
-            for position, raw in enumerate(events, start=position + 1)
-        ]
+        records: list[RecordedRaw] = []
+        for stream_id, (versioning, events) in streams.items():
+            self._ensure_stream(stream_id=stream_id, versioning=versioning)
+            records.extend(
+                RecordedRaw(entry=raw, position=position, tenant_id=self._tenant_id)
+                for position, raw in enumerate(events, start=position + 1)
+            )
+            position += len(events)
         self._storage.append(records)
         if self._outbox:
             self._outbox.put_into_outbox(records)
@@ -268,15 +450,17 @@ class InMemoryStorageStrategy(StorageStrategy):
     def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
         if stream_id not in self._storage:
             self._storage.create(stream_id, versioning)
+        self._check_version(stream_id, versioning)
+
+    def _check_version(self, stream_id: StreamId, versioning: Versioning) -> None:
+        if stream_id in self._storage:
+            last_version = self._storage.get_version(stream_id)
+        else:
+            last_version = None if versioning is NO_VERSIONING else 0
 
-        versioning.validate_if_compatible(self._storage.get_version(stream_id))
+        versioning.validate_if_compatible(last_version)
 
         if versioning is not NO_VERSIONING and versioning.expected_version:
-            last_version = (
-                self._storage.get_version(stream_id)
-                if stream_id in self._storage
-                else None
-            )
             if last_version != versioning.expected_version:
                 raise ConcurrentStreamWriteError(
                     last_version,
@@ -292,6 +476,11 @@ class InMemoryStorageStrategy(StorageStrategy):
         current_position = self._storage.current_position
         return current_position and Position(current_position)
 
+    @property
+    def current_tenant_position(self) -> Position | None:
+        current_position = self._storage.tenant_position(self._tenant_id)
+        return current_position and Position(current_position)
+
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return type(self)(
             storage=self._storage,
@@ -301,10 +490,55 @@ class InMemoryStorageStrategy(StorageStrategy):
         )
 
 
+class InMemoryAsyncStorageStrategy(AsyncStorageStrategy):
+    def __init__(self, strategy: InMemoryStorageStrategy) -> None:
+        self._strategy = strategy
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        return self._strategy.fetch_events(stream_id, start=start, stop=stop)
+
+    async def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        return self._strategy.fetch_events_many(stream_ids)
+
+    async def insert_events(
+        self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
+    ) -> None:
+        self._strategy.insert_events(stream_id, versioning, events)
+
+    async def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        self._strategy.insert_many(streams)
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        self._strategy.save_snapshot(snapshot)
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        self._strategy.delete_stream(stream_id)
+
+    async def current_position(self) -> Position | None:
+        return self._strategy.current_position
+
+    async def current_tenant_position(self) -> Position | None:
+        return self._strategy.current_tenant_position
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return type(self)(self._strategy.scoped_for_tenant(tenant_id))
+
+
 class Config(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
     outbox_attempts: PositiveInt = 3
+    trusted_deserialization: bool = False
+    compression: Compression | None = None
 
 
 @dataclass(repr=False)
@@ -316,15 +550,27 @@ class InMemoryBackendFactory(BackendFactory):
     _config: Config = field(default_factory=Config)
     _storage: Storage = field(default_factory=Storage)
     _outbox_strategy: InMemoryOutboxStorageStrategy | None = None
+    _post_commit_executor: Executor | AbstractEventLoop | None = None
     _subscription_strategy: InMemorySubscriptionStrategy = field(init=False)
+    _async_subscription_strategy: InMemoryAsyncSubscriptionStrategy = field(init=False)
+    _checkpoint_strategy: InMemoryCheckpointStorageStrategy = field(
+        default_factory=InMemoryCheckpointStorageStrategy, init=False
+    )
 
     def __post_init__(self) -> None:
         self._subscription_strategy = InMemorySubscriptionStrategy(self._storage)
+        self._async_subscription_strategy = InMemoryAsyncSubscriptionStrategy(
+            self._storage
+        )
 
     def build(self) -> TransactionalBackend:
         backend = TransactionalBackend()
-        backend.serde = self.serde
-        backend.in_transaction = Dispatcher(backend.serde)
+        backend.serde = replace(
+            self.serde,
+            trusted=self._config.trusted_deserialization,
+            compression=self._config.compression,
+        )
+        backend.in_transaction = self._dispatcher(backend.serde)
         backend.event_store = EventStore(
             InMemoryStorageStrategy(
                 self._storage,
@@ -340,6 +586,34 @@ class InMemoryBackendFactory(BackendFactory):
         backend.subscriber = subscription.SubscriptionBuilder(
             _serde=backend.serde,
             _strategy=self._subscription_strategy,
+            _checkpoints=self._checkpoint_strategy,
+            _async_strategy=self._async_subscription_strategy,
+        )
+        return backend
+
+    def build_async(self) -> AsyncBackend:
+        """Builds asyncio backend sharing storage with backends from `build`."""
+        backend = AsyncBackend()
+        backend.serde = replace(
+            self.serde,
+            trusted=self._config.trusted_deserialization,
+            compression=self._config.compression,
+        )
+        backend.in_transaction = self._dispatcher(backend.serde)
+        backend.event_store = AsyncEventStore(
+            InMemoryAsyncStorageStrategy(
+                InMemoryStorageStrategy(
+                    self._storage,
+                    backend.in_transaction,
+                    self._outbox_strategy,
+                ),
+            ),
+            backend.serde,
+        )
+        backend.subscriber = subscription.SubscriptionBuilder(
+            _serde=backend.serde,
+            _checkpoints=self._checkpoint_strategy,
+            _async_strategy=self._async_subscription_strategy,
         )
         return backend
 
@@ -357,3 +631,13 @@ class InMemoryBackendFactory(BackendFactory):
     def without_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
         self._outbox_strategy = None
         return self
+
+    def with_post_commit_dispatch(self, executor: Executor | AbstractEventLoop) -> Self:
+        """Delivers records to `in_transaction` listeners after commit."""
+        self._post_commit_executor = executor
+        return self
+
+    def _dispatcher(self, serde: Serde) -> Dispatcher:
+        if self._post_commit_executor is None:
+            return Dispatcher(serde)
+        return PostCommitDispatcher(serde, self._post_commit_executor)
@@ -1,12 +1,14 @@
 import abc
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator, Mapping, Sequence
 from contextlib import AbstractContextManager
 from datetime import timedelta
 from typing import Protocol
 
+from more_itertools import chunked
 from typing_extensions import Self
 
 from event_sourcery.event_store.event import Position, RawEvent, RecordedRaw
+from event_sourcery.event_store.partition import Partition
 from event_sourcery.event_store.stream_id import StreamId
 from event_sourcery.event_store.versioning import Versioning
 
@@ -30,6 +32,7 @@ class SubscriptionStrategy(abc.ABC):
         start_from: Position,
         batch_size: int,
         timelimit: timedelta,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         pass
 
@@ -40,6 +43,7 @@ class SubscriptionStrategy(abc.ABC):
         batch_size: int,
         timelimit: timedelta,
         category: str,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         pass
 
@@ -50,10 +54,66 @@ class SubscriptionStrategy(abc.ABC):
         batch_size: int,
         timelimit: timedelta,
         events: list[str],
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         pass
 
 
+class AsyncSubscriptionStrategy(abc.ABC):
+    """Counterpart of `SubscriptionStrategy` iterated with `async for`.
+
+    Waiting for events must not block the event loop.
+    """
+
+    @abc.abstractmethod
+    def subscribe_to_all(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        pass
+
+    @abc.abstractmethod
+    def subscribe_to_category(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        category: str,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        pass
+
+    @abc.abstractmethod
+    def subscribe_to_events(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        events: list[str],
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        pass
+
+
+class CheckpointStorageStrategy(abc.ABC):
+    """Stores positions up to which named subscriptions processed events.
+
+    Checkpoints are saved from a background thread, outside of transactions
+    of the subscriber, so implementations must use their own connections.
+    """
+
+    @abc.abstractmethod
+    def load(self, name: str) -> Position | None:
+        pass
+
+    @abc.abstractmethod
+    def save(self, name: str, position: Position) -> None:
+        pass
+
+
 class StorageStrategy(abc.ABC):
     @abc.abstractmethod
     def fetch_events(
@@ -64,12 +124,44 @@ class StorageStrategy(abc.ABC):
     ) -> list[RawEvent]:
         pass
 
+    def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        """Fetches events of many streams at once.
+
+        Backends should override it to fetch all streams with a constant number
+        of queries. Default implementation fetches stream by stream.
+        """
+        return {stream_id: self.fetch_events(stream_id) for stream_id in stream_ids}
+
+    def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> Iterator[list[RawEvent]]:
+        """Fetches events of a stream page by page.
+
+        Yields the same events as `fetch_events`. Backends should override it
+        to keep at most one page in memory. Default implementation fetches
+        the whole stream and splits it into pages.
+        """
+        yield from chunked(self.fetch_events(stream_id), page_size)
+
     @abc.abstractmethod
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
     ) -> None:
         pass
 
+    def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        """Inserts events to many streams at once.
+
+        Backends should override it to check versions and write all streams
+        in a single round trip. Default implementation inserts stream by stream.
+        """
+        for stream_id, (versioning, events) in streams.items():
+            self.insert_events(stream_id, versioning, events)
+
     @abc.abstractmethod
     def save_snapshot(self, snapshot: RawEvent) -> None:
         pass
@@ -83,6 +175,68 @@ class StorageStrategy(abc.ABC):
     def current_position(self) -> Position | None:
         pass
 
+    @property
+    @abc.abstractmethod
+    def current_tenant_position(self) -> Position | None:
+        """Position of the last event of the tenant strategy is scoped for."""
+        pass
+
+    @abc.abstractmethod
+    def scoped_for_tenant(self, tenant_id: str) -> Self:
+        pass
+
+
+class AsyncStorageStrategy(abc.ABC):
+    @abc.abstractmethod
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        pass
+
+    async def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        return {
+            stream_id: await self.fetch_events(stream_id) for stream_id in stream_ids
+        }
+
+    async def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> AsyncIterator[list[RawEvent]]:
+        for page in chunked(await self.fetch_events(stream_id), page_size):
+            yield page
+
+    @abc.abstractmethod
+    async def insert_events(
+        self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
+    ) -> None:
+        pass
+
+    async def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        for stream_id, (versioning, events) in streams.items():
+            await self.insert_events(stream_id, versioning, events)
+
+    @abc.abstractmethod
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        pass
+
+    @abc.abstractmethod
+    async def current_position(self) -> Position | None:
+        pass
+
+    @abc.abstractmethod
+    async def current_tenant_position(self) -> Position | None:
+        pass
+
     @abc.abstractmethod
     def scoped_for_tenant(self, tenant_id: str) -> Self:
         pass
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+from event_sourcery.event_store.stream_id import StreamId
+
+MAX_PARTITIONS = 256
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One of `count` disjoint parts of events, split by their streams.
+
+    All events of a stream belong to the same partition, so consumers of
+    separate partitions keep the order of events within each stream. Backends
+    filter events of a partition in their queries, each with its own hash of
+    streams, so partitions of different backends don't match.
+    """
+
+    count: int
+    index: int
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.count <= MAX_PARTITIONS:
+            raise ValueError(
+                f"Partitions count must be between 1 and {MAX_PARTITIONS}. "
+                f"Received: {self.count}"
+            )
+        if not 0 <= self.index < self.count:
+            raise ValueError(
+                f"Partition index must be between 0 and {self.count - 1}. "
+                f"Received: {self.index}"
+            )
+
+    @staticmethod
+    def key(stream_id: StreamId) -> int:
+        """Hash of streams by their last UUID byte, for stores keyed by UUIDs."""
+        return stream_id.int & 0xFF
+
+    def contains(self, stream_id: StreamId) -> bool:
+        return self.key(stream_id) % self.count == self.index
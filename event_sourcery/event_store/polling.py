@@ -0,0 +1,124 @@
+import asyncio
+import random
+import threading
+import time
+import warnings
+from dataclasses import dataclass, field
+from datetime import timedelta
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, PositiveFloat
+
+
+class PollingPolicy(BaseModel):
+    """How often subscriptions of polling backends query for new events.
+
+    Idle subscriptions back off exponentially from `min_interval` up to
+    `max_interval`, with random `jitter`, so they don't query in lockstep.
+    Subscriptions query again right away after a full batch, and from
+    `min_interval` after receiving any new events. `max_queries_per_second`
+    caps polls of all subscriptions in the process sharing the same cap.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    min_interval: timedelta = timedelta(seconds=0.05)
+    max_interval: timedelta = timedelta(seconds=2)
+    multiplier: float = Field(default=2.0, ge=1)
+    jitter: float = Field(default=0.2, ge=0, le=1)
+    max_queries_per_second: PositiveFloat | None = None
+
+    def backoff(self) -> "Backoff":
+        return Backoff(self)
+
+    def throttle(self) -> None:
+        if self.max_queries_per_second is not None:
+            _rate_limiter(self.max_queries_per_second).acquire()
+
+    async def throttle_async(self) -> None:
+        if self.max_queries_per_second is not None:
+            await asyncio.sleep(_rate_limiter(self.max_queries_per_second).reserve())
+
+
+def with_gap_retry_interval_as_polling(data: Any) -> Any:
+    """Maps deprecated `gap_retry_interval` of backend configs to `polling`.
+
+    The fixed interval becomes `min_interval` of the polling policy.
+    """
+    if not isinstance(data, dict) or "gap_retry_interval" not in data:
+        return data
+    warnings.warn(
+        "gap_retry_interval is deprecated, use polling=PollingPolicy(min_interval=...)",
+        DeprecationWarning,
+        stacklevel=4,
+    )
+    data = dict(data)
+    polling = data.get("polling", {})
+    if isinstance(polling, PollingPolicy):
+        polling = dict(polling)
+    data["polling"] = {**polling, "min_interval": data.pop("gap_retry_interval")}
+    return data
+
+
+@dataclass(repr=False)
+class Backoff:
+    _policy: PollingPolicy
+    _interval: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self._interval = self._policy.min_interval.total_seconds()
+
+    def next_delay(self) -> float:
+        jitter = random.uniform(-self._policy.jitter, self._policy.jitter)  # noqa: S311
+        delay = self._interval * (1 + jitter)
+        self._interval = min(
+            self._interval * self._policy.multiplier,
+            self._policy.max_interval.total_seconds(),
+        )
+        return delay
+
+
+class Wakeups:
+    """Sleeps between polls of subscriptions.
+
+    Subscriptions take `generation` before querying for events, and `wait`
+    with it, so implementations can wake them up on events stored since.
+    """
+
+    @property
+    def generation(self) -> int:
+        return 0
+
+    def wait(self, generation: int, timeout: float) -> None:
+        time.sleep(timeout)
+
+
+class RateLimiter:
+    """Spaces out calls of `acquire` from all threads evenly at given rate."""
+
+    def __init__(self, rate: float) -> None:
+        self._period = 1 / rate
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def reserve(self) -> float:
+        """Takes the next free slot, returning how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_at)
+            self._next_at = at + self._period
+        return at - now
+
+
+@cache
+def _rate_limiter(rate: float) -> RateLimiter:
+    return RateLimiter(rate)
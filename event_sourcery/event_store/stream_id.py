@@ -1,11 +1,14 @@
 from dataclasses import InitVar, dataclass
+from functools import lru_cache
 from typing import Any, TypeAlias
-from uuid import UUID, uuid4, uuid5
+from uuid import UUID, SafeUUID, uuid4, uuid5
 
 from event_sourcery.event_store.exceptions import IncompatibleUuidAndName
 
 Category: TypeAlias = str
 
+CACHE_SIZE = 4096
+
 
 @dataclass(frozen=True, repr=False, eq=False)
 class StreamUUID(UUID):
@@ -20,6 +23,7 @@ class StreamUUID(UUID):
             super().__init__(bytes=uuid.bytes)
         elif self.name is not None:
             super().__init__(bytes=self._from_name(self.name).bytes)
+            return
         elif from_hex is not None:
             super().__init__(hex=from_hex)
         else:
@@ -29,10 +33,10 @@ class StreamUUID(UUID):
             raise IncompatibleUuidAndName(self, expected, self.name)
 
     def _from_name(self, name: str) -> UUID:
-        return uuid5(self.NAMESPACE, name)
+        return _uuid_for_name(self.NAMESPACE, name)
 
     def __repr__(self) -> str:
-        return f"{type(self).__name__}" f"(hex={self!s}, name={self.name})"
+        return f"{type(self).__name__}(hex={self!s}, name={self.name})"
 
 
 @dataclass(frozen=True, repr=False, eq=False)
@@ -52,3 +56,32 @@ class StreamId(StreamUUID):
 
     def __hash__(self) -> int:
         return hash((self.category, super().__hash__()))
+
+    @classmethod
+    def trusted(
+        cls,
+        uuid: UUID,
+        name: str | None = None,
+        category: Category | None = None,
+    ) -> "StreamId":
+        """Returns StreamId for data known to be valid, e.g. read from storage.
+
+        Skips validation of uuid against name. Instances are interned,
+        so reading many events of a stream does not create many StreamIds.
+        """
+        return _interned(uuid.int, name, category)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _uuid_for_name(namespace: UUID, name: str) -> UUID:
+    return uuid5(namespace, name)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _interned(uuid: int, name: str | None, category: Category | None) -> StreamId:
+    stream_id = object.__new__(StreamId)
+    object.__setattr__(stream_id, "int", uuid)
+    object.__setattr__(stream_id, "is_safe", SafeUUID.unknown)
+    object.__setattr__(stream_id, "name", name)
+    object.__setattr__(stream_id, "category", category)
+    return stream_id
@@ -1,11 +1,12 @@
 import abc
-import sys
-from collections.abc import Callable, Iterator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
 from dataclasses import dataclass, field
 from datetime import timedelta
 from functools import partial
-from typing import TypeAlias
+from typing import Any, TypeAlias
 
+from event_sourcery.event_store.checkpoints import Checkpointer
 from event_sourcery.event_store.event import (
     Event,
     Position,
@@ -13,7 +14,12 @@ from event_sourcery.event_store.event import (
     RecordedRaw,
     Serde,
 )
-from event_sourcery.event_store.interfaces import SubscriptionStrategy
+from event_sourcery.event_store.interfaces import (
+    AsyncSubscriptionStrategy,
+    CheckpointStorageStrategy,
+    SubscriptionStrategy,
+)
+from event_sourcery.event_store.partition import Partition
 from event_sourcery.event_store.stream_id import Category
 
 Seconds: TypeAlias = int | float
@@ -23,58 +29,179 @@ class BuildPhase(abc.ABC):
     @abc.abstractmethod
     def build_iter(
         self, timelimit: Seconds | timedelta
-    ) -> Iterator[Recorded | None]: ...
+    ) -> Generator[Recorded | None, None, None]: ...
 
     @abc.abstractmethod
     def build_batch(
         self,
         size: int,
         timelimit: Seconds | timedelta,
-    ) -> Iterator[list[Recorded]]: ...
+    ) -> Generator[list[Recorded], None, None]: ...
 
+    @abc.abstractmethod
+    def build_async_iter(
+        self, timelimit: Seconds | timedelta
+    ) -> AsyncGenerator[Recorded | None, None]: ...
 
-class FilterPhase(BuildPhase):
     @abc.abstractmethod
-    def to_category(self, category: Category) -> BuildPhase: ...
+    def build_async_batch(
+        self,
+        size: int,
+        timelimit: Seconds | timedelta,
+    ) -> AsyncGenerator[list[Recorded], None]: ...
+
 
+class PartitionPhase(BuildPhase):
     @abc.abstractmethod
-    def to_events(self, events: list[type[Event]]) -> BuildPhase: ...
+    def partitioned(self, count: int, index: int) -> BuildPhase: ...
+
+
+class FilterPhase(PartitionPhase):
+    @abc.abstractmethod
+    def to_category(self, category: Category) -> PartitionPhase: ...
+
+    @abc.abstractmethod
+    def to_events(self, events: list[type[Event]]) -> PartitionPhase: ...
 
 
 class PositionPhase(abc.ABC):
     @abc.abstractmethod
     def start_from(self, position: Position) -> FilterPhase: ...
 
+    @abc.abstractmethod
+    def named(
+        self,
+        name: str,
+        every: int = 100,
+        interval: Seconds | timedelta = 5,
+    ) -> FilterPhase: ...
+
 
 @dataclass(repr=False)
-class SubscriptionBuilder(PositionPhase, FilterPhase, BuildPhase):
-    _serde: Serde
+class ThreadedSubscriptionStrategy(AsyncSubscriptionStrategy):
+    """Iterates blocking subscriptions on worker threads of the event loop.
+
+    Fallback for backends without a native `AsyncSubscriptionStrategy`.
+    """
+
     _strategy: SubscriptionStrategy
-    _position: Position = field(init=False, default=sys.maxsize)
-    _build: Callable[..., Iterator[list[RecordedRaw]]] = field(init=False)
+
+    def subscribe_to_all(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return _threaded(
+            self._strategy.subscribe_to_all(
+                start_from, batch_size, timelimit, partition
+            )
+        )
+
+    def subscribe_to_category(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        category: str,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return _threaded(
+            self._strategy.subscribe_to_category(
+                start_from, batch_size, timelimit, category, partition
+            )
+        )
+
+    def subscribe_to_events(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        events: list[str],
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return _threaded(
+            self._strategy.subscribe_to_events(
+                start_from, batch_size, timelimit, events, partition
+            )
+        )
+
+
+async def _threaded(
+    subscription: Iterator[list[RecordedRaw]],
+) -> AsyncGenerator[list[RecordedRaw], None]:
+    while True:
+        yield await asyncio.to_thread(next, subscription)
+
+
+@dataclass(repr=False)
+class SubscriptionBuilder(PositionPhase, FilterPhase, PartitionPhase, BuildPhase):
+    """Builds subscriptions of blocking and of asyncio backends.
+
+    Backends built for asyncio may provide only `_async_strategy`. Without
+    it, async subscriptions run the blocking `_strategy` on worker threads.
+    """
+
+    _serde: Serde
+    _strategy: SubscriptionStrategy | None = None
+    _checkpoints: CheckpointStorageStrategy | None = None
+    _async_strategy: AsyncSubscriptionStrategy | None = None
+    _subscribe_to: str = field(init=False, default="subscribe_to_all")
+    _options: dict[str, Any] = field(init=False, default_factory=dict)
+    _checkpointer: Checkpointer | None = field(init=False, default=None)
 
     def __post_init__(self) -> None:
-        self._build = partial(self._strategy.subscribe_to_all)
+        if self._async_strategy is None and self._strategy is not None:
+            self._async_strategy = ThreadedSubscriptionStrategy(self._strategy)
 
     def start_from(self, position: Position) -> FilterPhase:
-        self._build = partial(self._build, start_from=position)
-        self._position = position
+        self._subscribe_to = "subscribe_to_all"
+        self._options = {"start_from": position}
+        self._checkpointer = None
         return self
 
-    def to_category(self, category: Category) -> BuildPhase:
-        self._build = partial(
-            self._strategy.subscribe_to_category,
-            start_from=self._position,
-            category=category,
-        )
+    def named(
+        self,
+        name: str,
+        every: int = 100,
+        interval: Seconds | timedelta = 5,
+    ) -> FilterPhase:
+        """Starts from the checkpoint of the subscription, saving it as it goes.
+
+        The checkpoint is saved after every `every` processed events or
+        `interval` since the last save, whichever comes first, and when the
+        built subscription is closed. The checkpoint is loaded once the
+        subscription is built, or with async ones, once it's first iterated.
+        """
+        if self._checkpoints is None:
+            raise NotImplementedError("Backend doesn't store checkpoints")
+        if not isinstance(interval, timedelta):
+            interval = timedelta(seconds=interval)
+        checkpointer = Checkpointer(self._checkpoints, name, every, interval)
+        self.start_from(Position(0))
+        self._checkpointer = checkpointer
         return self
 
-    def to_events(self, events: list[type[Event]]) -> BuildPhase:
-        self._build = partial(
-            self._strategy.subscribe_to_events,
-            start_from=self._position,
-            events=[self._serde.registry.name_for_type(event) for event in events],
-        )
+    def to_category(self, category: Category) -> PartitionPhase:
+        self._subscribe_to = "subscribe_to_category"
+        self._options["category"] = category
+        return self
+
+    def to_events(self, events: list[type[Event]]) -> PartitionPhase:
+        self._subscribe_to = "subscribe_to_events"
+        self._options["events"] = [
+            self._serde.registry.name_for_type(event) for event in events
+        ]
+        return self
+
+    def partitioned(self, count: int, index: int) -> BuildPhase:
+        """Narrows the subscription to `index` of `count` partitions of streams.
+
+        Each of `count` consumers may subscribe to its own partition in
+        parallel. Events of a stream are all delivered to one of them, in order.
+        """
+        self._options["partition"] = Partition(count, index)
         return self
 
     @staticmethod
@@ -91,14 +218,50 @@ class SubscriptionBuilder(PositionPhase, FilterPhase, BuildPhase):
             )
         return seconds
 
-    def build_iter(self, timelimit: Seconds | timedelta) -> Iterator[Recorded | None]:
+    def _build(
+        self, batch_size: int, timelimit: timedelta
+    ) -> Iterator[list[RecordedRaw]]:
+        if self._strategy is None:
+            raise NotImplementedError("Backend subscribes only with async iterators")
+        subscribe = getattr(self._strategy, self._subscribe_to)
+        options = self._options
+        if self._checkpointer is not None:
+            options = {**options, "start_from": self._checkpointer.load()}
+        subscription: Iterator[list[RecordedRaw]] = subscribe(
+            batch_size=batch_size, timelimit=timelimit, **options
+        )
+        if self._checkpointer is None:
+            return subscription
+        return self._checkpointer.track(subscription)
+
+    def _build_async(
+        self, batch_size: int, timelimit: timedelta
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        if self._async_strategy is None:
+            raise NotImplementedError("Backend subscribes only with blocking iterators")
+        subscribe = partial(
+            getattr(self._async_strategy, self._subscribe_to),
+            batch_size=batch_size,
+            timelimit=timelimit,
+            **self._options,
+        )
+        if self._checkpointer is None:
+            subscription: AsyncIterator[list[RecordedRaw]] = subscribe()
+            return subscription
+        return self._checkpointer.track_async(
+            lambda position: subscribe(start_from=position)
+        )
+
+    def build_iter(
+        self, timelimit: Seconds | timedelta
+    ) -> Generator[Recorded | None, None, None]:
         timelimit = self._to_timedelta(timelimit)
-        return self._single_event_unpack(self._build(batch_size=1, timelimit=timelimit))
+        return self._single_event_unpack(self._build(1, timelimit))
 
     def _single_event_unpack(
         self,
         subscription: Iterator[list[RecordedRaw]],
-    ) -> Iterator[Recorded | None]:
+    ) -> Generator[Recorded | None, None, None]:
         while True:
             batch = next(subscription)
             yield self._serde.deserialize_record(batch[0]) if batch else None
@@ -107,9 +270,48 @@ class SubscriptionBuilder(PositionPhase, FilterPhase, BuildPhase):
         self,
         size: int,
         timelimit: Seconds | timedelta,
-    ) -> Iterator[list[Recorded]]:
-        seconds = self._to_timedelta(timelimit)
-        subscription = self._build(batch_size=size, timelimit=seconds)
+    ) -> Generator[list[Recorded], None, None]:
+        subscription = self._build(size, self._to_timedelta(timelimit))
         return (  # pragma: no cover  # apparently, bug in coverage.py
             [self._serde.deserialize_record(e) for e in batch] for batch in subscription
         )
+
+    def build_async_iter(
+        self, timelimit: Seconds | timedelta
+    ) -> AsyncGenerator[Recorded | None, None]:
+        timelimit = self._to_timedelta(timelimit)
+        return self._async_single_event_unpack(self._build_async(1, timelimit))
+
+    async def _async_single_event_unpack(
+        self,
+        subscription: AsyncIterator[list[RecordedRaw]],
+    ) -> AsyncGenerator[Recorded | None, None]:
+        try:
+            async for batch in subscription:
+                yield self._serde.deserialize_record(batch[0]) if batch else None
+        finally:
+            await _aclose(subscription)
+
+    def build_async_batch(
+        self,
+        size: int,
+        timelimit: Seconds | timedelta,
+    ) -> AsyncGenerator[list[Recorded], None]:
+        subscription = self._build_async(size, self._to_timedelta(timelimit))
+        return self._async_deserialize(subscription)
+
+    async def _async_deserialize(
+        self,
+        subscription: AsyncIterator[list[RecordedRaw]],
+    ) -> AsyncGenerator[list[Recorded], None]:
+        try:
+            async for batch in subscription:
+                yield [self._serde.deserialize_record(e) for e in batch]
+        finally:
+            await _aclose(subscription)
+
+
+async def _aclose(subscription: AsyncIterator[Any]) -> None:
+    """Closes wrapped subscription, so it saves its checkpoint right away."""
+    if isinstance(subscription, AsyncGenerator):
+        await subscription.aclose()
@@ -3,11 +3,14 @@ __all__ = [
     "DjangoBackendFactory",
 ]
 
-from dataclasses import dataclass, field
+from asyncio import AbstractEventLoop
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
-from typing import cast
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
-from pydantic import BaseModel, ConfigDict, PositiveInt
+from pydantic import BaseModel, ConfigDict, PositiveInt, model_validator
 from typing_extensions import Self
 
 from event_sourcery import event_store as es
@@ -17,25 +20,48 @@ from event_sourcery.event_store import (
     Event,
     EventRegistry,
     EventStore,
+    PostCommitDispatcher,
 )
-from event_sourcery.event_store.event import Serde
+from event_sourcery.event_store.event import Compression, Serde
 from event_sourcery.event_store.factory import (
     NoOutboxStorageStrategy,
     TransactionalBackend,
     no_filter,
 )
+from event_sourcery.event_store.head_position import HeadPosition
 from event_sourcery.event_store.interfaces import (
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
 )
 from event_sourcery.event_store.outbox import Outbox
+from event_sourcery.event_store.polling import (
+    PollingPolicy,
+    with_gap_retry_interval_as_polling,
+)
+
+if TYPE_CHECKING:
+    from event_sourcery_django.event_types import EventTypes
 
 
 class Config(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
     outbox_attempts: PositiveInt = 3
-    gap_retry_interval: timedelta = timedelta(seconds=0.5)
+    polling: PollingPolicy = PollingPolicy()
+    head_position_ttl: timedelta = timedelta(seconds=1)
+    trusted_deserialization: bool = False
+    compression: Compression | None = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def deprecated_gap_retry_interval(cls, data: Any) -> Any:
+        return with_gap_retry_interval_as_polling(data)
+
+
+@cache
+def _head_position(alias: str, ttl: timedelta) -> HeadPosition:
+    """Cache of head positions shared by all backends of the database."""
+    return HeadPosition(ttl)
 
 
 @dataclass(repr=False)
@@ -43,22 +69,44 @@ class DjangoBackendFactory(BackendFactory):
     _config: Config = field(default_factory=Config)
     _serde: Serde = field(default_factory=lambda: Serde(Event.__registry__))
     _outbox_strategy: OutboxStorageStrategy | None = None
+    _event_types: "EventTypes | None" = None
+    _post_commit_executor: Executor | AbstractEventLoop | None = None
 
     def build(self) -> TransactionalBackend:
+        from django.db import router
+
+        from event_sourcery_django import models
+        from event_sourcery_django.checkpoints import DjangoCheckpointStorageStrategy
         from event_sourcery_django.event_store import DjangoStorageStrategy
+        from event_sourcery_django.event_types import EventTypes
         from event_sourcery_django.outbox import DjangoOutboxStorageStrategy
         from event_sourcery_django.subscription import DjangoSubscriptionStrategy
 
         outbox = cast(DjangoOutboxStorageStrategy | None, self._outbox_strategy)
         backend = TransactionalBackend()
-        backend.serde = self._serde
-        backend.in_transaction = Dispatcher(backend.serde)
-        storage_strategy = DjangoStorageStrategy(backend.in_transaction, outbox)
+        backend.serde = replace(
+            self._serde,
+            trusted=self._config.trusted_deserialization,
+            compression=self._config.compression,
+        )
+        backend.in_transaction = self._dispatcher(backend.serde)
+        if self._event_types is None:
+            # Created on first build, as models are not ready on import
+            self._event_types = EventTypes()
+        storage_strategy = DjangoStorageStrategy(
+            backend.in_transaction,
+            outbox,
+            _event_types=self._event_types,
+            _head=_head_position(
+                router.db_for_write(models.Event), self._config.head_position_ttl
+            ),
+        )
         backend.event_store = EventStore(storage_strategy, backend.serde)
         backend.outbox = Outbox(outbox or NoOutboxStorageStrategy(), backend.serde)
         backend.subscriber = es.subscription.SubscriptionBuilder(
             _serde=backend.serde,
-            _strategy=DjangoSubscriptionStrategy(self._config.gap_retry_interval),
+            _strategy=DjangoSubscriptionStrategy(self._config.polling),
+            _checkpoints=DjangoCheckpointStorageStrategy(),
         )
         return backend
 
@@ -78,3 +126,17 @@ class DjangoBackendFactory(BackendFactory):
     def without_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
         self._outbox_strategy = None
         return self
+
+    def with_post_commit_dispatch(self, executor: Executor | AbstractEventLoop) -> Self:
+        """Delivers records to `in_transaction` listeners after commit."""
+        self._post_commit_executor = executor
+        return self
+
+    def _dispatcher(self, serde: Serde) -> Dispatcher:
+        from django.db import transaction
+
+        if self._post_commit_executor is None:
+            return Dispatcher(serde)
+        return PostCommitDispatcher(
+            serde, self._post_commit_executor, transaction.on_commit
+        )
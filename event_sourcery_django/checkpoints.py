@@ -0,0 +1,21 @@
+from event_sourcery.event_store import Position
+from event_sourcery.event_store.interfaces import CheckpointStorageStrategy
+from event_sourcery_django.models import SubscriptionCheckpoint
+
+
+class DjangoCheckpointStorageStrategy(CheckpointStorageStrategy):
+    """Saves checkpoints over the connection of the saving thread.
+
+    Background saves run on their own thread, so they commit apart from the
+    transaction of the subscriber.
+    """
+
+    def load(self, name: str) -> Position | None:
+        checkpoint = SubscriptionCheckpoint.objects.filter(name=name).first()
+        return None if checkpoint is None else Position(checkpoint.position)
+
+    def save(self, name: str, position: Position) -> None:
+        SubscriptionCheckpoint.objects.update_or_create(
+            name=name,
+            defaults={"position": position},
+        )
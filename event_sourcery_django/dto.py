@@ -8,10 +8,10 @@ from event_sourcery_django.models import Event, OutboxEntry, Snapshot, Stream
 def raw_event(from_entry: Event, in_stream: Stream) -> RawEvent:
     return RawEvent(
         uuid=from_entry.uuid,
-        stream_id=StreamId(
-            uuid=in_stream.uuid,
-            name=in_stream.name,
-            category=None if in_stream.category == "" else in_stream.category,
+        stream_id=StreamId.trusted(
+            in_stream.uuid,
+            in_stream.name,
+            category=in_stream.category or None,
         ),
         created_at=from_entry.created_at,
         version=from_entry.version,
@@ -21,15 +21,17 @@ def raw_event(from_entry: Event, in_stream: Stream) -> RawEvent:
     )
 
 
-def entry(from_raw: RawEvent, to_stream: Stream) -> Event:
+def entry(from_raw: RawEvent, to_stream: Stream, type_id: int) -> Event:
     return Event(
         uuid=from_raw.uuid,
         created_at=from_raw.created_at,
-        name=from_raw.name,
+        type_id=type_id,
         data=from_raw.data,
         event_context=from_raw.context,
         version=from_raw.version,
         stream=to_stream,
+        category=to_stream.category,
+        tenant_id=to_stream.tenant_id,
     )
 
 
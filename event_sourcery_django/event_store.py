@@ -1,8 +1,12 @@
-from collections.abc import Sequence
-from dataclasses import dataclass, replace
-from typing import cast
+import operator
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from functools import reduce
 
-from more_itertools import first, first_true
+from django.db import router, transaction
+from django.db.models import Case, F, Max, OuterRef, Q, Subquery, Value, When
+from more_itertools import chunked, first, first_true
 from typing_extensions import Self
 
 from event_sourcery.event_store import (
@@ -19,10 +23,19 @@ from event_sourcery.event_store.exceptions import (
     AnotherStreamWithThisNameButOtherIdExists,
     ConcurrentStreamWriteError,
 )
+from event_sourcery.event_store.head_position import (
+    ALL_TENANTS,
+    HeadPosition,
+    has_uncommitted_events,
+)
 from event_sourcery.event_store.interfaces import StorageStrategy
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
 from event_sourcery_django import dto, models
+from event_sourcery_django.event_types import EventTypes
 from event_sourcery_django.outbox import DjangoOutboxStorageStrategy
+from event_sourcery_django.visibility import assign_transaction_id
+
+FETCH_MANY_CHUNK_SIZE = 500
 
 
 @dataclass(repr=True)
@@ -30,6 +43,8 @@ class DjangoStorageStrategy(StorageStrategy):
     _dispatcher: Dispatcher
     _outbox: DjangoOutboxStorageStrategy | None = None
     _tenant_id: TenantId = DEFAULT_TENANT
+    _event_types: EventTypes = field(default_factory=EventTypes)
+    _head: HeadPosition = field(default_factory=lambda: HeadPosition(timedelta(0)))
 
     def fetch_events(
         self,
@@ -73,20 +88,125 @@ class DjangoStorageStrategy(StorageStrategy):
 
         return [dto.raw_event(event, stream) for event in events]
 
+    def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> Iterator[list[RawEvent]]:
+        try:
+            stream = models.Stream.objects.by_stream_id(
+                stream_id=stream_id,
+                tenant_id=self._tenant_id,
+            ).get()
+        except models.Stream.DoesNotExist:
+            return
+
+        snapshot = (
+            models.Snapshot.objects.filter(stream=stream)
+            .order_by("-created_at")
+            .first()
+        )
+        if snapshot is not None:
+            yield [dto.raw_event(snapshot, stream)]
+
+        versioned = stream.version is not None
+        key = "version" if versioned else "id"
+        last = None
+        events_query = models.Event.objects.filter(stream=stream).order_by(key)
+        if snapshot is not None:
+            events_query = events_query.filter(version__gt=snapshot.version)
+        while True:
+            query = (
+                events_query
+                if last is None
+                else events_query.filter(**{f"{key}__gt": last})
+            )
+            page = list(query[:page_size])
+            if not page:
+                return
+            yield [dto.raw_event(event, stream) for event in page]
+            last = getattr(page[-1], key)
+
+    def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        fetched: dict[StreamId, list[RawEvent]] = {
+            stream_id: [] for stream_id in stream_ids
+        }
+        for chunk in chunked(fetched, FETCH_MANY_CHUNK_SIZE):
+            fetched.update(self._fetch_chunk(chunk))
+        return fetched
+
+    def _fetch_chunk(
+        self, stream_ids: list[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        streams = {
+            (stream.uuid.hex, stream.category): stream
+            for stream in models.Stream.objects.filter(
+                uuid__in=stream_ids, tenant_id=self._tenant_id
+            )
+        }
+        requested = {
+            stream.id: (stream_id, stream)
+            for stream_id in stream_ids
+            if (stream := streams.get((stream_id.hex, stream_id.category or "")))
+        }
+        if not requested:
+            return {}
+
+        latest_snapshot = models.Snapshot.objects.filter(
+            stream=OuterRef("stream")
+        ).order_by("-created_at")
+        snapshots = models.Snapshot.objects.filter(
+            stream__in=requested,
+            uuid=Subquery(latest_snapshot.values("uuid")[:1]),
+        )
+        events = (
+            models.Event.objects.filter(stream__in=requested)
+            .annotate(snapshot_version=Subquery(latest_snapshot.values("version")[:1]))
+            .filter(
+                Q(snapshot_version__isnull=True) | Q(version__gt=F("snapshot_version"))
+            )
+            .order_by("stream", "version", "id")
+        )
+
+        entries: list[models.Snapshot | models.Event] = [*snapshots, *events]
+        fetched: dict[StreamId, list[RawEvent]] = {}
+        for entry in entries:
+            stream_id, stream = requested[entry.stream_id]
+            fetched.setdefault(stream_id, []).append(dto.raw_event(entry, stream))
+        return fetched
+
     def insert_events(
         self,
         stream_id: StreamId,
         versioning: Versioning,
         events: list[RawEvent],
     ) -> None:
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
-        event = cast(RawEvent, first(events))
-        stream = models.Stream.objects.by_stream_id(
-            stream_id=event.stream_id,
-            tenant_id=self._tenant_id,
-        ).get()
-        entries = [dto.entry(event, stream) for event in events]
+        self.insert_many({stream_id: (versioning, events)})
+
+    def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        if not streams:
+            return
+
+        stream_models = self._ensure_streams(
+            {stream_id: versioning for stream_id, (versioning, _) in streams.items()}
+        )
+        events = [
+            event for _, stream_events in streams.values() for event in stream_events
+        ]
+        type_ids = self._event_types.ids_for({event.name for event in events})
+        assign_transaction_id()
+        entries = [
+            dto.entry(event, stream_models[event.stream_id], type_ids[event.name])
+            for event in events
+        ]
         models.Event.objects.bulk_create(entries)
+        if (last := max(entry.id or 0 for entry in entries)) > 0:
+            transaction.on_commit(
+                self._head.advancing(self._tenant_id, last),
+                using=router.db_for_write(models.Event),
+            )
         records = [
             RecordedRaw(entry=raw, position=db.id, tenant_id=self._tenant_id)
             for raw, db in zip(events, entries, strict=False)
@@ -95,39 +215,96 @@ class DjangoStorageStrategy(StorageStrategy):
             self._outbox.put_into_outbox(records)
         self._dispatcher.dispatch(*records)
 
-    def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
-        initial_version = versioning.initial_version
+    def _ensure_streams(
+        self, streams: Mapping[StreamId, Versioning]
+    ) -> dict[StreamId, models.Stream]:
+        def same_stream(stream: models.Stream, stream_id: StreamId) -> bool:
+            return bool(
+                stream.uuid == stream_id
+                and stream.category == (stream_id.category or "")
+            )
 
-        matching_streams = models.Stream.objects.by_stream_id(
-            stream_id=stream_id,
-            tenant_id=self._tenant_id,
-        ).all()
-        if stream_id.name and matching_streams:
-            stream_with_same_name = first_true(
-                matching_streams, pred=lambda stream: stream.name == stream_id.name
+        matching_streams = list(
+            models.Stream.objects.by_stream_ids(streams, tenant_id=self._tenant_id)
+        )
+        missing = [
+            models.Stream(
+                uuid=stream_id,
+                name=stream_id.name,
+                category=stream_id.category or "",
+                tenant_id=self._tenant_id,
+                version=versioning.initial_version,
             )
-            if (
-                stream_with_same_name is not None
-                and stream_with_same_name.uuid != stream_id
-            ):
-                raise AnotherStreamWithThisNameButOtherIdExists()
-
-        model, created = models.Stream.objects.get_or_create(
-            uuid=stream_id,
-            name=stream_id.name,
-            category=stream_id.category or "",
-            tenant_id=self._tenant_id,
-            defaults={"version": initial_version},
+            for stream_id, versioning in streams.items()
+            if not any(same_stream(stream, stream_id) for stream in matching_streams)
+        ]
+        if missing:
+            models.Stream.objects.bulk_create(missing, ignore_conflicts=True)
+            matching_streams = list(
+                models.Stream.objects.by_stream_ids(streams, tenant_id=self._tenant_id)
+            )
+
+        stream_models = {}
+        to_bump = []
+        for stream_id, versioning in streams.items():
+            self._check_name(stream_id, matching_streams)
+            model = first(
+                stream for stream in matching_streams if same_stream(stream, stream_id)
+            )
+            versioning.validate_if_compatible(model.version)
+
+            if versioning.expected_version and versioning is not NO_VERSIONING:
+                if model.version != versioning.expected_version:
+                    raise ConcurrentStreamWriteError
+                to_bump.append((model, versioning))
+            stream_models[stream_id] = model
+
+        if to_bump:
+            self._bump_versions(to_bump)
+
+        return stream_models
+
+    def _check_name(
+        self, stream_id: StreamId, matching_streams: list[models.Stream]
+    ) -> None:
+        if not stream_id.name:
+            return
+
+        stream_with_same_name = first_true(
+            matching_streams,
+            pred=lambda stream: (
+                stream.name == stream_id.name
+                and stream.category == (stream_id.category or "")
+            ),
         )
+        if (
+            stream_with_same_name is not None
+            and stream_with_same_name.uuid != stream_id
+        ):
+            raise AnotherStreamWithThisNameButOtherIdExists()
 
-        versioning.validate_if_compatible(model.version)
+    def _bump_versions(self, streams: list[tuple[models.Stream, Versioning]]) -> None:
+        result = models.Stream.objects.filter(
+            reduce(
+                operator.or_,
+                (
+                    Q(id=model.id, version=versioning.expected_version)
+                    for model, versioning in streams
+                ),
+            )
+        ).update(
+            version=Case(
+                *(
+                    When(id=model.id, then=Value(versioning.initial_version))
+                    for model, versioning in streams
+                )
+            )
+        )
+        if result != len(streams):
+            raise ConcurrentStreamWriteError
 
-        if versioning.expected_version and versioning is not NO_VERSIONING:
-            result = models.Stream.objects.filter(
-                id=model.id, version=versioning.expected_version
-            ).update(version=versioning.initial_version)
-            if result != 1:
-                raise ConcurrentStreamWriteError
+        for model, versioning in streams:
+            model.version = versioning.initial_version
 
     def save_snapshot(self, snapshot: RawEvent) -> None:
         stream = models.Stream.objects.by_stream_id(
@@ -144,8 +321,31 @@ class DjangoStorageStrategy(StorageStrategy):
 
     @property
     def current_position(self) -> Position | None:
-        last_event = models.Event.objects.last()
-        return last_event.id if last_event else Position(0)
+        if has_uncommitted_events(_pending_on_commit()):
+            return self._fetch_position()
+        return self._head.get(ALL_TENANTS, self._fetch_position)
+
+    @property
+    def current_tenant_position(self) -> Position | None:
+        if has_uncommitted_events(_pending_on_commit()):
+            return self._fetch_tenant_position()
+        return self._head.get(self._tenant_id, self._fetch_tenant_position)
+
+    @staticmethod
+    def _fetch_position() -> Position:
+        last_event = models.Event.objects.aggregate(last=Max("id"))["last"]
+        return last_event or Position(0)
+
+    def _fetch_tenant_position(self) -> Position:
+        last_event = models.Event.objects.filter(tenant_id=self._tenant_id).aggregate(
+            last=Max("id")
+        )["last"]
+        return last_event or Position(0)
 
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return replace(self, _tenant_id=tenant_id)
+
+
+def _pending_on_commit() -> list[Callable[[], None]]:
+    connection = transaction.get_connection(router.db_for_write(models.Event))
+    return [func for _, func, *_ in connection.run_on_commit]
@@ -0,0 +1,38 @@
+from collections.abc import Collection
+
+from django.db import router, transaction
+
+from event_sourcery_django import models
+
+
+class EventTypes:
+    """Caches ids of event names from the event types dictionary table.
+
+    Missing names are registered in the transaction of the writer, and their
+    ids are cached once it commits, as ids of a rolled back transaction are
+    gone. Writers of the same new name wait for each other's transactions.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, dict[str, int]] = {}
+
+    def ids_for(self, names: Collection[str]) -> dict[str, int]:
+        alias = router.db_for_write(models.EventType)
+        cached = self._ids.setdefault(alias, {})
+        ids = {name: cached[name] for name in names if name in cached}
+        missing = [name for name in names if name not in ids]
+        if missing:
+            registered = self._register(alias, missing)
+            transaction.on_commit(lambda: cached.update(registered), using=alias)
+            ids.update(registered)
+        return ids
+
+    @staticmethod
+    def _register(alias: str, names: list[str]) -> dict[str, int]:
+        event_types = models.EventType.objects.using(alias)
+        event_types.bulk_create(
+            [models.EventType(name=name) for name in names],
+            ignore_conflicts=True,
+        )
+        rows = event_types.filter(name__in=names).values_list("name", "id")
+        return dict(rows)
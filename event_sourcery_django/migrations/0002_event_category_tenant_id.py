@@ -0,0 +1,48 @@
+from django.db import migrations, models, transaction
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 10_000
+
+
+def copy_from_streams(apps, schema_editor):  # type: ignore[no-untyped-def]
+    event_model = apps.get_model("event_sourcery_django", "Event")
+    stream_model = apps.get_model("event_sourcery_django", "Stream")
+    stream = stream_model.objects.filter(pk=OuterRef("stream_id"))
+    alias = schema_editor.connection.alias
+    while True:
+        with transaction.atomic(using=alias):
+            batch = list(
+                event_model.objects.using(alias)
+                .filter(tenant_id__isnull=True)
+                .values_list("id", flat=True)[:BATCH_SIZE]
+            )
+            if not batch:
+                return
+            event_model.objects.using(alias).filter(id__in=batch).update(
+                category=Subquery(stream.values("category")[:1]),
+                tenant_id=Subquery(stream.values("tenant_id")[:1]),
+            )
+
+
+class Migration(migrations.Migration):
+    # Copying runs in batches, each in its own transaction, so the events
+    # table is not locked for the whole copy
+    atomic = False
+
+    dependencies = [
+        ("event_sourcery_django", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="event",
+            name="category",
+            field=models.CharField(default="", max_length=255),
+        ),
+        migrations.AddField(
+            model_name="event",
+            name="tenant_id",
+            field=models.CharField(max_length=255, null=True),
+        ),
+        migrations.RunPython(copy_from_streams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("event_sourcery_django", "0002_event_category_tenant_id"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubscriptionCheckpoint",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=255, primary_key=True, serialize=False),
+                ),
+                ("position", models.BigIntegerField()),
+            ],
+        ),
+    ]
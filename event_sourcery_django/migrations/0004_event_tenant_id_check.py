@@ -0,0 +1,21 @@
+from django.db import migrations
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # Existing rows are checked by the next migration, so the table is locked
+    # only for adding the constraint
+    dependencies = [
+        ("event_sourcery_django", "0003_subscriptioncheckpoint"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            "ALTER TABLE event_sourcery_django_event "
+            "ADD CONSTRAINT events_tenant_id_not_null "
+            "CHECK (tenant_id IS NOT NULL) NOT VALID",
+            "ALTER TABLE event_sourcery_django_event "
+            "DROP CONSTRAINT events_tenant_id_not_null",
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # Validation scans the table without blocking writes to it
+    dependencies = [
+        ("event_sourcery_django", "0004_event_tenant_id_check"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            "ALTER TABLE event_sourcery_django_event "
+            "VALIDATE CONSTRAINT events_tenant_id_not_null",
+            migrations.RunSQL.noop,
+        ),
+    ]
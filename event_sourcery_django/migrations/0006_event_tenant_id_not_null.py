@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # The validated constraint proves the column has no nulls, so setting
+    # NOT NULL doesn't scan the table, and the constraint is not needed anymore
+    dependencies = [
+        ("event_sourcery_django", "0005_validate_event_tenant_id_check"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "ALTER COLUMN tenant_id SET NOT NULL",
+                "ALTER TABLE event_sourcery_django_event "
+                "DROP CONSTRAINT events_tenant_id_not_null",
+            ],
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "ADD CONSTRAINT events_tenant_id_not_null "
+                "CHECK (tenant_id IS NOT NULL)",
+                "ALTER TABLE event_sourcery_django_event "
+                "ALTER COLUMN tenant_id DROP NOT NULL",
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="event",
+                    name="tenant_id",
+                    field=models.CharField(max_length=255),
+                ),
+            ],
+        ),
+    ]
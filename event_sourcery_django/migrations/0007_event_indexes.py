@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+from event_sourcery_django.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently, which can't run in a transaction
+    atomic = False
+
+    dependencies = [
+        ("event_sourcery_django", "0006_event_tenant_id_not_null"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["category", "id"], name="ix_events_category_id"),
+        ),
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["tenant_id", "id"], name="ix_events_tenant_id_id"),
+        ),
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["name", "id"], name="ix_events_name_id"),
+        ),
+    ]
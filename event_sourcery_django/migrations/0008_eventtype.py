@@ -0,0 +1,87 @@
+import django.db.models.deletion
+from django.db import migrations, models, transaction
+from django.db.models import OuterRef, Subquery
+
+BATCH_SIZE = 10_000
+
+
+def copy_type_ids(apps, schema_editor):  # type: ignore[no-untyped-def]
+    event_model = apps.get_model("event_sourcery_django", "Event")
+    event_type_model = apps.get_model("event_sourcery_django", "EventType")
+    event_type = event_type_model.objects.filter(name=OuterRef("name"))
+    alias = schema_editor.connection.alias
+    while True:
+        with transaction.atomic(using=alias):
+            batch = dict(
+                event_model.objects.using(alias)
+                .filter(type__isnull=True)
+                .values_list("id", "name")[:BATCH_SIZE]
+            )
+            if not batch:
+                return
+            event_type_model.objects.using(alias).bulk_create(
+                [event_type_model(name=name) for name in set(batch.values())],
+                ignore_conflicts=True,
+            )
+            event_model.objects.using(alias).filter(id__in=batch).update(
+                type=Subquery(event_type.values("id")[:1]),
+            )
+
+
+def copy_names(apps, schema_editor):  # type: ignore[no-untyped-def]
+    event_model = apps.get_model("event_sourcery_django", "Event")
+    event_type_model = apps.get_model("event_sourcery_django", "EventType")
+    event_type = event_type_model.objects.filter(pk=OuterRef("type"))
+    alias = schema_editor.connection.alias
+    while True:
+        with transaction.atomic(using=alias):
+            batch = list(
+                event_model.objects.using(alias)
+                .filter(name__isnull=True)
+                .values_list("id", flat=True)[:BATCH_SIZE]
+            )
+            if not batch:
+                return
+            event_model.objects.using(alias).filter(id__in=batch).update(
+                name=Subquery(event_type.values("name")[:1]),
+            )
+
+
+class Migration(migrations.Migration):
+    # Copying runs in batches, each in its own transaction, so the events
+    # table is not locked for the whole copy
+    atomic = False
+
+    dependencies = [
+        ("event_sourcery_django", "0007_event_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EventType",
+            fields=[
+                ("id", models.AutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=200, unique=True)),
+            ],
+        ),
+        # Events are not stored with names anymore
+        migrations.AlterField(
+            model_name="event",
+            name="name",
+            field=models.CharField(max_length=200, null=True),
+        ),
+        # The foreign key is added by next migrations, without locking
+        migrations.AddField(
+            model_name="event",
+            name="type",
+            field=models.ForeignKey(
+                db_constraint=False,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="+",
+                to="event_sourcery_django.eventtype",
+            ),
+        ),
+        migrations.RunPython(copy_type_ids, copy_names),
+    ]
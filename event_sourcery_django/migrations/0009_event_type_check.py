@@ -0,0 +1,31 @@
+from django.db import migrations
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # Existing rows are checked by the next migration, so the table is locked
+    # only for adding the constraints
+    dependencies = [
+        ("event_sourcery_django", "0008_eventtype"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "ADD CONSTRAINT events_type_id_not_null "
+                "CHECK (type_id IS NOT NULL) NOT VALID",
+                "ALTER TABLE event_sourcery_django_event "
+                "ADD CONSTRAINT events_type_id_fk FOREIGN KEY (type_id) "
+                "REFERENCES event_sourcery_django_eventtype (id) "
+                "DEFERRABLE INITIALLY DEFERRED NOT VALID",
+            ],
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "DROP CONSTRAINT events_type_id_fk",
+                "ALTER TABLE event_sourcery_django_event "
+                "DROP CONSTRAINT events_type_id_not_null",
+            ],
+        ),
+    ]
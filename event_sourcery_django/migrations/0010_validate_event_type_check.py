@@ -0,0 +1,22 @@
+from django.db import migrations
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # Validation scans the table without blocking writes to it
+    dependencies = [
+        ("event_sourcery_django", "0009_event_type_check"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "VALIDATE CONSTRAINT events_type_id_not_null",
+                "ALTER TABLE event_sourcery_django_event "
+                "VALIDATE CONSTRAINT events_type_id_fk",
+            ],
+            migrations.RunSQL.noop,
+        ),
+    ]
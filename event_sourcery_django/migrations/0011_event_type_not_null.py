@@ -0,0 +1,42 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+from event_sourcery_django.migrations._operations import RunPostgresSQL
+
+
+class Migration(migrations.Migration):
+    # The validated constraint proves the column has no nulls, so setting
+    # NOT NULL doesn't scan the table, and the constraint is not needed anymore
+    dependencies = [
+        ("event_sourcery_django", "0010_validate_event_type_check"),
+    ]
+
+    operations = [
+        RunPostgresSQL(
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "ALTER COLUMN type_id SET NOT NULL",
+                "ALTER TABLE event_sourcery_django_event "
+                "DROP CONSTRAINT events_type_id_not_null",
+            ],
+            [
+                "ALTER TABLE event_sourcery_django_event "
+                "ADD CONSTRAINT events_type_id_not_null "
+                "CHECK (type_id IS NOT NULL)",
+                "ALTER TABLE event_sourcery_django_event "
+                "ALTER COLUMN type_id DROP NOT NULL",
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="event",
+                    name="type",
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="event_sourcery_django.eventtype",
+                    ),
+                ),
+            ],
+        ),
+    ]
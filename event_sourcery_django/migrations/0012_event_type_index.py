@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+from event_sourcery_django.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # Indexes are built concurrently, which can't run in a transaction
+    atomic = False
+
+    dependencies = [
+        ("event_sourcery_django", "0011_event_type_not_null"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="event",
+            index=models.Index(fields=["type", "id"], name="ix_events_type_id_id"),
+        ),
+        migrations.RemoveIndex(model_name="event", name="ix_events_name_id"),
+        migrations.RemoveField(model_name="event", name="name"),
+    ]
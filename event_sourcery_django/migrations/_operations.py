@@ -0,0 +1,91 @@
+"""Operations keeping the events table writable while it's migrated.
+
+They rely on PostgreSQL, so other databases run plain operations instead.
+"""
+
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations import AddIndex, RunSQL, SeparateDatabaseAndState
+from django.db.migrations.state import ProjectState
+
+
+def _on_postgres(schema_editor: BaseDatabaseSchemaEditor) -> bool:
+    vendor: str = schema_editor.connection.vendor
+    return vendor == "postgresql"
+
+
+class AddIndexConcurrently(AddIndex):
+    """`AddIndexConcurrently` of `django.contrib.postgres` on PostgreSQL.
+
+    Imported there only, as it requires a PostgreSQL driver. Migrations run
+    inside an outer transaction, like in tests, build a plain index instead,
+    as the table is locked for the transaction anyway.
+    """
+
+    atomic = False
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        self._operation(schema_editor).database_forwards(
+            app_label, schema_editor, from_state, to_state
+        )
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        self._operation(schema_editor).database_backwards(
+            app_label, schema_editor, from_state, to_state
+        )
+
+    def _operation(self, schema_editor: BaseDatabaseSchemaEditor) -> AddIndex:
+        if not _on_postgres(schema_editor) or schema_editor.connection.in_atomic_block:
+            return AddIndex(self.model_name, self.index)
+
+        from django.contrib.postgres.operations import (  # noqa: PLC0415
+            AddIndexConcurrently,
+        )
+
+        return AddIndexConcurrently(self.model_name, self.index)
+
+
+class RunPostgresSQL(RunSQL):
+    """Runs SQL on PostgreSQL, applies `state_operations` to other databases."""
+
+    def database_forwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if _on_postgres(schema_editor):
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+        else:
+            self._elsewhere().database_forwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def database_backwards(
+        self,
+        app_label: str,
+        schema_editor: BaseDatabaseSchemaEditor,
+        from_state: ProjectState,
+        to_state: ProjectState,
+    ) -> None:
+        if _on_postgres(schema_editor):
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+        else:
+            self._elsewhere().database_backwards(
+                app_label, schema_editor, from_state, to_state
+            )
+
+    def _elsewhere(self) -> SeparateDatabaseAndState:
+        return SeparateDatabaseAndState(database_operations=self.state_operations)
@@ -1,3 +1,6 @@
+import operator
+from collections.abc import Iterable
+from functools import reduce
 from typing import ClassVar
 from uuid import uuid4
 
@@ -7,17 +10,27 @@ from django.db import models
 from event_sourcery.event_store import StreamId, TenantId
 
 
+def _matching(stream_id: StreamId, tenant_id: TenantId) -> models.Q:
+    category = stream_id.category or ""
+    condition = models.Q(uuid=stream_id, category=category, tenant_id=tenant_id)
+    if stream_id.name:
+        condition = condition | models.Q(
+            name=stream_id.name,
+            category=category,
+            tenant_id=tenant_id,
+        )
+    return condition
+
+
 class StreamManager(models.Manager):
     def by_stream_id(self, stream_id: StreamId, tenant_id: TenantId) -> models.QuerySet:
-        category = stream_id.category or ""
-        condition = models.Q(uuid=stream_id, category=category, tenant_id=tenant_id)
-        if stream_id.name:
-            condition = condition | models.Q(
-                name=stream_id.name,
-                category=category,
-                tenant_id=tenant_id,
-            )
-        return self.filter(condition)
+        return self.filter(_matching(stream_id, tenant_id))
+
+    def by_stream_ids(
+        self, stream_ids: Iterable[StreamId], tenant_id: TenantId
+    ) -> models.QuerySet:
+        conditions = [_matching(stream_id, tenant_id) for stream_id in stream_ids]
+        return self.filter(reduce(operator.or_, conditions, models.Q(pk__in=[])))
 
 
 class Stream(models.Model):
@@ -39,25 +52,56 @@ class Stream(models.Model):
         )
 
 
-class Event(models.Model):
+class EventType(models.Model):
+    """Dictionary of event names, so events refer to them by small ids."""
+
     objects: models.Manager
 
+    id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=200, unique=True)
+
+
+class EventManager(models.Manager):
+    def get_queryset(self) -> models.QuerySet:
+        return super().get_queryset().select_related("type")
+
+
+class Event(models.Model):
     id = models.BigAutoField(primary_key=True)
     version = models.IntegerField(null=True, blank=True)
     uuid = models.UUIDField(default=uuid4, editable=False, unique=True)
-    name = models.CharField(max_length=200)
+    # Indexed together with `id` only, which serves lookups by type as well
+    type = models.ForeignKey(
+        EventType,
+        related_name="+",
+        on_delete=models.PROTECT,
+        db_index=False,
+    )
     data = models.JSONField()
     event_context = models.JSONField()
     created_at = models.DateTimeField()
     stream = models.ForeignKey(Stream, related_name="events", on_delete=models.CASCADE)
+    # Copied from the stream, so subscriptions filter events without a join
+    category = models.CharField(max_length=255, default="")
+    tenant_id = models.CharField(max_length=255)
+
+    objects = EventManager()
 
     class Meta:
         indexes = [
             models.Index(
                 fields=["stream", "version"], name="ix_events_stream_id_version"
             ),
+            models.Index(fields=["category", "id"], name="ix_events_category_id"),
+            models.Index(fields=["tenant_id", "id"], name="ix_events_tenant_id_id"),
+            models.Index(fields=["type", "id"], name="ix_events_type_id_id"),
         ]
 
+    @property
+    def name(self) -> str:
+        name: str = self.type.name
+        return name
+
 
 class Snapshot(models.Model):
     objects: models.Manager
@@ -84,3 +128,10 @@ class OutboxEntry(models.Model):
     stream_name = models.CharField(max_length=255, null=True, blank=True)
     position = models.BigIntegerField()
     tries_left = models.IntegerField()
+
+
+class SubscriptionCheckpoint(models.Model):
+    objects: models.Manager
+
+    name = models.CharField(max_length=255, primary_key=True)
+    position = models.BigIntegerField()
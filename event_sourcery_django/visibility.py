@@ -0,0 +1,76 @@
+from typing import cast
+
+from django.db import connections, router
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Max
+
+from event_sourcery.event_store.gap_detection import Horizon, Visibility
+from event_sourcery_django import models
+
+
+class SerializedWritesVisibility(Visibility):
+    """SQLite serializes writes, so pending ids are above all visible ones."""
+
+    def horizon(self) -> Horizon | None:
+        position = models.Event.objects.aggregate(position=Max("id"))["position"]
+        return Horizon(position=position or 0)
+
+
+class PostgresVisibility(Visibility):
+    """Settles ids allocated from the sequence once their writers have ended.
+
+    Writers take their xid with `assign_transaction_id` before they take ids,
+    so the sequence, read before the snapshot, only holds ids of writers which
+    are done or listed in the snapshot. They have ended once the xmin of a
+    later snapshot passes all of them.
+    """
+
+    def __init__(self, connection: BaseDatabaseWrapper) -> None:
+        self._connection = connection
+
+    def horizon(self) -> Horizon | None:
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_sequence_last_value("
+                "pg_get_serial_sequence(%s, 'id')::regclass)",
+                [models.Event._meta.db_table],
+            )
+            (allocated,) = cursor.fetchone()
+            cursor.execute(
+                "SELECT pg_snapshot_xip(pg_current_snapshot())::text::bigint"
+            )
+            writers = tuple(writer for (writer,) in cursor.fetchall())
+        return Horizon(position=allocated or 0, writers=writers)
+
+    def is_settled(self, horizon: Horizon) -> bool:
+        if not horizon.writers:
+            return True
+        with self._connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint"
+            )
+            (xmin,) = cursor.fetchone()
+        return cast(int, xmin) > max(horizon.writers)
+
+
+def assign_transaction_id() -> None:
+    """Assigns an xid to the writing transaction, on PostgreSQL only.
+
+    Has to be called before inserting events, as `nextval` doesn't assign an
+    xid and writers without one are missing from snapshots.
+    """
+    connection = connections[router.db_for_write(models.Event)]
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_current_xact_id()")
+
+
+def visibility_for() -> Visibility:
+    connection = connections[router.db_for_read(models.Event)]
+    match connection.vendor:
+        case "postgresql":
+            return PostgresVisibility(connection)
+        case "sqlite":
+            return SerializedWritesVisibility()
+        case _:
+            return Visibility()
@@ -4,7 +4,7 @@ __all__ = [
     "ESDBStorageStrategy",
 ]
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TypeAlias
 
 from esdbclient import EventStoreDBClient
@@ -19,13 +19,15 @@ from event_sourcery.event_store import (
     EventRegistry,
     EventStore,
 )
-from event_sourcery.event_store.event import Serde
+from event_sourcery.event_store.event import Compression, Serde
+from event_sourcery.event_store.event.codec import JSON, Codec
 from event_sourcery.event_store.factory import NoOutboxStorageStrategy, no_filter
 from event_sourcery.event_store.interfaces import (
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
 )
 from event_sourcery.event_store.outbox import Outbox
+from event_sourcery_esdb.checkpoints import ESDBCheckpointStorageStrategy
 from event_sourcery_esdb.event_store import ESDBStorageStrategy
 from event_sourcery_esdb.outbox import ESDBOutboxStorageStrategy
 from event_sourcery_esdb.subscription import ESDBSubscriptionStrategy
@@ -34,11 +36,14 @@ Seconds: TypeAlias = PositiveFloat
 
 
 class Config(BaseModel):
-    model_config = ConfigDict(extra="forbid", frozen=True)
+    model_config = ConfigDict(extra="forbid", frozen=True, arbitrary_types_allowed=True)
 
     timeout: Seconds | None = None
     outbox_name: str = "pyes-outbox"
     outbox_attempts: PositiveInt = 3
+    trusted_deserialization: bool = False
+    compression: Compression | None = None
+    codec: Codec = JSON
 
 
 @dataclass(repr=False)
@@ -52,19 +57,28 @@ class ESDBBackendFactory(BackendFactory):
 
     def build(self) -> Backend:
         backend = Backend()
+        backend.serde = replace(
+            self._serde,
+            trusted=self.config.trusted_deserialization,
+            compression=self.config.compression,
+        )
         backend.event_store = EventStore(
             storage_strategy=ESDBStorageStrategy(
                 self.esdb_client,
                 self.config.timeout,
+                _codec=self.config.codec,
             ),
-            serde=self._serde,
+            serde=backend.serde,
         )
-        backend.outbox = Outbox(self._outbox_strategy, self._serde)
+        backend.outbox = Outbox(self._outbox_strategy, backend.serde)
         backend.subscriber = es.subscription.SubscriptionBuilder(
-            _serde=self._serde,
-            _strategy=ESDBSubscriptionStrategy(self.esdb_client),
+            _serde=backend.serde,
+            _strategy=ESDBSubscriptionStrategy(self.esdb_client, self.config.codec),
+            _checkpoints=ESDBCheckpointStorageStrategy(
+                self.esdb_client,
+                self.config.timeout,
+            ),
         )
-        backend.serde = self._serde
         return backend
 
     def with_event_registry(self, event_registry: EventRegistry) -> Self:
@@ -78,6 +92,7 @@ class ESDBBackendFactory(BackendFactory):
             self.config.outbox_name,
             self.config.outbox_attempts,
             self.config.timeout,
+            self.config.codec,
         )
         strategy.create_subscription()
         self._outbox_strategy = strategy
@@ -0,0 +1,33 @@
+from dataclasses import dataclass
+
+from esdbclient import EventStoreDBClient, StreamState
+
+from event_sourcery.event_store import Position
+from event_sourcery.event_store.interfaces import CheckpointStorageStrategy
+
+
+@dataclass(repr=False)
+class ESDBCheckpointStorageStrategy(CheckpointStorageStrategy):
+    """Keeps checkpoints in metadata of empty `checkpoint-<name>` streams.
+
+    Metadata events are system events, so subscriptions never receive them.
+    """
+
+    _client: EventStoreDBClient
+    _timeout: float | None
+
+    def load(self, name: str) -> Position | None:
+        metadata, _ = self._client.get_stream_metadata(
+            f"checkpoint-{name}",
+            timeout=self._timeout,
+        )
+        position = metadata.get("position")
+        return None if position is None else Position(position)
+
+    def save(self, name: str, position: Position) -> None:
+        self._client.set_stream_metadata(
+            f"checkpoint-{name}",
+            metadata={"position": position},
+            current_version=StreamState.ANY,
+            timeout=self._timeout,
+        )
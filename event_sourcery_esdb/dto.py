@@ -1,17 +1,27 @@
 import json
 from datetime import datetime
-from typing import Any, Literal, cast
+from typing import Any, Final, Literal, cast
 
 from esdbclient import NewEvent, RecordedEvent
+from esdbclient.events import ContentType
 
 from event_sourcery.event_store import Position, RawEvent, RecordedRaw
+from event_sourcery.event_store.event.codec import (
+    JSON,
+    Codec,
+    MsgpackCodec,
+    codec_for,
+)
 from event_sourcery_esdb import stream
 
 ES_PREFIX = "$es-"
+OCTET_STREAM: Final = "application/octet-stream"
 
 
 def raw_event(
-    from_entry: RecordedEvent, version: int | Literal["undefined"] = "undefined"
+    from_entry: RecordedEvent,
+    version: int | Literal["undefined"] = "undefined",
+    codec: Codec = JSON,
 ) -> RawEvent:
     metadata = json.loads(from_entry.metadata.decode("utf-8"))
     created_at = datetime.fromisoformat(metadata.pop("created_at"))
@@ -27,22 +37,27 @@ def raw_event(
         created_at=created_at,
         version=version,
         name=from_entry.type,
-        data=json.loads(from_entry.data.decode("utf-8")),
+        data=_decoder(from_entry.content_type, codec).decode(from_entry.data),
         context={k: v for k, v in metadata.items() if not k.startswith(ES_PREFIX)},
     )
 
 
-def snapshot(from_entry: RecordedEvent) -> RawEvent:
+def snapshot(from_entry: RecordedEvent, codec: Codec = JSON) -> RawEvent:
     metadata = json.loads(from_entry.metadata.decode("utf-8"))
     position = metadata[f"{ES_PREFIX}stream_position"]
-    return raw_event(from_entry, version=stream.Position(position).as_version())
+    return raw_event(
+        from_entry,
+        version=stream.Position(position).as_version(),
+        codec=codec,
+    )
 
 
-def new_entry(from_raw: RawEvent, **metadata: Any) -> NewEvent:
+def new_entry(from_raw: RawEvent, codec: Codec = JSON, **metadata: Any) -> NewEvent:
     return NewEvent(
         id=from_raw.uuid,
         type=from_raw.name,
-        data=json.dumps(from_raw.data).encode("utf-8"),
+        data=codec.encode(from_raw.data),
+        content_type=_content_type(codec),
         metadata=json.dumps(
             dict(
                 **from_raw.context,
@@ -53,10 +68,25 @@ def new_entry(from_raw: RawEvent, **metadata: Any) -> NewEvent:
     )
 
 
-def raw_record(from_entry: RecordedEvent) -> RecordedRaw:
+def raw_record(from_entry: RecordedEvent, codec: Codec = JSON) -> RecordedRaw:
     stream_name = stream.Name.from_stream_name(from_entry.stream_name)
     return RecordedRaw(
-        entry=raw_event(from_entry),
+        entry=raw_event(from_entry, codec=codec),
         position=Position(from_entry.commit_position or 0),
         tenant_id=stream_name.tenant_id,
     )
+
+
+def _content_type(codec: Codec) -> ContentType:
+    """EventStoreDB tells only JSON payloads apart, others are octet streams."""
+    return (
+        "application/json" if codec.content_type == JSON.content_type else OCTET_STREAM
+    )
+
+
+def _decoder(content_type: str, codec: Codec) -> Codec:
+    if content_type != OCTET_STREAM:
+        return codec_for(content_type, codec)
+    if _content_type(codec) == OCTET_STREAM:
+        return codec
+    return codec_for(MsgpackCodec.content_type)
@@ -1,3 +1,5 @@
+import re
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, replace
 from typing import cast
 
@@ -13,6 +15,7 @@ from event_sourcery.event_store import (
     TenantId,
     Versioning,
 )
+from event_sourcery.event_store.event.codec import JSON, Codec
 from event_sourcery.event_store.exceptions import ConcurrentStreamWriteError
 from event_sourcery.event_store.interfaces import StorageStrategy
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
@@ -24,6 +27,7 @@ class ESDBStorageStrategy(StorageStrategy):
     _client: EventStoreDBClient
     _timeout: float | None
     _tenant_id: TenantId = DEFAULT_TENANT
+    _codec: Codec = JSON
 
     def fetch_events(
         self,
@@ -44,13 +48,39 @@ class ESDBStorageStrategy(StorageStrategy):
             timeout=self._timeout,
         )
         try:
-            events = [dto.raw_event(entry) for entry in entries]
+            events = [dto.raw_event(entry, codec=self._codec) for entry in entries]
             if snapshot:
                 return [snapshot, *events]
             return events
         except NotFound:
             return []
 
+    def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> Iterator[list[RawEvent]]:
+        name = stream.Name(self._tenant_id, stream_id)
+        start = None
+        if (snapshot := self._read_snapshot(name)) is not None:
+            yield [snapshot]
+            start = cast(int, snapshot.version) + 1
+
+        while True:
+            entries = self._client.read_stream(
+                stream_name=str(name),
+                stream_position=start and stream.Position.from_version(start),
+                limit=page_size,
+                timeout=self._timeout,
+            )
+            try:
+                page = [dto.raw_event(entry, codec=self._codec) for entry in entries]
+            except NotFound:
+                return
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            start = cast(int, page[-1].version) + 1
+
     def _read_snapshot(self, name: stream.Name) -> RawEvent | None:
         snapshots = self._client.read_stream(
             name.snapshot,
@@ -60,7 +90,7 @@ class ESDBStorageStrategy(StorageStrategy):
         )
         try:
             last = next(iter(snapshots))
-            return dto.snapshot(last)
+            return dto.snapshot(last, codec=self._codec)
         except NotFound:
             return None
 
@@ -73,11 +103,20 @@ class ESDBStorageStrategy(StorageStrategy):
             stream_events = [e for e in events if e.stream_id == sid]
             self._append_events(stream_name, events=stream_events)
 
+    def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        for stream_id, (versioning, _) in streams.items():
+            self._ensure_stream(stream_id=stream_id, versioning=versioning)
+        for stream_id, (_, events) in streams.items():
+            stream_name = stream.Name(self._tenant_id, stream_id)
+            self._append_events(stream_name, events=events)
+
     def _append_events(self, name: stream.Name, events: list[RawEvent]) -> int:
         return self._client.append_events(
             str(name),
             current_version=StreamState.ANY,
-            events=(dto.new_entry(e) for e in events),
+            events=(dto.new_entry(e, codec=self._codec) for e in events),
             timeout=self._timeout,
         )
 
@@ -87,7 +126,13 @@ class ESDBStorageStrategy(StorageStrategy):
         self._client.append_events(
             name.snapshot,
             current_version=StreamState.ANY,
-            events=[dto.new_entry(snapshot, stream_position=stream_position)],
+            events=[
+                dto.new_entry(
+                    snapshot,
+                    codec=self._codec,
+                    stream_position=stream_position,
+                )
+            ],
             timeout=self._timeout,
         )
 
@@ -130,5 +175,19 @@ class ESDBStorageStrategy(StorageStrategy):
     def current_position(self) -> Position | None:
         return Position(self._client.get_commit_position(timeout=self._timeout))
 
+    @property
+    def current_tenant_position(self) -> Position | None:
+        last_events = self._client.read_all(
+            backwards=True,
+            filter_include=[f"^[^-]*-{re.escape(self._tenant_id)}-[0-9a-f]{{32}}$"],
+            filter_by_stream_name=True,
+            limit=1,
+            timeout=self._timeout,
+        )
+        last_event = next(iter(last_events), None)
+        if last_event is None or last_event.commit_position is None:
+            return None
+        return Position(last_event.commit_position)
+
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return replace(self, _tenant_id=tenant_id)
@@ -9,6 +9,7 @@ from esdbclient.exceptions import DeadlineExceeded, NotFound
 from esdbclient.persistent import AbstractPersistentSubscription
 
 from event_sourcery.event_store import RecordedRaw
+from event_sourcery.event_store.event.codec import JSON, Codec
 from event_sourcery.event_store.interfaces import (
     OutboxFiltererStrategy,
     OutboxStorageStrategy,
@@ -25,6 +26,7 @@ class ESDBOutboxStorageStrategy(OutboxStorageStrategy):
     _outbox_name: str
     _max_publish_attempts: int
     _timeout: float | None
+    _codec: Codec = JSON
     _active_subscription: AbstractPersistentSubscription = field(init=False)
 
     def create_subscription(self) -> None:
@@ -67,7 +69,7 @@ class ESDBOutboxStorageStrategy(OutboxStorageStrategy):
         with self._context(limit) as subscription:
             try:
                 for entry in subscription:
-                    record = dto.raw_record(entry)
+                    record = dto.raw_record(entry, codec=self._codec)
                     if self._filterer(record.entry):
                         yield self._publish_context(entry, record)
             except DeadlineExceeded:
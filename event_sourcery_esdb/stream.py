@@ -1,6 +1,7 @@
 import sys
 from collections import UserString
 from typing import cast
+from uuid import UUID
 
 from typing_extensions import Self
 
@@ -25,7 +26,8 @@ class Name(UserString):
             stream_name, _ = stream_name.rsplit("-", 1)
 
         category, tenant_id, id_as_hex = stream_name.split("-", 2)
-        return cls(tenant_id, StreamId(from_hex=id_as_hex, category=category or None))
+        stream_id = StreamId.trusted(UUID(hex=id_as_hex), category=category or None)
+        return cls(tenant_id, stream_id)
 
     def _as_string(self, stream_id: StreamId) -> str:
         if stream_id.category and "-" in stream_id.category:
@@ -8,7 +8,9 @@ import esdbclient.exceptions
 from esdbclient import EventStoreDBClient, RecordedEvent
 
 from event_sourcery.event_store import Position, RecordedRaw
+from event_sourcery.event_store.event.codec import JSON, Codec
 from event_sourcery.event_store.interfaces import SubscriptionStrategy
+from event_sourcery.event_store.partition import Partition
 from event_sourcery_esdb import dto
 
 
@@ -21,18 +23,22 @@ class BuilderCallable(Protocol):
 @dataclass(repr=False)
 class ESDBSubscriptionStrategy(SubscriptionStrategy):
     _client: EventStoreDBClient
+    _codec: Codec = JSON
 
-    @staticmethod
     def _iterator(
+        self,
         builder: BuilderCallable,
         size: int,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         subscription = builder()
         batch = []
         while True:
             try:
-                raw = dto.raw_record(next(subscription))
+                raw = dto.raw_record(next(subscription), codec=self._codec)
                 builder = partial(builder, commit_position=raw.position)
+                if partition and not partition.contains(raw.entry.stream_id):
+                    continue
                 batch.append(raw)
                 if len(batch) == size:
                     yield batch
@@ -47,12 +53,22 @@ class ESDBSubscriptionStrategy(SubscriptionStrategy):
         start_from: Position,
         batch_size: int,
         timelimit: timedelta,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
-        builder = partial(
-            self._client.subscribe_to_all,
-            commit_position=start_from,
-            timeout=timelimit.total_seconds(),
-        )
+        if partition is None:
+            builder = partial(
+                self._client.subscribe_to_all,
+                commit_position=start_from,
+                timeout=timelimit.total_seconds(),
+            )
+        else:
+            builder = partial(
+                self._client.subscribe_to_all,
+                commit_position=start_from,
+                timeout=timelimit.total_seconds(),
+                filter_include=[f"[^-]*-[^-]*-\\w*{_suffixes(partition)}"],
+                filter_by_stream_name=True,
+            )
         return self._iterator(builder, batch_size)
 
     def subscribe_to_category(
@@ -61,12 +77,14 @@ class ESDBSubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         category: str,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
+        stream_id = "\\w+" if partition is None else f"\\w*{_suffixes(partition)}"
         builder = partial(
             self._client.subscribe_to_all,
             commit_position=start_from,
             timeout=timelimit.total_seconds(),
-            filter_include=[f"{category}-[^-]*-\\w+"],
+            filter_include=[f"{category}-[^-]*-{stream_id}"],
             filter_by_stream_name=True,
         )
         return self._iterator(builder, batch_size)
@@ -77,6 +95,7 @@ class ESDBSubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         events: list[str],
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         builder = partial(
             self._client.subscribe_to_all,
@@ -85,4 +104,20 @@ class ESDBSubscriptionStrategy(SubscriptionStrategy):
             filter_include=events,
             filter_by_stream_name=False,
         )
-        return self._iterator(builder, batch_size)
+        # Server-side filters match either stream names or event types, so
+        # events of other partitions are skipped here
+        return self._iterator(builder, batch_size, partition)
+
+
+def _suffixes(partition: Partition) -> str:
+    """Pattern of stream UUID hex endings, whose last byte is in the partition."""
+    endings = []
+    for high in range(16):
+        lows = [
+            low
+            for low in range(16)
+            if (high * 16 + low) % partition.count == partition.index
+        ]
+        if lows:
+            endings.append(f"{high:x}[{''.join(f'{low:x}' for low in lows)}]")
+    return f"(?:{'|'.join(endings)})"
@@ -2,42 +2,97 @@ __all__ = [
     "Config",
     "configure_models",
     "models",
+    "SqlAlchemyAsyncStorageStrategy",
     "SqlAlchemyStorageStrategy",
+    "SQLAlchemyAsyncBackendFactory",
     "SQLAlchemyBackendFactory",
 ]
 
-from dataclasses import dataclass, field
+from asyncio import AbstractEventLoop
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from pydantic import BaseModel, ConfigDict, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, model_validator
+from sqlalchemy import Engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing_extensions import Self
 
 from event_sourcery import event_store as es
 from event_sourcery.event_store import (
+    AsyncBackend,
+    AsyncEventStore,
     BackendFactory,
     Dispatcher,
     Event,
     EventRegistry,
     EventStore,
+    PostCommitDispatcher,
     TransactionalBackend,
 )
-from event_sourcery.event_store.event import Serde
+from event_sourcery.event_store.event import Compression, Serde
 from event_sourcery.event_store.factory import NoOutboxStorageStrategy, no_filter
+from event_sourcery.event_store.head_position import HeadPosition
 from event_sourcery.event_store.interfaces import OutboxFiltererStrategy
 from event_sourcery.event_store.outbox import Outbox
+from event_sourcery.event_store.polling import (
+    PollingPolicy,
+    with_gap_retry_interval_as_polling,
+)
 from event_sourcery_sqlalchemy import models
-from event_sourcery_sqlalchemy.event_store import SqlAlchemyStorageStrategy
+from event_sourcery_sqlalchemy.checkpoints import SqlAlchemyCheckpointStorageStrategy
+from event_sourcery_sqlalchemy.event_store import (
+    SqlAlchemyAsyncStorageStrategy,
+    SqlAlchemyStorageStrategy,
+)
+from event_sourcery_sqlalchemy.event_types import EventTypes
 from event_sourcery_sqlalchemy.models import configure_models
+from event_sourcery_sqlalchemy.notifications import notifications_for
+from event_sourcery_sqlalchemy.on_commit import SessionOnCommit
 from event_sourcery_sqlalchemy.outbox import SqlAlchemyOutboxStorageStrategy
-from event_sourcery_sqlalchemy.subscription import SqlAlchemySubscriptionStrategy
+from event_sourcery_sqlalchemy.subscription import (
+    SqlAlchemyAsyncSubscriptionStrategy,
+    SqlAlchemySubscriptionStrategy,
+)
 
 
 class Config(BaseModel):
     model_config = ConfigDict(extra="forbid", frozen=True)
 
     outbox_attempts: PositiveInt = 3
-    gap_retry_interval: timedelta = timedelta(seconds=0.5)
+    polling: PollingPolicy = PollingPolicy()
+    head_position_ttl: timedelta = timedelta(seconds=1)
+    trusted_deserialization: bool = False
+    compression: Compression | None = None
+    notify_channel: str | None = Field(default=None, pattern=r"^[a-z_][a-z0-9_]*$")
+
+    @model_validator(mode="before")
+    @classmethod
+    def deprecated_gap_retry_interval(cls, data: Any) -> Any:
+        return with_gap_retry_interval_as_polling(data)
+
+
+def _notify_channel(session: Session, config: Config) -> str | None:
+    if config.notify_channel is None:
+        return None
+    if session.get_bind().dialect.name != "postgresql":
+        return None
+    return config.notify_channel
+
+
+_head_positions: WeakKeyDictionary[Engine, dict[timedelta, HeadPosition]] = (
+    WeakKeyDictionary()
+)
+
+
+def _head_position(session: Session, config: Config) -> HeadPosition:
+    """Cache of head positions shared by all backends of the session's engine."""
+    positions = _head_positions.setdefault(session.get_bind().engine, {})
+    ttl = config.head_position_ttl
+    return positions.setdefault(ttl, HeadPosition(ttl))
 
 
 @dataclass(repr=False)
@@ -46,16 +101,26 @@ class SQLAlchemyBackendFactory(BackendFactory):
     _config: Config = field(default_factory=Config)
     _serde: Serde = field(default_factory=lambda: Serde(Event.__registry__))
     _outbox_strategy: SqlAlchemyOutboxStorageStrategy | None = None
+    _event_types: EventTypes = field(default_factory=EventTypes)
+    _post_commit_executor: Executor | AbstractEventLoop | None = None
 
     def build(self) -> TransactionalBackend:
+        notify_channel = _notify_channel(self._session, self._config)
         backend = TransactionalBackend()
-        backend.serde = self._serde
-        backend.in_transaction = Dispatcher(backend.serde)
+        backend.serde = replace(
+            self._serde,
+            trusted=self._config.trusted_deserialization,
+            compression=self._config.compression,
+        )
+        backend.in_transaction = self._dispatcher(backend.serde)
         backend.event_store = EventStore(
             SqlAlchemyStorageStrategy(
                 self._session,
                 backend.in_transaction,
                 self._outbox_strategy,
+                _event_types=self._event_types,
+                _head=_head_position(self._session, self._config),
+                _notify_channel=notify_channel,
             ),
             backend.serde,
         )
@@ -66,7 +131,14 @@ class SQLAlchemyBackendFactory(BackendFactory):
         backend.subscriber = es.subscription.SubscriptionBuilder(
             _serde=backend.serde,
             _strategy=SqlAlchemySubscriptionStrategy(
-                self._session, self._config.gap_retry_interval
+                self._session,
+                self._config.polling,
+                None
+                if notify_channel is None
+                else notifications_for(self._session.get_bind().engine, notify_channel),
+            ),
+            _checkpoints=SqlAlchemyCheckpointStorageStrategy(
+                self._session.get_bind().engine
             ),
         )
         return backend
@@ -86,3 +158,95 @@ class SQLAlchemyBackendFactory(BackendFactory):
     def without_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
         self._outbox_strategy = None
         return self
+
+    def with_post_commit_dispatch(self, executor: Executor | AbstractEventLoop) -> Self:
+        """Delivers records to `in_transaction` listeners after commit."""
+        self._post_commit_executor = executor
+        return self
+
+    def _dispatcher(self, serde: Serde) -> Dispatcher:
+        if self._post_commit_executor is None:
+            return Dispatcher(serde)
+        return PostCommitDispatcher(
+            serde, self._post_commit_executor, SessionOnCommit.of(self._session)
+        )
+
+
+@dataclass(repr=False)
+class SQLAlchemyAsyncBackendFactory:
+    """Configures AsyncEventStore working on SQLAlchemy's AsyncSession.
+
+    Outbox entries are stored along with events, publishing them is done
+    with a synchronous backend (see `SQLAlchemyBackendFactory`)."""
+
+    _session: AsyncSession
+    _config: Config = field(default_factory=Config)
+    _serde: Serde = field(default_factory=lambda: Serde(Event.__registry__))
+    _outbox_strategy: SqlAlchemyOutboxStorageStrategy | None = None
+    _event_types: EventTypes = field(default_factory=EventTypes)
+    _post_commit_executor: Executor | AbstractEventLoop | None = None
+
+    def build(self) -> AsyncBackend:
+        backend = AsyncBackend()
+        backend.serde = replace(
+            self._serde,
+            trusted=self._config.trusted_deserialization,
+            compression=self._config.compression,
+        )
+        backend.in_transaction = self._dispatcher(backend.serde)
+        backend.event_store = AsyncEventStore(
+            SqlAlchemyAsyncStorageStrategy(
+                self._session,
+                SqlAlchemyStorageStrategy(
+                    self._session.sync_session,
+                    backend.in_transaction,
+                    self._outbox_strategy,
+                    _event_types=self._event_types,
+                    _head=_head_position(self._session.sync_session, self._config),
+                    _notify_channel=_notify_channel(
+                        self._session.sync_session, self._config
+                    ),
+                ),
+            ),
+            backend.serde,
+        )
+        backend.subscriber = es.subscription.SubscriptionBuilder(
+            _serde=backend.serde,
+            _async_strategy=SqlAlchemyAsyncSubscriptionStrategy(
+                self._session, self._config.polling
+            ),
+            _checkpoints=SqlAlchemyCheckpointStorageStrategy(
+                self._session.sync_session.get_bind().engine
+            ),
+        )
+        return backend
+
+    def with_event_registry(self, event_registry: EventRegistry) -> Self:
+        self._serde = Serde(event_registry)
+        return self
+
+    def with_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
+        self._outbox_strategy = SqlAlchemyOutboxStorageStrategy(
+            self._session.sync_session,
+            filterer,
+            self._config.outbox_attempts,
+        )
+        return self
+
+    def without_outbox(self, filterer: OutboxFiltererStrategy = no_filter) -> Self:
+        self._outbox_strategy = None
+        return self
+
+    def with_post_commit_dispatch(self, executor: Executor | AbstractEventLoop) -> Self:
+        """Delivers records to `in_transaction` listeners after commit."""
+        self._post_commit_executor = executor
+        return self
+
+    def _dispatcher(self, serde: Serde) -> Dispatcher:
+        if self._post_commit_executor is None:
+            return Dispatcher(serde)
+        return PostCommitDispatcher(
+            serde,
+            self._post_commit_executor,
+            SessionOnCommit.of(self._session.sync_session),
+        )
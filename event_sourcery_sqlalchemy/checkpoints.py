@@ -0,0 +1,86 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from functools import cache
+from typing import TypeVar
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+from sqlalchemy.util import greenlet_spawn
+
+from event_sourcery.event_store import Position
+from event_sourcery.event_store.interfaces import CheckpointStorageStrategy
+from event_sourcery_sqlalchemy.models import SubscriptionCheckpoint
+
+TResult = TypeVar("TResult")
+
+
+class SqlAlchemyCheckpointStorageStrategy(CheckpointStorageStrategy):
+    """Saves checkpoints in own sessions, committed apart from the subscriber.
+
+    Checkpoints are loaded and saved synchronously, so with async drivers the
+    sessions run in an event loop of a thread of their own, on an engine made
+    once for the engine of subscribers. Connections of those drivers are bound
+    to the loop they were made in, so they aren't pooled with connections of
+    the subscriber.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        if engine.dialect.is_async:
+            engine = _checkpoint_engine(engine)
+        self._engine = engine
+
+    def load(self, name: str) -> Position | None:
+        return self._run(self._load, name)
+
+    def save(self, name: str, position: Position) -> None:
+        self._run(self._save, name, position)
+
+    def _load(self, name: str) -> Position | None:
+        with Session(self._engine) as session:
+            checkpoint = session.get(SubscriptionCheckpoint, name)
+            return None if checkpoint is None else Position(checkpoint.position)
+
+    def _save(self, name: str, position: Position) -> None:
+        with Session(self._engine) as session, session.begin():
+            checkpoint = session.get(SubscriptionCheckpoint, name)
+            if checkpoint is None:
+                stmt = insert(SubscriptionCheckpoint).values(
+                    name=name,
+                    position=position,
+                )
+                session.execute(stmt)
+            else:
+                checkpoint.position = position
+
+    def _run(
+        self,
+        operation: Callable[..., TResult],
+        *args: object,
+    ) -> TResult:
+        if not self._engine.dialect.is_async:
+            return operation(*args)
+        coroutine = greenlet_spawn(operation, *args)
+        return asyncio.run_coroutine_threadsafe(coroutine, _loop()).result()
+
+
+_checkpoint_engines: WeakKeyDictionary[Engine, Engine] = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _checkpoint_engine(engine: Engine) -> Engine:
+    with _lock:
+        if engine not in _checkpoint_engines:
+            own = create_async_engine(engine.url, poolclass=NullPool)
+            _checkpoint_engines[engine] = own.sync_engine
+        return _checkpoint_engines[engine]
+
+
+@cache
+def _loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="checkpoints", daemon=True).start()
+    return loop
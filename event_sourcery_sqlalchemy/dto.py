@@ -5,10 +5,10 @@ from event_sourcery_sqlalchemy.models import Event, Stream
 def raw_event(from_entry: Event, in_stream: Stream) -> RawEvent:
     return RawEvent(
         uuid=from_entry.uuid,
-        stream_id=StreamId(
-            uuid=in_stream.uuid,
-            name=in_stream.name,
-            category=None if in_stream.category == "" else in_stream.category,
+        stream_id=StreamId.trusted(
+            in_stream.uuid,
+            in_stream.name,
+            category=in_stream.category or None,
         ),
         created_at=from_entry.created_at,
         version=from_entry.version,
@@ -1,12 +1,15 @@
-from collections.abc import Sequence
-from dataclasses import dataclass, replace
-from typing import cast
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from typing import TypeVar
 
-from more_itertools import first_true
-from sqlalchemy import delete, func, select, update
+from more_itertools import chunked
+from sqlalchemy import ColumnElement, case, delete, func, or_, select, update
 from sqlalchemy.dialects.postgresql import insert as postgresql_insert
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
 from typing_extensions import Self
 
 from event_sourcery.event_store import (
@@ -22,12 +25,27 @@ from event_sourcery.event_store.exceptions import (
     AnotherStreamWithThisNameButOtherIdExists,
     ConcurrentStreamWriteError,
 )
-from event_sourcery.event_store.interfaces import StorageStrategy
+from event_sourcery.event_store.head_position import (
+    ALL_TENANTS,
+    HeadPosition,
+    has_uncommitted_events,
+)
+from event_sourcery.event_store.interfaces import (
+    AsyncStorageStrategy,
+    StorageStrategy,
+)
 from event_sourcery.event_store.tenant_id import DEFAULT_TENANT, TenantId
+from event_sourcery_sqlalchemy.event_types import EventTypes
 from event_sourcery_sqlalchemy.models import Event as EventModel
 from event_sourcery_sqlalchemy.models import Snapshot as SnapshotModel
 from event_sourcery_sqlalchemy.models import Stream as StreamModel
+from event_sourcery_sqlalchemy.on_commit import SessionOnCommit
 from event_sourcery_sqlalchemy.outbox import SqlAlchemyOutboxStorageStrategy
+from event_sourcery_sqlalchemy.visibility import assign_transaction_id
+
+T = TypeVar("T")
+
+FETCH_MANY_CHUNK_SIZE = 500
 
 
 @dataclass(repr=False)
@@ -36,6 +54,9 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
     _dispatcher: Dispatcher
     _outbox: SqlAlchemyOutboxStorageStrategy | None = None
     _tenant_id: TenantId = DEFAULT_TENANT
+    _event_types: EventTypes = field(default_factory=EventTypes)
+    _head: HeadPosition = field(default_factory=lambda: HeadPosition(timedelta(0)))
+    _notify_channel: str | None = None
 
     def fetch_events(
         self,
@@ -100,9 +121,119 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
         ]
         return raw_dict_events
 
-    def _ensure_stream(self, stream_id: StreamId, versioning: Versioning) -> None:
-        initial_version = versioning.initial_version
+    def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> Iterator[list[RawEvent]]:
+        stream_stmt = select(StreamModel).filter_by(
+            stream_id=stream_id, tenant_id=self._tenant_id
+        )
+        stream = self._session.execute(stream_stmt).scalars().one_or_none()
+        if stream is None:
+            return
+
+        snapshot_stmt = (
+            select(SnapshotModel)
+            .filter_by(_db_stream_id=stream.id)
+            .order_by(SnapshotModel.created_at.desc())
+            .limit(1)
+        )
+        snapshot = self._session.execute(snapshot_stmt).scalars().one_or_none()
+        if snapshot is not None:
+            yield [self._raw_event(snapshot, stream_id)]
+
+        versioned = stream.version is not None
+        key = EventModel.version if versioned else EventModel.id
+        last = None
+        page_stmt = (
+            select(EventModel)
+            .filter_by(_db_stream_id=stream.id)
+            .order_by(key)
+            .limit(page_size)
+        )
+        if snapshot is not None:
+            page_stmt = page_stmt.where(EventModel.version > snapshot.version)
+        while True:
+            stmt = page_stmt if last is None else page_stmt.where(key > last)
+            page = self._session.execute(stmt).scalars().all()
+            if not page:
+                return
+            yield [self._raw_event(entry, stream_id) for entry in page]
+            last = page[-1].version if versioned else page[-1].id
+
+    @staticmethod
+    def _raw_event(entry: EventModel | SnapshotModel, stream_id: StreamId) -> RawEvent:
+        return RawEvent(
+            uuid=entry.uuid,
+            stream_id=stream_id,
+            created_at=entry.created_at,
+            version=entry.version,
+            name=entry.name,
+            data=entry.data,
+            context=entry.event_context,
+        )
+
+    def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        fetched: dict[StreamId, list[RawEvent]] = {
+            stream_id: [] for stream_id in stream_ids
+        }
+        for chunk in chunked(fetched, FETCH_MANY_CHUNK_SIZE):
+            fetched.update(self._fetch_chunk(chunk))
+        return fetched
+
+    def _fetch_chunk(
+        self, stream_ids: list[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        streams_stmt = select(StreamModel).where(
+            StreamModel.uuid.in_(stream_ids),
+            StreamModel.tenant_id == self._tenant_id,
+        )
+        streams = {
+            (stream.uuid.hex, stream.category): stream
+            for stream in self._session.execute(streams_stmt).scalars()
+        }
+        requested = {
+            stream.id: stream_id
+            for stream_id in stream_ids
+            if (stream := streams.get((stream_id.hex, stream_id.category or "")))
+        }
+        if not requested:
+            return {}
+
+        ranked_snapshots = select(
+            SnapshotModel,
+            func.row_number()
+            .over(
+                partition_by=SnapshotModel._db_stream_id,
+                order_by=SnapshotModel.created_at.desc(),
+            )
+            .label("rank"),
+        ).where(SnapshotModel._db_stream_id.in_(requested))
+        ranked = ranked_snapshots.subquery()
+        latest = select(ranked).where(ranked.c.rank == 1).subquery()
+        latest_snapshot = aliased(SnapshotModel, latest)
+        snapshots = self._session.execute(select(latest_snapshot)).scalars().all()
+
+        events_stmt = (
+            select(EventModel)
+            .outerjoin(latest, latest.c.db_stream_id == EventModel._db_stream_id)
+            .where(
+                EventModel._db_stream_id.in_(requested),
+                (latest.c.version.is_(None)) | (EventModel.version > latest.c.version),
+            )
+            .order_by(EventModel._db_stream_id, EventModel.version, EventModel.id)
+        )
+        events = self._session.execute(events_stmt).scalars().all()
+
+        entries: list[SnapshotModel | EventModel] = [*snapshots, *events]
+        fetched: dict[StreamId, list[RawEvent]] = {}
+        for entry in entries:
+            stream_id = requested[entry._db_stream_id]
+            fetched.setdefault(stream_id, []).append(self._raw_event(entry, stream_id))
+        return fetched
 
+    def _matching(self, stream_id: StreamId) -> ColumnElement[bool]:
         condition = (
             (StreamModel.uuid == stream_id)
             & (StreamModel.category == (stream_id.category or ""))
@@ -114,91 +245,154 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
                 & (StreamModel.category == (stream_id.category or ""))
                 & (StreamModel.tenant_id == self._tenant_id)
             )
-        matching_streams_stmt = select(StreamModel).where(condition)
+        return condition
+
+    def _ensure_streams(
+        self, streams: Mapping[StreamId, Versioning]
+    ) -> dict[StreamId, StreamModel]:
+        matching_streams_stmt = (
+            select(StreamModel)
+            .where(or_(*(self._matching(stream_id) for stream_id in streams)))
+            .execution_options(populate_existing=True)
+        )
         matching_streams = self._session.execute(matching_streams_stmt).scalars().all()
-        if not matching_streams:
-            ensure_stream_stmt = (
+        missing = [
+            stream_id
+            for stream_id in streams
+            if not any(
+                stream.uuid == stream_id
+                or (stream_id.name is not None and stream.name == stream_id.name)
+                for stream in matching_streams
+                if stream.category == (stream_id.category or "")
+            )
+        ]
+        if missing:
+            ensure_streams_stmt = (
                 postgresql_insert(StreamModel)
                 .values(
-                    uuid=stream_id,
-                    name=stream_id.name,
-                    category=stream_id.category or "",
-                    version=initial_version,
-                    tenant_id=self._tenant_id,
+                    [
+                        {
+                            "uuid": stream_id,
+                            "name": stream_id.name,
+                            "category": stream_id.category or "",
+                            "version": streams[stream_id].initial_version,
+                            "tenant_id": self._tenant_id,
+                        }
+                        for stream_id in missing
+                    ]
                 )
                 .on_conflict_do_nothing()
             )
-            self._session.execute(ensure_stream_stmt)
+            self._session.execute(ensure_streams_stmt)
             matching_streams = (
                 self._session.execute(matching_streams_stmt).scalars().all()
             )
 
-        if stream_id.name is not None:
-            matching_stream_with_same_name: StreamModel = [
-                stream
-                for stream in matching_streams
-                if stream.name == stream_id.name
-                and stream.category == (stream_id.category or "")
-            ].pop()
-            if matching_stream_with_same_name.stream_id != stream_id:
-                raise AnotherStreamWithThisNameButOtherIdExists()
+        models = {}
+        to_bump = []
+        for stream_id, versioning in streams.items():
+            if stream_id.name is not None:
+                matching_stream_with_same_name: StreamModel = [
+                    stream
+                    for stream in matching_streams
+                    if stream.name == stream_id.name
+                    and stream.category == (stream_id.category or "")
+                ].pop()
+                if matching_stream_with_same_name.stream_id != stream_id:
+                    raise AnotherStreamWithThisNameButOtherIdExists()
 
-        stream = cast(
-            StreamModel,
-            first_true(
-                matching_streams, pred=lambda stream: stream.stream_id == stream_id
-            ),
-        )
-        self._session.info.setdefault("strong_set", set())
-        self._session.info["strong_set"].add(stream)
+            stream = next(
+                stream for stream in matching_streams if stream.stream_id == stream_id
+            )
+            versioning.validate_if_compatible(stream.version)
 
-        versioning.validate_if_compatible(stream.version)
+            if versioning.expected_version and versioning is not NO_VERSIONING:
+                if stream.version != versioning.expected_version:
+                    raise ConcurrentStreamWriteError
+                to_bump.append((stream, versioning))
+            models[stream_id] = stream
 
-        if versioning.expected_version and versioning is not NO_VERSIONING:
-            bump_version_stmt = (
+        if to_bump:
+            bump_versions_stmt = (
                 update(StreamModel)
                 .where(
-                    StreamModel.stream_id == stream_id,
-                    StreamModel.version == versioning.expected_version,
+                    or_(
+                        *(
+                            (StreamModel.id == stream.id)
+                            & (StreamModel.version == versioning.expected_version)
+                            for stream, versioning in to_bump
+                        )
+                    )
                 )
-                .values(version=versioning.initial_version)
+                .values(
+                    version=case(
+                        {
+                            stream.id: versioning.initial_version
+                            for stream, versioning in to_bump
+                        },
+                        value=StreamModel.id,
+                    )
+                )
+                .execution_options(synchronize_session=False)
             )
-            result = self._session.execute(bump_version_stmt)
+            result = self._session.execute(bump_versions_stmt)
 
-            if result.rowcount != 1:
+            if result.rowcount != len(to_bump):
                 # optimistic lock failed
                 raise ConcurrentStreamWriteError
 
+            for stream, versioning in to_bump:
+                set_committed_value(stream, "version", versioning.initial_version)
+
+        return models
+
     def insert_events(
         self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
     ) -> None:
-        self._ensure_stream(stream_id=stream_id, versioning=versioning)
+        self.insert_many({stream_id: (versioning, events)})
+
+    def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        if not streams:
+            return
 
-        stream = cast(
-            StreamModel,
-            first_true(
-                self._session.info["strong_set"],
-                pred=lambda model: isinstance(model, StreamModel)
-                and model.stream_id == stream_id
-                and model.tenant_id == self._tenant_id,
-            ),
+        models = self._ensure_streams(
+            {stream_id: versioning for stream_id, (versioning, _) in streams.items()}
         )
 
-        entries = [
-            EventModel(
+        events = [
+            event for _, stream_events in streams.values() for event in stream_events
+        ]
+        type_ids = self._event_types.ids_for(
+            self._session, {event.name for event in events}
+        )
+        assign_transaction_id(self._session)
+        entries = []
+        for event in events:
+            stream = models[event.stream_id]
+            entry = EventModel(
                 uuid=event.uuid,
                 created_at=event.created_at,
-                name=event.name,
+                type_id=type_ids[event.name],
                 data=event.data,
                 event_context=event.context,
                 version=event.version,
+                category=stream.category,
+                tenant_id=stream.tenant_id,
             )
-            for event in events
-        ]
-        stream.events.extend(entries)
+            entry.stream = stream
+            entries.append(entry)
+        self._session.add_all(entries)
         self._session.flush()
+        head = max(entry.id for entry in entries)
+        self._on_commit(self._head.advancing(self._tenant_id, head))
+        if self._notify_channel is not None:
+            self._session.execute(
+                select(func.pg_notify(self._notify_channel, str(head)))
+            )
         records = [
-            RecordedRaw(entry=raw, position=db.id, tenant_id=db.tenant_id)
+            RecordedRaw(entry=raw, position=db.id, tenant_id=self._tenant_id)
             for raw, db in zip(events, entries, strict=False)
         ]
         if self._outbox:
@@ -235,9 +429,96 @@ class SqlAlchemyStorageStrategy(StorageStrategy):
 
     @property
     def current_position(self) -> Position | None:
+        if has_uncommitted_events(self._on_commit.pending):
+            return self._fetch_position()
+        return self._head.get(ALL_TENANTS, self._fetch_position)
+
+    @property
+    def current_tenant_position(self) -> Position | None:
+        if has_uncommitted_events(self._on_commit.pending):
+            return self._fetch_tenant_position()
+        return self._head.get(self._tenant_id, self._fetch_tenant_position)
+
+    @property
+    def _on_commit(self) -> SessionOnCommit:
+        return SessionOnCommit.of(self._session)
+
+    def _fetch_position(self) -> Position:
         stmt = select(func.max(EventModel.id))
         last_event = self._session.scalar(stmt)
         return last_event or Position(0)
 
+    def _fetch_tenant_position(self) -> Position:
+        stmt = select(func.max(EventModel.id)).where(
+            EventModel.tenant_id == self._tenant_id
+        )
+        last_event = self._session.scalar(stmt)
+        return last_event or Position(0)
+
     def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
         return replace(self, _tenant_id=tenant_id)
+
+
+@dataclass(repr=False)
+class SqlAlchemyAsyncStorageStrategy(AsyncStorageStrategy):
+    """Runs `SqlAlchemyStorageStrategy` on top of `AsyncSession`.
+
+    Given strategy has to be bound to `session.sync_session`. Each call is executed
+    with `AsyncSession.run_sync`, so the database IO goes through the async driver
+    and does not block the event loop.
+    """
+
+    _session: AsyncSession
+    _strategy: SqlAlchemyStorageStrategy
+
+    async def _run(self, call: Callable[[], T]) -> T:
+        return await self._session.run_sync(lambda _: call())
+
+    async def fetch_events(
+        self,
+        stream_id: StreamId,
+        start: int | None = None,
+        stop: int | None = None,
+    ) -> list[RawEvent]:
+        return await self._run(
+            lambda: self._strategy.fetch_events(stream_id, start=start, stop=stop)
+        )
+
+    async def fetch_events_many(
+        self, stream_ids: Sequence[StreamId]
+    ) -> dict[StreamId, list[RawEvent]]:
+        return await self._run(lambda: self._strategy.fetch_events_many(stream_ids))
+
+    async def fetch_pages(
+        self, stream_id: StreamId, page_size: int
+    ) -> AsyncIterator[list[RawEvent]]:
+        pages = self._strategy.fetch_pages(stream_id, page_size)
+        while (page := await self._run(lambda: next(pages, None))) is not None:
+            yield page
+
+    async def insert_events(
+        self, stream_id: StreamId, versioning: Versioning, events: list[RawEvent]
+    ) -> None:
+        await self._run(
+            lambda: self._strategy.insert_events(stream_id, versioning, events)
+        )
+
+    async def insert_many(
+        self, streams: Mapping[StreamId, tuple[Versioning, list[RawEvent]]]
+    ) -> None:
+        await self._run(lambda: self._strategy.insert_many(streams))
+
+    async def save_snapshot(self, snapshot: RawEvent) -> None:
+        await self._run(lambda: self._strategy.save_snapshot(snapshot))
+
+    async def delete_stream(self, stream_id: StreamId) -> None:
+        await self._run(lambda: self._strategy.delete_stream(stream_id))
+
+    async def current_position(self) -> Position | None:
+        return await self._run(lambda: self._strategy.current_position)
+
+    async def current_tenant_position(self) -> Position | None:
+        return await self._run(lambda: self._strategy.current_tenant_position)
+
+    def scoped_for_tenant(self, tenant_id: TenantId) -> Self:
+        return replace(self, _strategy=self._strategy.scoped_for_tenant(tenant_id))
@@ -0,0 +1,71 @@
+from collections.abc import Collection
+
+from sqlalchemy import Connection, event, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.orm import Session, SessionTransaction
+
+from event_sourcery_sqlalchemy.models import EventType
+
+
+class EventTypes:
+    """Caches ids of event names from the event types dictionary table.
+
+    Missing names are registered in a short transaction of their own, which is
+    committed before their ids are used. Writers of the same new name don't
+    wait for each other's transactions then, and only ids of committed rows
+    are cached. SQLite allows a single writer at a time, so there names are
+    registered in the transaction of the session, and their ids are cached
+    once it commits.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+
+    def ids_for(self, session: Session, names: Collection[str]) -> dict[str, int]:
+        ids = {name: self._ids[name] for name in names if name in self._ids}
+        missing = [name for name in names if name not in ids]
+        if missing:
+            ids.update(self._register(session, missing))
+        return ids
+
+    def _register(self, session: Session, names: list[str]) -> dict[str, int]:
+        bind = session.get_bind()
+        if bind.dialect.name == "sqlite":
+            pending = self._pending(session)
+            if unknown := [name for name in names if name not in pending]:
+                pending.update(self._insert(session.connection(), unknown))
+            return {name: pending[name] for name in names}
+
+        with bind.engine.begin() as connection:
+            ids = self._insert(connection, names)
+        self._ids.update(ids)
+        return ids
+
+    @staticmethod
+    def _insert(connection: Connection, names: list[str]) -> dict[str, int]:
+        connection.execute(
+            postgresql_insert(EventType)
+            .values([{"name": name} for name in names])
+            .on_conflict_do_nothing()
+        )
+        rows = connection.execute(
+            select(EventType.name, EventType.id).where(EventType.name.in_(names))
+        )
+        return dict(rows.tuples().all())
+
+    def _pending(self, session: Session) -> dict[str, int]:
+        """Ids registered in the transaction of the session, not committed yet."""
+        if self not in session.info:
+            session.info[self] = {}
+            event.listen(session, "after_commit", self._commit)
+            event.listen(session, "after_soft_rollback", self._rollback)
+        pending: dict[str, int] = session.info[self]
+        return pending
+
+    def _commit(self, session: Session) -> None:
+        if not session.in_nested_transaction():
+            self._ids.update(session.info[self])
+            session.info[self].clear()
+
+    def _rollback(self, session: Session, transaction: SessionTransaction) -> None:
+        session.info[self].clear()
@@ -32,7 +32,15 @@ from event_sourcery_sqlalchemy.jsonb import JSONB
 
 
 def configure_models(base: type[Any]) -> None:
-    for model_cls in (Stream, Event, Snapshot, OutboxEntry, ProjectorCursor):
+    for model_cls in (
+        Stream,
+        EventType,
+        Event,
+        Snapshot,
+        OutboxEntry,
+        ProjectorCursor,
+        SubscriptionCheckpoint,
+    ):
         registry(metadata=base.metadata, class_registry={}).map_declaratively(model_cls)
 
 
@@ -74,7 +82,7 @@ class Stream:
 
     @hybrid_property
     def stream_id(self) -> StreamId:
-        return StreamId(self.uuid, self.name, category=self.category or None)
+        return StreamId.trusted(self.uuid, self.name, category=self.category or None)
 
     @stream_id.inplace.comparator
     @classmethod
@@ -82,6 +90,15 @@ class Stream:
         return StreamIdComparator(cls.uuid, cls.name, cls.category)
 
 
+class EventType:
+    """Dictionary of event names, so events refer to them by small ids."""
+
+    __tablename__ = "event_sourcery_event_types"
+
+    id = mapped_column(Integer(), primary_key=True)
+    name = mapped_column(String(200), nullable=False, unique=True)
+
+
 class Event:
     __tablename__ = "event_sourcery_events"
     __table_args__ = (
@@ -91,23 +108,30 @@ class Event:
             "version",
             unique=True,
         ),
+        Index("ix_events_type_id_id", "type_id", "id"),
+        Index("ix_events_category_id", "category", "id"),
+        Index("ix_events_tenant_id_id", "tenant_id", "id"),
     )
 
     def __init__(
         self,
         uuid: UUID,
         created_at: datetime,
-        name: str,
+        type_id: int,
         data: dict,
         event_context: dict,
         version: int | None,
+        category: str,
+        tenant_id: TenantId,
     ) -> None:
         self.uuid = uuid
         self.created_at = created_at
-        self.name = name
+        self._type_id = type_id
         self.data = data
         self.event_context = event_context
         self.version = version
+        self.category = category
+        self.tenant_id = tenant_id
 
     id = mapped_column(BigInteger().with_variant(Integer(), "sqlite"), primary_key=True)
     version = mapped_column(Integer(), nullable=True)
@@ -121,8 +145,17 @@ class Event:
     )
     stream: Mapped[Stream] = relationship(Stream, back_populates="events")
     stream_id: AssociationProxy[StreamId] = association_proxy("stream", "stream_id")
-    tenant_id: AssociationProxy[TenantId] = association_proxy("stream", "tenant_id")
-    name = mapped_column(String(200), nullable=False)
+    # Copied from the stream, so subscriptions filter events without a join
+    category = mapped_column(String(255), nullable=False, default="")
+    tenant_id = mapped_column(String(255), nullable=False)
+    _type_id = mapped_column(
+        "type_id",
+        Integer(),
+        ForeignKey(EventType.id),
+        nullable=False,
+    )
+    type: Mapped[EventType] = relationship(EventType, lazy="joined", innerjoin=True)
+    name: AssociationProxy[str] = association_proxy("type", "name")
     data = mapped_column(JSONB(), nullable=False)
     event_context = mapped_column(JSONB(), nullable=False)
     created_at = mapped_column(DateTime(), nullable=False, index=True)
@@ -194,5 +227,12 @@ class ProjectorCursor:
     version = mapped_column(BigInteger(), nullable=False)
 
 
+class SubscriptionCheckpoint:
+    __tablename__ = "event_sourcery_subscription_checkpoints"
+
+    name = mapped_column(String(255), primary_key=True)
+    position = mapped_column(BigInteger(), nullable=False)
+
+
 Stream.events = relationship(Event, back_populates="stream")
 Stream.snapshots = relationship(Snapshot, back_populates="stream")
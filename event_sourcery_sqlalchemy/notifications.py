@@ -0,0 +1,111 @@
+import logging
+import select
+import threading
+import time
+import weakref
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine
+
+from event_sourcery.event_store.polling import Wakeups
+
+logger = logging.getLogger(__name__)
+
+
+class Notifications(Wakeups):
+    """Wakes subscriptions up on PostgreSQL NOTIFY on the channel.
+
+    Notifications are received by a daemon thread with its own psycopg or
+    psycopg2 connection, shared by all subscriptions of the engine. If the
+    connection breaks, subscriptions fall back to polling until it is
+    listened to again, retried after a backoff growing up to a minute. The
+    thread stops once the engine is garbage collected.
+    """
+
+    _max_backoff = 60.0
+
+    def __init__(self, engine: Engine, channel: str) -> None:
+        self._engine = weakref.ref(engine)
+        self._channel = channel
+        self._generation = 0
+        self._notified = threading.Condition()
+        self._listener: threading.Thread | None = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    @property
+    def generation(self) -> int:
+        with self._notified:
+            if self._listener is None and time.monotonic() >= self._retry_at:
+                self._listener = threading.Thread(target=self._listen, daemon=True)
+                self._listener.start()
+            return self._generation
+
+    def wait(self, generation: int, timeout: float) -> None:
+        with self._notified:
+            self._notified.wait_for(lambda: self._generation != generation, timeout)
+
+    def _listen(self) -> None:
+        try:
+            connection = self._connect()
+            if connection is None:
+                return
+            try:
+                self._receive(connection)
+            finally:
+                connection.close()
+        except Exception:
+            logger.exception("Stopped listening to %r channel", self._channel)
+            with self._notified:
+                self._failures += 1
+                backoff = min(2.0**self._failures, self._max_backoff)
+                self._retry_at = time.monotonic() + backoff
+        finally:
+            with self._notified:
+                self._listener = None
+
+    def _connect(self) -> Any:
+        engine = self._engine()
+        if engine is None:
+            return None
+        connection = engine.raw_connection()
+        driver_connection = connection.driver_connection
+        connection.detach()
+        return driver_connection
+
+    def _receive(self, connection: Any) -> None:
+        connection.autocommit = True
+        with connection.cursor() as cursor:
+            cursor.execute(f'LISTEN "{self._channel}"')
+        with self._notified:
+            self._failures = 0
+        while self._engine() is not None:
+            if callable(connection.notifies):
+                for _ in connection.notifies(timeout=60):
+                    self._advance()
+            else:
+                select.select([connection], [], [], 60)
+                connection.poll()
+                if connection.notifies:
+                    connection.notifies.clear()
+                    self._advance()
+
+    def _advance(self) -> None:
+        with self._notified:
+            self._generation += 1
+            self._notified.notify_all()
+
+
+_notifications: WeakKeyDictionary[Engine, dict[str, Notifications]] = (
+    WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def notifications_for(engine: Engine, channel: str) -> Notifications:
+    with _lock:
+        channels = _notifications.setdefault(engine, {})
+        if channel not in channels:
+            channels[channel] = Notifications(engine, channel)
+        return channels[channel]
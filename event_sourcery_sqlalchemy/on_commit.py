@@ -0,0 +1,68 @@
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+from typing_extensions import Self
+
+
+class SessionOnCommit:
+    """Runs callbacks after the session commits, drops them on its rollback.
+
+    Used as `on_commit` of `PostCommitDispatcher`. Callbacks are queued for
+    the innermost savepoint or the outermost transaction. Releasing a
+    savepoint passes its callbacks on to the enclosing transaction, rolling
+    it back drops only them. Get it with `of`, so hooks are registered once
+    per session however many backends are built for it.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+        self._callbacks: dict[SessionTransaction, list[Callable[[], None]]] = {}
+        event.listen(session, "after_commit", self._commit)
+        event.listen(session, "after_transaction_end", self._end)
+
+    @classmethod
+    def of(cls, session: Session) -> Self:
+        if cls not in session.info:
+            session.info[cls] = cls(session)
+        on_commit: Self = session.info[cls]
+        return on_commit
+
+    def __call__(self, callback: Callable[[], None]) -> None:
+        transaction = self._current()
+        if transaction is None:
+            callback()
+        else:
+            self._callbacks.setdefault(transaction, []).append(callback)
+
+    @property
+    def pending(self) -> list[Callable[[], None]]:
+        """Callbacks waiting for the commit, of all open transactions."""
+        return [callback for queued in self._callbacks.values() for callback in queued]
+
+    def _current(self) -> SessionTransaction | None:
+        return self._session.get_nested_transaction() or self._session.get_transaction()
+
+    def _commit(self, session: Session) -> None:
+        transaction = self._current()
+        if transaction is None:
+            return
+        callbacks = self._callbacks.pop(transaction, [])
+        if transaction.nested:
+            self._callbacks.setdefault(_enclosing(transaction), []).extend(callbacks)
+            return
+        for callback in callbacks:
+            callback()
+
+    def _end(self, session: Session, transaction: SessionTransaction) -> None:
+        # Callbacks of committed transactions are gone already
+        self._callbacks.pop(transaction, None)
+
+
+def _enclosing(savepoint: SessionTransaction) -> SessionTransaction:
+    transaction = savepoint.parent
+    while transaction is not None:
+        if transaction.nested or transaction.parent is None:
+            return transaction
+        transaction = transaction.parent
+    raise ValueError("Savepoint has no enclosing transaction")
@@ -1,31 +1,52 @@
+import asyncio
 import time
-from collections.abc import Iterator
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Iterable, Iterator
 from datetime import timedelta
-from typing import Protocol, cast
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from event_sourcery.event_store import Position, RecordedRaw
-from event_sourcery.event_store.interfaces import SubscriptionStrategy
+from event_sourcery.event_store.gap_detection import (
+    GapDetectingIterator,
+    GapDetection,
+    GetBatch,
+    Visibility,
+)
+from event_sourcery.event_store.interfaces import (
+    AsyncSubscriptionStrategy,
+    SubscriptionStrategy,
+)
+from event_sourcery.event_store.partition import Partition
+from event_sourcery.event_store.polling import PollingPolicy, Wakeups
 from event_sourcery_sqlalchemy import dto, models
+from event_sourcery_sqlalchemy.visibility import visibility_for
 
 
 class SqlAlchemySubscriptionStrategy(SubscriptionStrategy):
-    def __init__(self, session: Session, gap_retry_interval: timedelta) -> None:
+    def __init__(
+        self,
+        session: Session,
+        polling: PollingPolicy,
+        wakeups: Wakeups | None = None,
+    ) -> None:
         self._session = session
-        self._gap_retry_interval = gap_retry_interval
+        self._polling = polling
+        self._wakeups = wakeups or Wakeups()
 
     def subscribe_to_all(
         self,
         start_from: Position,
         batch_size: int,
         timelimit: timedelta,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         return GapDetectingIterator(
-            get_batch=GetBatchToAll(self._session, batch_size),
-            gap_retry_interval=self._gap_retry_interval,
+            get_batch=GetBatchToAll(self._session, batch_size, partition),
+            polling=self._polling,
+            wakeups=self._wakeups,
+            visibility=visibility_for(self._session),
             start_from=start_from,
             batch_size=batch_size,
             timelimit=timelimit,
@@ -37,10 +58,15 @@ class SqlAlchemySubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         category: str,
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         return GapDetectingIterator(
-            get_batch=GetBatchToCategory(self._session, batch_size, category),
-            gap_retry_interval=self._gap_retry_interval,
+            get_batch=GetBatchToCategory(
+                self._session, batch_size, category, partition
+            ),
+            polling=self._polling,
+            wakeups=self._wakeups,
+            visibility=visibility_for(self._session),
             start_from=start_from,
             batch_size=batch_size,
             timelimit=timelimit,
@@ -52,126 +78,220 @@ class SqlAlchemySubscriptionStrategy(SubscriptionStrategy):
         batch_size: int,
         timelimit: timedelta,
         events: list[str],
+        partition: Partition | None = None,
     ) -> Iterator[list[RecordedRaw]]:
         return GapDetectingIterator(
-            get_batch=GetBatchToEvents(self._session, batch_size, events),
-            gap_retry_interval=self._gap_retry_interval,
+            get_batch=GetBatchToEvents(self._session, batch_size, events, partition),
+            polling=self._polling,
+            wakeups=self._wakeups,
+            visibility=visibility_for(self._session),
             start_from=start_from,
             batch_size=batch_size,
             timelimit=timelimit,
         )
 
 
-class GetBatch(Protocol):
-    def __call__(self, position: Position) -> list[models.Event]: ...
+class SqlAlchemyAsyncSubscriptionStrategy(AsyncSubscriptionStrategy):
+    """Polls for events through `AsyncSession` without blocking the loop."""
+
+    def __init__(self, session: AsyncSession, polling: PollingPolicy) -> None:
+        self._session = session
+        self._polling = polling
+
+    def subscribe_to_all(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return AsyncGapDetectingIterator(
+            session=self._session,
+            get_batch=GetBatchToAll(self._session.sync_session, batch_size, partition),
+            polling=self._polling,
+            visibility=visibility_for(self._session.sync_session),
+            start_from=start_from,
+            batch_size=batch_size,
+            timelimit=timelimit,
+        )
+
+    def subscribe_to_category(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        category: str,
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return AsyncGapDetectingIterator(
+            session=self._session,
+            get_batch=GetBatchToCategory(
+                self._session.sync_session, batch_size, category, partition
+            ),
+            polling=self._polling,
+            visibility=visibility_for(self._session.sync_session),
+            start_from=start_from,
+            batch_size=batch_size,
+            timelimit=timelimit,
+        )
+
+    def subscribe_to_events(
+        self,
+        start_from: Position,
+        batch_size: int,
+        timelimit: timedelta,
+        events: list[str],
+        partition: Partition | None = None,
+    ) -> AsyncIterator[list[RecordedRaw]]:
+        return AsyncGapDetectingIterator(
+            session=self._session,
+            get_batch=GetBatchToEvents(
+                self._session.sync_session, batch_size, events, partition
+            ),
+            polling=self._polling,
+            visibility=visibility_for(self._session.sync_session),
+            start_from=start_from,
+            batch_size=batch_size,
+            timelimit=timelimit,
+        )
 
 
 class GetBatchToAll(GetBatch):
-    def __init__(self, session: Session, batch_size: int) -> None:
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int,
+        partition: Partition | None = None,
+    ) -> None:
         self._session = session
         self._batch_size = batch_size
+        self._partition = partition
 
-    def __call__(self, position: Position) -> list[models.Event]:
+    def __call__(self, position: Position) -> list[RecordedRaw]:
         stmt = (
             select(models.Event)
-            .join(models.Stream)
+            .options(selectinload(models.Event.stream))
             .where(models.Event.id > position)
             .order_by(models.Event.id)
             .limit(self._batch_size)
         )
 
-        return list(self._session.scalars(stmt).all())
+        return _recorded(self._session.scalars(_in_partition(stmt, self._partition)))
 
 
 class GetBatchToCategory(GetBatch):
-    def __init__(self, session: Session, batch_size: int, category: str) -> None:
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int,
+        category: str,
+        partition: Partition | None = None,
+    ) -> None:
         self._session = session
         self._batch_size = batch_size
+        self._partition = partition
         self._category = category
 
-    def __call__(self, position: Position) -> list[models.Event]:
+    def __call__(self, position: Position) -> list[RecordedRaw]:
         stmt = (
             select(models.Event)
-            .join(models.Stream)
-            .where(models.Stream.category == self._category)
+            .options(selectinload(models.Event.stream))
+            .where(models.Event.category == self._category)
             .where(models.Event.id > position)
             .order_by(models.Event.id)
             .limit(self._batch_size)
         )
 
-        return list(self._session.scalars(stmt).all())
+        return _recorded(self._session.scalars(_in_partition(stmt, self._partition)))
 
 
 class GetBatchToEvents(GetBatch):
-    def __init__(self, session: Session, batch_size: int, events: list[str]) -> None:
+    def __init__(
+        self,
+        session: Session,
+        batch_size: int,
+        events: list[str],
+        partition: Partition | None = None,
+    ) -> None:
         self._session = session
         self._batch_size = batch_size
-        self._events = events
+        self._partition = partition
+        self._type_ids = select(models.EventType.id).where(
+            models.EventType.name.in_(events)
+        )
 
-    def __call__(self, position: Position) -> list[models.Event]:
+    def __call__(self, position: Position) -> list[RecordedRaw]:
         stmt = (
             select(models.Event)
-            .join(models.Stream)
-            .where(models.Event.name.in_(self._events))
+            .options(selectinload(models.Event.stream))
+            .where(models.Event._type_id.in_(self._type_ids))
             .where(models.Event.id > position)
             .order_by(models.Event.id)
             .limit(self._batch_size)
         )
 
-        return list(self._session.scalars(stmt).all())
+        return _recorded(self._session.scalars(_in_partition(stmt, self._partition)))
+
 
+def _in_partition(stmt: Select, partition: Partition | None) -> Select:
+    if partition is None:
+        return stmt
+    return stmt.where(models.Event._db_stream_id % partition.count == partition.index)
 
-@dataclass
-class Cursor:
-    position: Position
 
-    def advance(self, batch: list[models.Event]) -> None:
-        if len(batch) > 0:
-            self.position = batch[-1].id
+def _recorded(events: Iterable[models.Event]) -> list[RecordedRaw]:
+    return [
+        RecordedRaw(
+            entry=dto.raw_event(event, event.stream),
+            position=event.id,
+            tenant_id=event.tenant_id,
+        )
+        for event in events
+    ]
+
 
+class AsyncGapDetectingIterator(GapDetection, AsyncIterator[list[RecordedRaw]]):
+    """Runs polls of `GapDetection` with `AsyncSession.run_sync`.
+
+    Queries have to be bound to `session.sync_session`. Subscriptions sleep
+    on the event loop between polls.
+    """
 
-class GapDetectingIterator(Iterator[list[RecordedRaw]]):
     def __init__(
         self,
+        session: AsyncSession,
         get_batch: GetBatch,
-        gap_retry_interval: timedelta,
+        polling: PollingPolicy,
+        visibility: Visibility,
         start_from: Position,
         batch_size: int,
         timelimit: timedelta,
     ) -> None:
-        self._get_batch = get_batch
-        self._gap_retry_interval = gap_retry_interval
-        self._cursor = Cursor(position=start_from)
-        self._batch_size = batch_size
-        self._timelimit = timelimit
+        super().__init__(
+            get_batch=get_batch,
+            polling=polling,
+            visibility=visibility,
+            start_from=start_from,
+            batch_size=batch_size,
+            timelimit=timelimit,
+        )
+        self._session = session
 
-    def __next__(self) -> list[RecordedRaw]:
-        start = time.monotonic()
+    async def __anext__(self) -> list[RecordedRaw]:
+        deadline = time.monotonic() + self._timelimit.total_seconds()
+        if self._caught_up:
+            await self._polling.throttle_async()
+        received = 0
         while True:
-            batch = self._get_batch(self._cursor.position)
-            if self._is_continuous(batch) and len(batch) == self._batch_size:
-                self._cursor.advance(batch)
-                return self._batch_to_recorded_raw(batch)
-            elif time.monotonic() - start > self._timelimit.total_seconds():
-                self._cursor.advance(batch)
-                return self._batch_to_recorded_raw(batch)
+            batch, ready = await self._session.run_sync(lambda _: self._poll())
+            if len(batch) > received:
+                received = len(batch)
+                self._backoff.reset()
+            remaining = deadline - time.monotonic()
+            if ready:
+                return self._release(ready)
+            elif remaining <= 0:
+                return self._release(batch)
             else:
-                time.sleep(self._gap_retry_interval.total_seconds())
-
-    @staticmethod
-    def _is_continuous(batch: list[models.Event]) -> bool:
-        if len(batch) < 2:
-            return False
-
-        return cast(bool, batch[-1].id - batch[0].id + 1 == len(batch))
-
-    @staticmethod
-    def _batch_to_recorded_raw(batch: list[models.Event]) -> list[RecordedRaw]:
-        return [
-            RecordedRaw(
-                entry=dto.raw_event(event, event.stream),
-                position=event.id,
-                tenant_id=event.tenant_id,
-            )
-            for event in batch
-        ]
+                await asyncio.sleep(min(self._backoff.next_delay(), remaining))
+                await self._polling.throttle_async()
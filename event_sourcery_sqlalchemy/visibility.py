@@ -0,0 +1,72 @@
+from typing import cast
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from event_sourcery.event_store.gap_detection import Horizon, Visibility
+from event_sourcery_sqlalchemy import models
+
+
+class SerializedWritesVisibility(Visibility):
+    """SQLite serializes writes, so pending ids are above all visible ones."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def horizon(self) -> Horizon | None:
+        position = self._session.scalar(select(func.max(models.Event.id)))
+        return Horizon(position=position or 0)
+
+
+class PostgresVisibility(Visibility):
+    """Settles ids allocated from the sequence once their writers have ended.
+
+    Writers take their xid with `assign_transaction_id` before they take ids,
+    so the sequence, read before the snapshot, only holds ids of writers which
+    are done or listed in the snapshot. They have ended once the xmin of a
+    later snapshot passes all of them.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def horizon(self) -> Horizon | None:
+        allocated = self._session.scalar(
+            text(
+                "SELECT pg_sequence_last_value("
+                "pg_get_serial_sequence(:table, 'id')::regclass)"
+            ),
+            {"table": models.Event.__tablename__},
+        )
+        writers = self._session.scalars(
+            text("SELECT pg_snapshot_xip(pg_current_snapshot())::text::bigint")
+        ).all()
+        return Horizon(position=allocated or 0, writers=tuple(writers))
+
+    def is_settled(self, horizon: Horizon) -> bool:
+        if not horizon.writers:
+            return True
+        xmin = self._session.scalar(
+            text("SELECT pg_snapshot_xmin(pg_current_snapshot())::text::bigint")
+        )
+        return cast(int, xmin) > max(horizon.writers)
+
+
+def assign_transaction_id(session: Session) -> None:
+    """Assigns an xid to the writing transaction, on PostgreSQL only.
+
+    Has to be called before inserting events, as `nextval` doesn't assign an
+    xid and writers without one are missing from snapshots.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(text("SELECT pg_current_xact_id()"))
+
+
+def visibility_for(session: Session) -> Visibility:
+    match session.get_bind().dialect.name:
+        case "postgresql":
+            return PostgresVisibility(session)
+        case "sqlite":
+            return SerializedWritesVisibility(session)
+        case _:
+            return Visibility()
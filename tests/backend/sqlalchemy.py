@@ -1,3 +1,4 @@
+import asyncio
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
@@ -6,7 +7,9 @@ from typing import Any
 import pytest
 from sqlalchemy import MetaData, create_engine
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import as_declarative, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from event_sourcery_sqlalchemy.models import configure_models
 
@@ -53,3 +56,43 @@ def sqlalchemy_postgres() -> Iterator[sessionmaker]:
         "postgresql://es:es@localhost:5432/es"
     ) as session_factory:
         yield session_factory
+
+
+@contextmanager
+def sqlalchemy_async_session_factory(url: str) -> Iterator[async_sessionmaker]:
+    # Tables are created and dropped in event loops of their own, while tests
+    # run in another, so connections must not be pooled across them
+    engine = create_async_engine(url, poolclass=NullPool)
+
+    async def run(statement: Any) -> None:
+        async with engine.begin() as connection:
+            await connection.run_sync(statement)
+
+    try:
+        asyncio.run(run(DeclarativeBase.metadata.create_all))
+    except (OperationalError, OSError):
+        pytest.skip(f"{engine.url.drivername} test database not available, skipping")
+    else:
+        yield async_sessionmaker(engine)
+        asyncio.run(run(DeclarativeBase.metadata.drop_all))
+        asyncio.run(engine.dispose())
+
+
+@pytest.fixture()
+def sqlalchemy_async_sqlite(tmp_path: Path) -> Iterator[async_sessionmaker]:
+    pytest.importorskip("aiosqlite")
+    sqlite_file = tmp_path / "sqlite.db"
+    with sqlalchemy_async_session_factory(
+        f"sqlite+aiosqlite:///{sqlite_file}"
+    ) as session_factory:
+        yield session_factory
+    sqlite_file.unlink(missing_ok=True)
+
+
+@pytest.fixture()
+def sqlalchemy_async_postgres() -> Iterator[async_sessionmaker]:
+    pytest.importorskip("asyncpg")
+    with sqlalchemy_async_session_factory(
+        "postgresql+asyncpg://es:es@localhost:5432/es"
+    ) as session_factory:
+        yield session_factory
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from esdbclient import RecordedEvent
+
+from event_sourcery.event_store import StreamId
+from event_sourcery.event_store.event import (
+    Codec,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    RawEvent,
+)
+from event_sourcery.event_store.event.codec import codec_for
+from event_sourcery.event_store.exceptions import UnknownContentType
+from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
+from event_sourcery_esdb import dto, stream
+
+
+@pytest.fixture(params=[JsonCodec, OrjsonCodec, MsgpackCodec])
+def codec(request: pytest.FixtureRequest) -> Codec:
+    if request.param is OrjsonCodec:
+        pytest.importorskip("orjson")
+    if request.param is MsgpackCodec:
+        pytest.importorskip("msgpack")
+    return request.param()  # type: ignore[no-any-return]
+
+
+def test_decodes_what_was_encoded(codec: Codec) -> None:
+    data = {
+        "text": "zażółć gęślą jaźń",
+        "number": 2**40,
+        "fraction": 0.5,
+        "flag": True,
+        "nothing": None,
+        "items": [1, "two", {"three": 3}],
+    }
+
+    encoded = codec.encode(data)
+
+    assert isinstance(encoded, bytes)
+    assert codec.decode(encoded) == data
+
+
+def test_json_codecs_are_interchangeable() -> None:
+    pytest.importorskip("orjson")
+    data = {"text": "text", "items": [1, 2]}
+
+    assert OrjsonCodec().decode(JsonCodec().encode(data)) == data
+    assert JsonCodec().decode(OrjsonCodec().encode(data)) == data
+
+
+def test_decodes_with_codec_of_stored_content_type() -> None:
+    pytest.importorskip("msgpack")
+    data = {"text": "text", "items": [1, 2]}
+
+    codec = codec_for(MsgpackCodec.content_type, preferred=JsonCodec())
+
+    assert codec.decode(MsgpackCodec().encode(data)) == data
+
+
+def test_prefers_given_codec_for_its_content_type() -> None:
+    preferred = JsonCodec()
+
+    assert codec_for(JsonCodec.content_type, preferred=preferred) is preferred
+
+
+def test_rejects_unknown_content_type() -> None:
+    with pytest.raises(UnknownContentType):
+        codec_for("text/plain")
+
+
+@pytest.mark.parametrize(
+    "codec", [JsonCodec(), MsgpackCodec()], ids=["json", "msgpack"]
+)
+def test_esdb_decodes_payloads_stored_as_octet_streams(codec: Codec) -> None:
+    pytest.importorskip("msgpack")
+    stream_id = StreamId()
+    raw = RawEvent(
+        uuid=uuid4(),
+        stream_id=stream_id,
+        created_at=datetime.now(tz=timezone.utc),
+        name="AnEvent",
+        data={"items": [1, 2]},
+        context={},
+    )
+    entry = dto.new_entry(raw, codec=MsgpackCodec())
+    recorded = RecordedEvent(
+        type=entry.type,
+        data=entry.data,
+        metadata=entry.metadata,
+        content_type=entry.content_type,
+        id=entry.id,
+        stream_name=str(stream.Name(DEFAULT_TENANT, stream_id)),
+        stream_position=0,
+        commit_position=0,
+        prepare_position=0,
+    )
+
+    assert entry.content_type == "application/octet-stream"
+    assert dto.raw_event(recorded, codec=codec).data == raw.data
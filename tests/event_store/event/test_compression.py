@@ -0,0 +1,111 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from pydantic import BaseModel
+
+from event_sourcery.event_store import (
+    EventRegistry,
+    InMemoryBackendFactory,
+    RecordedRaw,
+    StreamId,
+    WrappedEvent,
+)
+from event_sourcery.event_store.event import Compression, Serde
+from event_sourcery.event_store.event.compression import decompress, is_compressed
+from event_sourcery.event_store.in_memory import Config
+from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
+
+
+class Document(BaseModel):
+    content: str
+
+
+@pytest.fixture()
+def registry() -> EventRegistry:
+    registry = EventRegistry()
+    registry.add(Document)  # type: ignore[arg-type]
+    return registry
+
+
+@pytest.fixture(params=["zlib", "zstd"])
+def compression(request: pytest.FixtureRequest) -> Compression:
+    if request.param == "zstd":
+        pytest.importorskip("zstandard")
+    return Compression(threshold=100, algorithm=request.param)
+
+
+def test_compresses_data_bigger_than_threshold(compression: Compression) -> None:
+    data = {"content": "a" * 1000}
+
+    compressed = compression.compress(data)
+
+    assert is_compressed(compressed)
+    assert len(str(compressed)) < len(str(data))
+    assert decompress(compressed) == data
+
+
+def test_leaves_data_not_bigger_than_threshold(compression: Compression) -> None:
+    data = {"content": "a"}
+
+    assert compression.compress(data) is data
+
+
+def test_does_not_encode_data_not_bigger_than_threshold(
+    compression: Compression,
+) -> None:
+    data = {"content": ["a" * 10, {"nested": 1}]}
+
+    with patch.object(json, "dumps") as dumps:
+        compression.compress(data)
+
+    dumps.assert_not_called()
+
+
+def test_compresses_data_with_nested_values_bigger_than_threshold(
+    compression: Compression,
+) -> None:
+    data = {"lines": [{"content": "a" * 10}] * 10}
+
+    assert is_compressed(compression.compress(data))
+
+
+def test_refuses_to_decompress_unknown_algorithm() -> None:
+    with pytest.raises(ValueError, match="lzma"):
+        decompress({"$compressed": "lzma", "$payload": ""})
+
+
+def test_deserializes_compressed_events(
+    compression: Compression,
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry, compression=compression)
+    wrapped = WrappedEvent.wrap(Document(content="a" * 1000), version=1)  # type: ignore
+
+    raw = serde.serialize(wrapped, StreamId())
+    record = serde.deserialize_record(
+        RecordedRaw(entry=raw, position=1, tenant_id=DEFAULT_TENANT)
+    )
+
+    assert is_compressed(raw.data)
+    assert serde.deserialize(raw) == wrapped
+    assert record.wrapped_event == wrapped
+
+
+def test_deserializes_compressed_events_with_compression_disabled(
+    registry: EventRegistry,
+) -> None:
+    wrapped = WrappedEvent.wrap(Document(content="a" * 1000), version=1)  # type: ignore
+    raw = Serde(registry, compression=Compression(threshold=0)).serialize(
+        wrapped, StreamId()
+    )
+
+    assert Serde(registry).deserialize(raw) == wrapped
+
+
+def test_backend_can_be_configured_to_compress_events() -> None:
+    compression = Compression(threshold=1024)
+
+    backend = InMemoryBackendFactory(_config=Config(compression=compression)).build()
+
+    assert backend.serde.compression == compression
@@ -0,0 +1,200 @@
+import dataclasses
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel, ValidationError, field_validator
+
+from event_sourcery.event_store import (
+    EventRegistry,
+    InMemoryBackendFactory,
+    LazyWrappedEvent,
+    RecordedRaw,
+    StreamId,
+    WrappedEvent,
+)
+from event_sourcery.event_store.event import Serde
+from event_sourcery.event_store.in_memory import Config
+from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
+
+
+class ScalarsOnly(BaseModel):
+    text: str
+    number: int | None = None
+
+
+class WithUuid(BaseModel):
+    some_id: UUID
+
+
+class WithValidator(BaseModel):
+    text: str
+
+    @field_validator("text")
+    @classmethod
+    def upper(cls, value: str) -> str:
+        return value.upper()
+
+
+@pytest.fixture()
+def registry() -> EventRegistry:
+    registry = EventRegistry()
+    for event_type in (ScalarsOnly, WithUuid, WithValidator):
+        registry.add(event_type)  # type: ignore[arg-type]
+    return registry
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize(
+    "event",
+    [ScalarsOnly(text="text", number=1), WithUuid(some_id=uuid4())],
+)
+def test_deserializes_what_was_serialized(
+    trusted: bool,
+    event: BaseModel,
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry, trusted=trusted)
+    wrapped = WrappedEvent.wrap(event, version=1)  # type: ignore[type-var]
+
+    raw = serde.serialize(wrapped, StreamId())
+
+    assert serde.deserialize(raw) == wrapped
+
+
+def test_trusted_mode_skips_validation_of_scalar_only_events(
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry, trusted=True)
+    raw = serde.serialize(
+        WrappedEvent.wrap(ScalarsOnly(text="text"), version=1),
+        StreamId(),
+    )
+    raw.data["number"] = "not a number"
+
+    deserialized = serde.deserialize(raw)
+
+    assert deserialized.event.number == "not a number"
+
+
+@pytest.mark.parametrize(
+    "event",
+    [WithUuid(some_id=uuid4()), WithValidator(text="TEXT")],
+)
+def test_trusted_mode_validates_events_which_can_not_be_constructed(
+    event: BaseModel,
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry, trusted=True)
+    raw = serde.serialize(
+        WrappedEvent.wrap(event, version=1),
+        StreamId(),
+    )
+
+    assert serde.deserialize(raw).event == event
+
+
+def test_deserialization_does_not_share_data_with_raw_event(
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry)
+    raw = serde.serialize(
+        WrappedEvent.wrap(ScalarsOnly(text="text"), version=1),
+        StreamId(),
+    )
+
+    deserialized = serde.deserialize(raw)
+    raw.data["text"] = "changed"
+    raw.context["correlation_id"] = str(uuid4())
+
+    assert deserialized.event.text == "text"
+    assert deserialized.context.correlation_id is None
+    assert isinstance(deserialized.created_at, datetime)
+
+
+def test_backend_can_be_configured_to_trust_its_data() -> None:
+    backend = InMemoryBackendFactory(
+        _config=Config(trusted_deserialization=True)
+    ).build()
+
+    assert backend.serde.trusted
+
+
+def test_deserialized_record_validates_event_on_first_access(
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(ScalarsOnly(text="text"), version=1)  # type: ignore
+    raw = RecordedRaw(
+        entry=serde.serialize(wrapped, StreamId()),
+        position=1,
+        tenant_id=DEFAULT_TENANT,
+    )
+
+    record = serde.deserialize_record(raw)
+
+    assert isinstance(record.wrapped_event, LazyWrappedEvent)
+    assert record.wrapped_event.event_type is ScalarsOnly
+    assert not record.wrapped_event.is_decoded
+    assert record.wrapped_event == wrapped
+    assert record.wrapped_event.is_decoded
+
+
+def test_deserialized_record_is_replaced_like_wrapped_event(
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(ScalarsOnly(text="text"), version=1)  # type: ignore
+    record = serde.deserialize_record(
+        RecordedRaw(entry=serde.serialize(wrapped, StreamId()), position=1)
+    )
+
+    replaced = dataclasses.replace(record.wrapped_event, version=2)
+
+    assert replaced.version == 2
+    assert replaced.event == wrapped.event
+    assert replaced.uuid == wrapped.uuid
+
+
+def test_deserialized_record_reports_type_of_reassigned_event(
+    registry: EventRegistry,
+) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(ScalarsOnly(text="text"), version=1)  # type: ignore
+    record = serde.deserialize_record(
+        RecordedRaw(entry=serde.serialize(wrapped, StreamId()), position=1)
+    )
+
+    record.wrapped_event.event = WithUuid(some_id=uuid4())
+
+    assert record.wrapped_event.event_type is WithUuid
+
+
+def test_invalid_event_data_is_reported_on_access(registry: EventRegistry) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(ScalarsOnly(text="text"), version=1)  # type: ignore
+    entry = serde.serialize(wrapped, StreamId())
+    entry.data["number"] = "not a number"
+
+    record = serde.deserialize_record(
+        RecordedRaw(entry=entry, position=1, tenant_id=DEFAULT_TENANT)
+    )
+
+    assert record.position == 1
+    with pytest.raises(ValidationError):
+        record.wrapped_event.event  # noqa: B018
+
+
+def test_invalid_context_is_reported_on_access(registry: EventRegistry) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(ScalarsOnly(text="text"), version=1)  # type: ignore
+    entry = serde.serialize(wrapped, StreamId())
+    entry.context["correlation_id"] = "not an uuid"
+
+    record = serde.deserialize_record(
+        RecordedRaw(entry=entry, position=1, tenant_id=DEFAULT_TENANT)
+    )
+
+    assert record.wrapped_event.event == wrapped.event
+    with pytest.raises(ValidationError):
+        record.wrapped_event.context  # noqa: B018
@@ -0,0 +1,140 @@
+from datetime import datetime
+from typing import ClassVar
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from event_sourcery.event_store import (
+    EventRegistry,
+    RawEvent,
+    RecordedRaw,
+    StreamId,
+    WrappedEvent,
+)
+from event_sourcery.event_store.event import Serde
+from event_sourcery.event_store.exceptions import MissingUpcaster, UnknownSchemaVersion
+from event_sourcery.event_store.tenant_id import DEFAULT_TENANT
+
+
+class OrderPlaced(BaseModel):
+    __schema_version__: ClassVar[int] = 3
+
+    order_id: str
+    currency: str
+    total: int
+
+
+class Renamed(BaseModel):
+    text: str
+
+
+@pytest.fixture()
+def registry() -> EventRegistry:
+    registry = EventRegistry()
+    registry.add(OrderPlaced)  # type: ignore[arg-type]
+    registry.add(Renamed)  # type: ignore[arg-type]
+
+    @registry.upcaster(OrderPlaced, version=1)  # type: ignore[arg-type]
+    def add_currency(data: dict) -> dict:
+        data["currency"] = "USD"
+        return data
+
+    @registry.upcaster(OrderPlaced, version=2)  # type: ignore[arg-type]
+    def amount_to_total(data: dict) -> dict:
+        data["total"] = data.pop("amount")
+        return data
+
+    return registry
+
+
+def a_stored(registry: EventRegistry, data: dict, schema_version: int) -> RawEvent:
+    return RawEvent(
+        uuid=uuid4(),
+        stream_id=StreamId(),
+        created_at=datetime.now(),
+        version=1,
+        name=registry.name_for_type(OrderPlaced),  # type: ignore[arg-type]
+        data=data,
+        context={"$schema_version": schema_version} if schema_version != 1 else {},
+    )
+
+
+@pytest.mark.parametrize(
+    ("data", "schema_version"),
+    [
+        ({"order_id": "#1", "amount": 10}, 1),
+        ({"order_id": "#1", "currency": "USD", "amount": 10}, 2),
+        ({"order_id": "#1", "currency": "USD", "total": 10}, 3),
+    ],
+)
+def test_upcasts_data_of_older_schema_versions(
+    data: dict,
+    schema_version: int,
+    registry: EventRegistry,
+) -> None:
+    raw = a_stored(registry, data, schema_version)
+
+    deserialized = Serde(registry).deserialize(raw)
+
+    assert deserialized.event == OrderPlaced(order_id="#1", currency="USD", total=10)
+    assert deserialized.context.model_extra == {}
+
+
+def test_upcasts_events_of_records(registry: EventRegistry) -> None:
+    raw = a_stored(registry, data := {"order_id": "#1", "amount": 10}, 1)
+
+    record = Serde(registry).deserialize_record(
+        RecordedRaw(entry=raw, position=1, tenant_id=DEFAULT_TENANT)
+    )
+
+    assert record.wrapped_event.event.total == 10
+    assert data == {"order_id": "#1", "amount": 10}
+
+
+def test_stores_schema_version_of_events(registry: EventRegistry) -> None:
+    serde = Serde(registry)
+    wrapped = WrappedEvent.wrap(
+        OrderPlaced(order_id="#1", currency="EUR", total=5),  # type: ignore[type-var]
+        version=1,
+    )
+
+    raw = serde.serialize(wrapped, StreamId())
+
+    assert raw.context["$schema_version"] == 3
+    assert serde.deserialize(raw) == wrapped
+
+
+def test_does_not_store_first_schema_version(registry: EventRegistry) -> None:
+    raw = Serde(registry).serialize(
+        WrappedEvent.wrap(Renamed(text="text"), version=1),
+        StreamId(),
+    )
+
+    assert "$schema_version" not in raw.context
+
+
+def test_does_not_compose_upcasters_for_current_version(
+    registry: EventRegistry,
+) -> None:
+    name = registry.name_for_type(OrderPlaced)  # type: ignore[arg-type]
+
+    assert registry.upcaster_for(name, 3) is None
+    assert registry.upcaster_for(name, 1) is registry.upcaster_for(name, 1)
+
+
+def test_reports_missing_upcaster(registry: EventRegistry) -> None:
+    class Changed(BaseModel):
+        __schema_version__: ClassVar[int] = 2
+
+    registry.add(Changed)  # type: ignore[arg-type]
+
+    with pytest.raises(MissingUpcaster):
+        registry.upcaster_for(registry.name_for_type(Changed), 1)  # type: ignore
+
+
+def test_reports_unknown_schema_version(registry: EventRegistry) -> None:
+    name = registry.name_for_type(OrderPlaced)  # type: ignore[arg-type]
+
+    with pytest.raises(UnknownSchemaVersion):
+        registry.upcaster_for(name, 4)
@@ -1,3 +1,8 @@
+import time
+
+import pytest
+
+from event_sourcery.event_store import StreamId
 from tests.bdd import Given, Then, When
 from tests.factories import an_event
 from tests.matchers import any_record
@@ -13,6 +18,10 @@ def test_receives_requested_batch_size(
     then(subscription).next_batch_is([any_record(first), any_record(second)])
 
 
+@pytest.mark.skip_backend(
+    backend=["django", "sqlalchemy_sqlite", "sqlalchemy_postgres"],
+    reason="Returns settled partial batch without waiting",
+)
 def test_returns_smaller_batch_when_timelimit_hits(
     given: Given,
     when: When,
@@ -66,3 +75,58 @@ def test_receives_events_from_all_tenants(given: Given, when: When, then: Then)
             any_record(third, for_tenant="third"),
         ]
     )
+
+
+@pytest.mark.skip_backend(
+    backend=["in_memory", "esdb"],
+    reason="Waits to fill the batch up to the timelimit",
+)
+def test_returns_settled_partial_batch_without_waiting(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    subscription = given.batch_subscription(of_size=10, timelimit=3)
+
+    when.stream().receives(first := an_event(), second := an_event())
+
+    start = time.monotonic()
+    then(subscription).next_batch_is([any_record(first), any_record(second)])
+    assert time.monotonic() - start < 1
+
+
+@pytest.mark.skip_backend(
+    backend=["in_memory", "esdb"],
+    reason="Events of deleted streams stay in the log",
+)
+def test_returns_batch_with_gap_of_deleted_stream_without_waiting(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    subscription = given.batch_subscription(of_size=2, timelimit=5)
+
+    when.stream().receives(first := an_event())
+    deleted = when.stream().receives(an_event())
+    when.stream().receives(third := an_event())
+    when.deletes(deleted.id)
+
+    start = time.monotonic()
+    then(subscription).next_batch_is([any_record(first), any_record(third)])
+    assert time.monotonic() - start < 1
+
+
+def test_returns_filtered_batch_without_waiting(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    subscription = given.batch_subscription(of_size=2, to_category="a", timelimit=5)
+
+    when.stream(StreamId(category="a")).receives(first := an_event())
+    when.stream(StreamId(category="b")).receives(an_event())
+    when.stream(StreamId(category="a")).receives(second := an_event())
+
+    start = time.monotonic()
+    then(subscription).next_batch_is([any_record(first), any_record(second)])
+    assert time.monotonic() - start < 1
@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+
+from event_sourcery.event_store import InMemoryBackendFactory, Recorded, StreamId
+from event_sourcery.event_store.in_memory import InMemorySubscriptionStrategy, Storage
+from event_sourcery.event_store.subscription import SubscriptionBuilder
+from tests.factories import AnEvent, OtherEvent
+
+
+def test_fills_batch_from_available_records_without_waiting() -> None:
+    backend = InMemoryBackendFactory().build()
+    subscription = backend.subscriber.start_from(0).build_batch(size=1000, timelimit=10)
+    backend.event_store.append(*(AnEvent() for _ in range(1000)), stream_id=StreamId())
+
+    start = time.monotonic()
+    batch = next(subscription)
+
+    assert len(batch) == 1000
+    assert time.monotonic() - start < 1
+
+
+def test_wakes_up_on_records_appended_by_other_thread() -> None:
+    backend = InMemoryBackendFactory().build()
+    subscription = backend.subscriber.start_from(0).build_batch(size=2, timelimit=10)
+    appending = threading.Timer(
+        0.1,
+        backend.event_store.append,
+        [AnEvent(), AnEvent()],
+        {"stream_id": StreamId()},
+    )
+
+    start = time.monotonic()
+    appending.start()
+    batch = next(subscription)
+
+    assert len(batch) == 2
+    assert time.monotonic() - start < 1
+
+
+def test_filtered_subscriptions_receive_only_matching_records() -> None:
+    backend = InMemoryBackendFactory().build()
+    to_category = (
+        backend.subscriber.start_from(0)
+        .to_category("matching")
+        .build_batch(size=3, timelimit=1)
+    )
+    to_events = (
+        backend.subscriber.start_from(0)
+        .to_events([OtherEvent])
+        .build_batch(size=3, timelimit=1)
+    )
+    for _ in range(3):
+        backend.event_store.append(AnEvent(), stream_id=StreamId(category="other"))
+        backend.event_store.append(
+            OtherEvent(), stream_id=StreamId(category="matching")
+        )
+
+    assert [record.stream_id.category for record in next(to_category)] == [
+        "matching"
+    ] * 3
+    assert [type(record.wrapped_event.event) for record in next(to_events)] == [
+        OtherEvent
+    ] * 3
+
+
+def test_async_subscription_awaits_records_without_blocking_loop() -> None:
+    backend = InMemoryBackendFactory().build_async()
+    subscription = backend.subscriber.start_from(0).build_async_batch(
+        size=2, timelimit=10
+    )
+
+    async def append_later() -> None:
+        await asyncio.sleep(0.1)
+        await backend.event_store.append(AnEvent(), AnEvent(), stream_id=StreamId())
+
+    async def scenario() -> list[Recorded]:
+        appending = asyncio.create_task(append_later())
+        batch = await anext(subscription)
+        await appending
+        return batch
+
+    start = time.monotonic()
+    batch = asyncio.run(scenario())
+
+    assert len(batch) == 2
+    assert time.monotonic() - start < 1
+
+
+def test_async_subscription_falls_back_to_threads_for_blocking_strategy() -> None:
+    storage = Storage()
+    backend = InMemoryBackendFactory(_storage=storage).build()
+    subscriber = SubscriptionBuilder(
+        _serde=backend.serde, _strategy=InMemorySubscriptionStrategy(storage)
+    )
+    subscription = subscriber.start_from(0).build_async_iter(timelimit=1)
+    backend.event_store.append(AnEvent(), stream_id=StreamId())
+
+    record = asyncio.run(anext(subscription))
+
+    assert record is not None
+    assert isinstance(record.wrapped_event.event, AnEvent)
@@ -0,0 +1,76 @@
+from contextlib import closing
+
+import pytest
+
+from event_sourcery.event_store import Backend, StreamId
+from tests.bdd import Given, When
+from tests.factories import an_event
+
+pytestmark = pytest.mark.skip_backend(
+    backend="sqlalchemy_sqlite",
+    reason="Checkpoints are saved by own connections, which SQLite locks out "
+    "until the never committed test session ends",
+)
+
+
+def test_starts_named_subscription_from_beginning(
+    backend: Backend,
+    given: Given,
+) -> None:
+    given.stream(StreamId()).with_events(an_event(), an_event())
+
+    subscription = backend.subscriber.named("billing").build_batch(10, timelimit=1)
+
+    with closing(subscription):
+        assert len(next(subscription)) == 2
+
+
+def test_resumes_named_subscription_after_processed_events(
+    backend: Backend,
+    given: Given,
+    when: When,
+) -> None:
+    stream = given.stream(StreamId()).with_events(an_event(), an_event())
+    subscription = backend.subscriber.named("billing").build_batch(2, timelimit=1)
+    with closing(subscription):
+        next(subscription)
+        when(stream).receives(an_event())
+        next(subscription)
+
+    resumed = backend.subscriber.named("billing").build_batch(10, timelimit=1)
+
+    with closing(resumed):
+        assert len(next(resumed)) == 1
+
+
+def test_redelivers_events_not_yet_processed(
+    backend: Backend,
+    given: Given,
+) -> None:
+    given.stream(StreamId()).with_events(an_event(), an_event())
+    subscription = backend.subscriber.named("billing").build_iter(timelimit=1)
+    with closing(subscription):
+        next(subscription)
+        next(subscription)
+
+    resumed = backend.subscriber.named("billing").build_iter(timelimit=1)
+
+    with closing(resumed):
+        record = next(resumed)
+        assert record is not None
+        assert record.wrapped_event.version == 2
+
+
+def test_named_subscriptions_keep_own_checkpoints(
+    backend: Backend,
+    given: Given,
+) -> None:
+    given.stream(StreamId()).with_events(an_event())
+    with closing(backend.subscriber.named("billing").build_iter(timelimit=1)) as it:
+        next(it)
+        next(it)
+
+    other = backend.subscriber.named("shipping").build_iter(timelimit=1)
+
+    with closing(other):
+        assert next(other) is not None
@@ -0,0 +1,64 @@
+from collections import defaultdict
+
+import pytest
+
+from event_sourcery.event_store import Backend, Recorded, StreamId
+from event_sourcery.event_store.subscription import PartitionPhase
+from tests.bdd import Given
+from tests.factories import an_event
+
+
+def consume_partitions(
+    backend: Backend, count: int, category: str | None = None
+) -> list[list[Recorded]]:
+    partitions = []
+    for index in range(count):
+        builder: PartitionPhase = backend.subscriber.start_from(0)
+        if category:
+            builder = backend.subscriber.start_from(0).to_category(category)
+        subscription = builder.partitioned(count, index).build_batch(
+            size=100, timelimit=1
+        )
+        partitions.append(next(subscription))
+    return partitions
+
+
+def test_delivers_each_stream_to_one_partition_in_order(
+    backend: Backend,
+    given: Given,
+) -> None:
+    streams = [given.stream(StreamId()) for _ in range(8)]
+    for stream in streams:
+        stream.with_events(an_event(), an_event())
+
+    partitions = consume_partitions(backend, count=2)
+
+    partitions_of_streams = defaultdict(set)
+    for index, records in enumerate(partitions):
+        for record in records:
+            partitions_of_streams[record.stream_id].add(index)
+        assert [r.position for r in records] == sorted(r.position for r in records)
+    assert sum(map(len, partitions)) == 16
+    assert all(len(indexes) == 1 for indexes in partitions_of_streams.values())
+    assert partitions_of_streams.keys() == {stream.id for stream in streams}
+
+
+def test_partitions_category_subscription(
+    backend: Backend,
+    given: Given,
+) -> None:
+    for _ in range(4):
+        given.stream(StreamId(category="Category")).with_events(an_event())
+        given.stream(StreamId(category="Other")).with_events(an_event())
+
+    partitions = consume_partitions(backend, count=2, category="Category")
+
+    received = [record for records in partitions for record in records]
+    assert len(received) == 4
+    assert {record.stream_id.category for record in received} == {"Category"}
+
+
+@pytest.mark.parametrize("count, index", [(0, 0), (2, 2), (2, -1), (257, 0)])
+def test_rejects_invalid_partition(backend: Backend, count: int, index: int) -> None:
+    with pytest.raises(ValueError):
+        backend.subscriber.start_from(0).partitioned(count, index)
@@ -0,0 +1,92 @@
+import pytest
+
+from event_sourcery.event_store import EventStore, StreamId
+from event_sourcery.event_store.exceptions import ConcurrentStreamWriteError
+from tests.bdd import Given, Then, When
+from tests.factories import an_event
+from tests.matchers import any_wrapped_event
+
+
+def test_appends_to_many_new_streams(when: When, then: Then) -> None:
+    first_stream_id, second_stream_id = StreamId(), StreamId(name="second")
+    when.store.append_many(
+        {
+            first_stream_id: (
+                [first := an_event(version=1), second := an_event(version=2)],
+                0,
+            ),
+            second_stream_id: ([third := an_event(version=1)], 0),
+        }
+    )
+    then.stream(first_stream_id).loads_only([first, second])
+    then.stream(second_stream_id).loads_only([third])
+
+
+def test_appends_to_many_existing_streams(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(first_stream_id := StreamId())
+    given.event(first := an_event(version=1), on=first_stream_id)
+    given.stream(second_stream_id := StreamId())
+    given.events(
+        second := an_event(version=1),
+        third := an_event(version=2),
+        on=second_stream_id,
+    )
+    when.store.append_many(
+        {
+            first_stream_id: ([fourth := an_event(version=2)], 1),
+            second_stream_id: ([fifth := an_event(version=3)], 2),
+        }
+    )
+    then.stream(first_stream_id).loads_only([first, fourth])
+    then.stream(second_stream_id).loads_only([second, third, fifth])
+
+
+def test_nothing_is_appended_when_any_stream_has_unexpected_version(
+    given: Given,
+    when: When,
+    then: Then,
+) -> None:
+    given.stream(first_stream_id := StreamId())
+    given.event(first := an_event(version=1), on=first_stream_id)
+    given.stream(second_stream_id := StreamId())
+    given.event(second := an_event(version=1), on=second_stream_id)
+
+    with pytest.raises(ConcurrentStreamWriteError):
+        when.store.append_many(
+            {
+                first_stream_id: ([an_event(version=2)], 1),
+                second_stream_id: ([an_event(version=11)], 10),
+            }
+        )
+
+    then.stream(first_stream_id).loads_only([first])
+    then.stream(second_stream_id).loads_only([second])
+
+
+def test_is_able_to_handle_bare_events(event_store: EventStore, then: Then) -> None:
+    first_stream_id, second_stream_id = StreamId(), StreamId()
+    event_store.append_many(
+        {
+            first_stream_id: ([first := an_event().event], 0),
+            second_stream_id: ([second := an_event().event], 0),
+        }
+    )
+    then.stream(first_stream_id).loads_only([any_wrapped_event(for_event=first)])
+    then.stream(second_stream_id).loads_only([any_wrapped_event(for_event=second)])
+
+
+def test_positions_of_appended_events_are_increasing(
+    event_store: EventStore,
+) -> None:
+    start = event_store.position or 0
+    event_store.append_many(
+        {
+            StreamId(): ([an_event(version=1), an_event(version=2)], 0),
+            StreamId(): ([an_event(version=1)], 0),
+        }
+    )
+    assert (event_store.position or 0) >= start + 3
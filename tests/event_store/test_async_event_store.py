@@ -0,0 +1,315 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from typing import Protocol, TypeVar
+
+import pytest
+from _pytest.fixtures import SubRequest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from event_sourcery.event_store import (
+    AsyncBackend,
+    AsyncEventStore,
+    InMemoryBackendFactory,
+    StreamId,
+)
+from event_sourcery.event_store.exceptions import ConcurrentStreamWriteError
+from event_sourcery_sqlalchemy import SQLAlchemyAsyncBackendFactory
+from tests.backend.sqlalchemy import (
+    sqlalchemy_async_postgres,
+    sqlalchemy_async_sqlite,
+)
+from tests.factories import a_snapshot, an_event
+from tests.matchers import any_wrapped_event
+
+T = TypeVar("T")
+
+
+class Run(Protocol):
+    def __call__(self, coroutine: Callable[[], Awaitable[T]]) -> T: ...
+
+
+@pytest.fixture()
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Shared by a test and closing of its session, as asyncpg binds to a loop."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def run(loop: asyncio.AbstractEventLoop) -> Run:
+    def run(coroutine: Callable[[], Awaitable[T]]) -> T:
+        async def main() -> T:
+            return await coroutine()
+
+        return loop.run_until_complete(main())
+
+    return run
+
+
+@pytest.fixture(
+    params=["in_memory", sqlalchemy_async_sqlite, sqlalchemy_async_postgres],
+)
+def async_backend(
+    request: SubRequest, loop: asyncio.AbstractEventLoop
+) -> Iterator[AsyncBackend]:
+    if request.param == "in_memory":
+        yield InMemoryBackendFactory().build_async()
+        return
+
+    session_factory: async_sessionmaker = request.getfixturevalue(
+        request.param.__name__
+    )
+    session = session_factory()
+    yield SQLAlchemyAsyncBackendFactory(session).build()
+    loop.run_until_complete(session.close())
+
+
+@pytest.fixture()
+def event_store(async_backend: AsyncBackend) -> AsyncEventStore:
+    return async_backend.event_store
+
+
+def test_save_retrieve(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        await event_store.append(first := an_event(version=1), stream_id=stream_id)
+        await event_store.append(
+            second := an_event(version=2),
+            stream_id=stream_id,
+            expected_version=1,
+        )
+        assert await event_store.load_stream(stream_id) == [first, second]
+        assert await event_store.load_stream(stream_id, start=2) == [second]
+
+    run(scenario)
+
+
+def test_append_many(event_store: AsyncEventStore, run: Run) -> None:
+    first_stream_id, second_stream_id = StreamId(), StreamId()
+
+    async def scenario() -> None:
+        await event_store.append_many(
+            {
+                first_stream_id: ([first := an_event(version=1)], 0),
+                second_stream_id: ([second := an_event(version=1)], 0),
+            }
+        )
+        assert await event_store.load_stream(first_stream_id) == [first]
+        assert await event_store.load_stream(second_stream_id) == [second]
+
+    run(scenario)
+
+
+def test_iter_stream(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+    events = [an_event(version=version) for version in range(1, 4)]
+
+    async def scenario() -> None:
+        await event_store.append(*events, stream_id=stream_id)
+        assert [
+            event async for event in event_store.iter_stream(stream_id, page_size=2)
+        ] == events
+
+    run(scenario)
+
+
+def test_load_streams(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id, not_existing = StreamId(), StreamId()
+
+    async def scenario() -> None:
+        await event_store.append(event := an_event(version=1), stream_id=stream_id)
+        assert await event_store.load_streams([stream_id, not_existing]) == {
+            stream_id: [event],
+            not_existing: [],
+        }
+
+    run(scenario)
+
+
+def test_loading_not_existing_stream_returns_empty_list(
+    event_store: AsyncEventStore, run: Run
+) -> None:
+    assert run(lambda: event_store.load_stream(StreamId())) == []
+
+
+def test_is_able_to_handle_bare_events(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+    event = an_event().event
+
+    async def scenario() -> None:
+        await event_store.append(event, stream_id=stream_id)
+        assert await event_store.load_stream(stream_id) == [
+            any_wrapped_event(for_event=event)
+        ]
+
+    run(scenario)
+
+
+def test_concurrency_error(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        await event_store.append(an_event(version=1), stream_id=stream_id)
+        with pytest.raises(ConcurrentStreamWriteError):
+            await event_store.append(
+                an_event(version=11),
+                stream_id=stream_id,
+                expected_version=10,
+            )
+
+    run(scenario)
+
+
+def test_handles_snapshots(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        await event_store.append(
+            an_event(version=1),
+            an_event(version=2),
+            stream_id=stream_id,
+        )
+        await event_store.save_snapshot(stream_id, snapshot := a_snapshot(version=2))
+        await event_store.append(
+            after_snapshot := an_event(version=3),
+            stream_id=stream_id,
+            expected_version=2,
+        )
+        assert await event_store.load_stream(stream_id) == [snapshot, after_snapshot]
+
+    run(scenario)
+
+
+def test_deletes_stream(event_store: AsyncEventStore, run: Run) -> None:
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        await event_store.append(an_event(version=1), stream_id=stream_id)
+        await event_store.delete_stream(stream_id)
+        assert await event_store.load_stream(stream_id) == []
+
+    run(scenario)
+
+
+def test_position_moves_with_appended_events(
+    event_store: AsyncEventStore, run: Run
+) -> None:
+    async def scenario() -> None:
+        before = await event_store.position() or 0
+        await event_store.append(
+            an_event(version=1),
+            an_event(version=2),
+            stream_id=StreamId(),
+        )
+        assert await event_store.position() == before + 2
+
+    run(scenario)
+
+
+def test_streams_are_separated_between_tenants(
+    event_store: AsyncEventStore, run: Run
+) -> None:
+    stream_id = StreamId()
+    tenant_store = event_store.scoped_for_tenant("tenant")
+
+    async def scenario() -> None:
+        await tenant_store.append(event := an_event(version=1), stream_id=stream_id)
+        assert await tenant_store.load_stream(stream_id) == [event]
+        assert await event_store.load_stream(stream_id) == []
+
+    run(scenario)
+
+
+def test_loads_streams_concurrently(event_store: AsyncEventStore, run: Run) -> None:
+    stream_ids = [StreamId() for _ in range(5)]
+
+    async def scenario() -> None:
+        for stream_id in stream_ids:
+            await event_store.append(an_event(version=1), stream_id=stream_id)
+        streams = await asyncio.gather(
+            *(event_store.load_stream(stream_id) for stream_id in stream_ids)
+        )
+        assert [len(stream) for stream in streams] == [1] * 5
+
+    run(scenario)
+
+
+def test_subscribes_with_async_iterator(async_backend: AsyncBackend, run: Run) -> None:
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        subscription = async_backend.subscriber.start_from(0).build_async_iter(
+            timelimit=1
+        )
+        await async_backend.event_store.append(
+            first := an_event(version=1),
+            second := an_event(version=2),
+            stream_id=stream_id,
+        )
+        received = [await anext(subscription), await anext(subscription)]
+        assert [record.wrapped_event for record in received if record] == [
+            first,
+            second,
+        ]
+        assert await anext(subscription) is None
+
+    run(scenario)
+
+
+def test_subscribes_to_category_with_async_batches(
+    async_backend: AsyncBackend, run: Run
+) -> None:
+    async def scenario() -> None:
+        subscription = (
+            async_backend.subscriber.start_from(0)
+            .to_category("matching")
+            .build_async_batch(size=2, timelimit=1)
+        )
+        await async_backend.event_store.append(
+            an_event(version=1), stream_id=StreamId(category="other")
+        )
+        await async_backend.event_store.append(
+            first := an_event(version=1),
+            second := an_event(version=2),
+            stream_id=StreamId(category="matching"),
+        )
+        async for batch in subscription:
+            assert [record.wrapped_event for record in batch] == [first, second]
+            break
+
+    run(scenario)
+
+
+def test_resumes_named_subscription_with_async_batches(
+    async_backend: AsyncBackend, request: SubRequest, run: Run
+) -> None:
+    if "sqlite" in request.node.callspec.id:
+        pytest.skip(
+            "Checkpoints are saved by own connections, which SQLite locks out "
+            "until the never committed test session ends"
+        )
+    stream_id = StreamId()
+
+    async def scenario() -> None:
+        await async_backend.event_store.append(
+            an_event(version=1), an_event(version=2), stream_id=stream_id
+        )
+        subscription = async_backend.subscriber.named("billing").build_async_batch(
+            size=2, timelimit=1
+        )
+        await anext(subscription)
+        await anext(subscription)
+        await subscription.aclose()
+        await async_backend.event_store.append(
+            third := an_event(version=3), stream_id=stream_id, expected_version=2
+        )
+
+        resumed = async_backend.subscriber.named("billing").build_async_batch(
+            size=10, timelimit=1
+        )
+        assert [record.wrapped_event for record in await anext(resumed)] == [third]
+        await resumed.aclose()
+
+    run(scenario)
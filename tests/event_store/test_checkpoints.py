@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from contextlib import closing
+from datetime import timedelta
+from typing import cast
+from unittest.mock import Mock
+
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import Position, RecordedRaw, StreamId
+from event_sourcery.event_store.checkpoints import Checkpointer
+from event_sourcery.event_store.interfaces import CheckpointStorageStrategy
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory
+from tests.factories import AnEvent
+
+
+def batch_at(position: int) -> list[RecordedRaw]:
+    return [cast(RecordedRaw, Mock(position=Position(position)))]
+
+
+def test_saves_checkpoint_in_background_every_n_events() -> None:
+    saved = threading.Event()
+    strategy = Mock(spec=CheckpointStorageStrategy)
+    strategy.load.return_value = None
+    strategy.save.side_effect = lambda name, position: saved.set()
+    checkpointer = Checkpointer(strategy, "billing", 2, timedelta(hours=1))
+    subscription = checkpointer.track(iter([batch_at(1), batch_at(2), batch_at(3)]))
+
+    next(subscription)
+    next(subscription)
+    assert not saved.is_set()
+    next(subscription)
+
+    assert saved.wait(timeout=1)
+    strategy.save.assert_called_once_with("billing", 2)
+
+
+def test_logs_failed_checkpoint_saves_and_retries_on_close() -> None:
+    strategy = Mock(spec=CheckpointStorageStrategy)
+    strategy.load.return_value = None
+    strategy.save.side_effect = [RuntimeError, None]
+    checkpointer = Checkpointer(strategy, "billing", 1, timedelta(hours=1))
+    subscription = checkpointer.track(iter([batch_at(1), batch_at(2)]))
+
+    next(subscription)
+    next(subscription)
+    subscription.close()
+
+    assert strategy.save.call_count == 2
+
+
+def test_loads_checkpoint_of_async_subscription_off_the_loop() -> None:
+    loaded_by: list[threading.Thread] = []
+
+    def load(name: str) -> Position:
+        loaded_by.append(threading.current_thread())
+        return Position(1)
+
+    strategy = Mock(spec=CheckpointStorageStrategy)
+    strategy.load.side_effect = load
+    checkpointer = Checkpointer(strategy, "billing", 1, timedelta(hours=1))
+
+    async def subscribe(position: Position) -> AsyncIterator[list[RecordedRaw]]:
+        yield batch_at(position + 1)
+
+    subscription = checkpointer.track_async(subscribe)
+    assert not loaded_by
+
+    async def first_batch() -> list[RecordedRaw]:
+        batch = await anext(subscription)
+        await subscription.aclose()
+        return batch
+
+    batch = asyncio.run(first_batch())
+
+    assert batch[0].position == 2
+    assert loaded_by != [threading.main_thread()]
+
+
+def test_resumes_named_subscription_from_sqlalchemy_checkpoint(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    with sqlalchemy_sqlite() as session:
+        backend = SQLAlchemyBackendFactory(session).build()
+        backend.event_store.append(AnEvent(), AnEvent(), stream_id=StreamId())
+        session.commit()
+        subscription = backend.subscriber.named("billing").build_iter(timelimit=1)
+        with closing(subscription):
+            next(subscription)
+            next(subscription)
+            session.commit()
+
+        resumed = backend.subscriber.named("billing").build_iter(timelimit=1)
+        with closing(resumed):
+            record = next(resumed)
+
+    assert record is not None
+    assert record.position == 2
@@ -0,0 +1,213 @@
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from event_sourcery.event_store import (
+    Dispatcher,
+    Event,
+    PostCommitDispatcher,
+    RecordedRaw,
+    StreamId,
+    WrappedEvent,
+)
+from event_sourcery.event_store.event import Serde
+
+
+class Base(Event):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class Unrelated(Event):
+    pass
+
+
+@pytest.fixture()
+def serde() -> Serde:
+    return Serde(Event.__registry__)
+
+
+@pytest.fixture()
+def dispatcher(serde: Serde) -> Dispatcher:
+    return Dispatcher(serde)
+
+
+def a_record(serde: Serde, event: Event) -> RecordedRaw:
+    raw = serde.serialize(WrappedEvent.wrap(event, version=1), StreamId())
+    return RecordedRaw(entry=raw, position=1, tenant_id="tenant")
+
+
+def test_calls_listeners_of_event_type_and_its_bases(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    base_listener, derived_listener = Mock(), Mock()
+    dispatcher.register(base_listener, to=Base)
+    dispatcher.register(derived_listener, to=Derived)
+
+    dispatcher.dispatch(a_record(serde, Derived()), a_record(serde, Base()))
+
+    assert base_listener.call_count == 2
+    assert derived_listener.call_count == 1
+
+
+def test_does_not_deserialize_records_without_listeners(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    dispatcher.register(Mock(), to=Unrelated)
+
+    with patch.object(Serde, "deserialize_record") as deserialize_record:
+        dispatcher.dispatch(a_record(serde, Derived()))
+
+    deserialize_record.assert_not_called()
+
+
+def test_follows_registration_changes(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    listener = Mock()
+    dispatcher.dispatch(a_record(serde, Derived()))
+
+    dispatcher.register(listener, to=Base)
+    dispatcher.dispatch(a_record(serde, Derived()))
+    dispatcher.remove(listener, to=Base)
+    dispatcher.dispatch(a_record(serde, Derived()))
+
+    assert listener.call_count == 1
+
+
+def test_calls_batch_listeners_once_with_records_of_their_types(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    base_listener, derived_listener = Mock(), Mock()
+    dispatcher.register_batch(base_listener, to=Base)
+    dispatcher.register_batch(derived_listener, to=Derived)
+
+    dispatcher.dispatch(
+        a_record(serde, Derived()),
+        a_record(serde, Unrelated()),
+        a_record(serde, Base()),
+    )
+
+    (base_records,) = base_listener.call_args.args
+    (derived_records,) = derived_listener.call_args.args
+    assert base_listener.call_count == 1
+    assert list(base_records) == [Derived, Base]
+    assert [record.wrapped_event.event for record in derived_records[Derived]] == [
+        Derived()
+    ]
+
+
+def test_groups_records_of_batch_listeners_by_event_type(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    listener = Mock()
+    dispatcher.register_batch(listener, to=Base)
+
+    dispatcher.dispatch(
+        a_record(serde, first := Base()),
+        a_record(serde, Derived()),
+        a_record(serde, second := Base()),
+    )
+
+    (records,) = listener.call_args.args
+    assert [record.wrapped_event.event for record in records[Base]] == [
+        first,
+        second,
+    ]
+    assert len(records[Derived]) == 1
+
+
+def test_skips_records_of_unknown_event_names(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    listener = Mock()
+    dispatcher.register(listener, to=Base)
+    unknown = a_record(serde, Base())
+    unknown = replace(unknown, entry=replace(unknown.entry, name="Unknown"))
+
+    dispatcher.dispatch(unknown, a_record(serde, Base()))
+
+    assert listener.call_count == 1
+
+
+def test_calls_listeners_registered_to_type_and_its_base_once_per_record(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    listener, batch_listener = Mock(), Mock()
+    for event_type in (Base, Derived):
+        dispatcher.register(listener, to=event_type)
+        dispatcher.register_batch(batch_listener, to=event_type)
+
+    dispatcher.dispatch(a_record(serde, Derived()))
+
+    (records,) = batch_listener.call_args.args
+    assert listener.call_count == 1
+    assert [record.wrapped_event.event for record in records[Derived]] == [Derived()]
+
+
+def test_does_not_call_removed_batch_listeners(
+    serde: Serde,
+    dispatcher: Dispatcher,
+) -> None:
+    listener = Mock()
+    dispatcher.register_batch(listener, to=Base)
+    dispatcher.remove_batch(listener, to=Base)
+
+    dispatcher.dispatch(a_record(serde, Base()))
+
+    listener.assert_not_called()
+
+
+def test_post_commit_dispatcher_delivers_records_on_commit(serde: Serde) -> None:
+    committed: list[Callable[[], None]] = []
+    listener = Mock()
+    with ThreadPoolExecutor() as executor:
+        dispatcher = PostCommitDispatcher(serde, executor, committed.append)
+        dispatcher.register(listener, to=Base)
+        dispatcher.dispatch(a_record(serde, Base()))
+        listener.assert_not_called()
+
+        for callback in committed:
+            callback()
+
+    listener.assert_called_once()
+
+
+def test_post_commit_dispatcher_skips_records_without_listeners(
+    serde: Serde,
+) -> None:
+    on_commit = Mock()
+    dispatcher = PostCommitDispatcher(serde, Mock(), on_commit)
+    dispatcher.register(Mock(), to=Unrelated)
+
+    dispatcher.dispatch(a_record(serde, Base()))
+
+    on_commit.assert_not_called()
+
+
+def test_post_commit_dispatcher_logs_failures_of_listeners(
+    serde: Serde,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with ThreadPoolExecutor() as executor:
+        dispatcher = PostCommitDispatcher(serde, executor)
+        dispatcher.register(Mock(side_effect=RuntimeError), to=Base)
+        with caplog.at_level(logging.ERROR):
+            dispatcher.dispatch(a_record(serde, Base()))
+            executor.shutdown()
+
+    assert "Failed to deliver 1 records after commit" in caplog.text
@@ -0,0 +1,47 @@
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import Position, StreamId
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory
+from event_sourcery_sqlalchemy.models import Event
+from event_sourcery_sqlalchemy.subscription import GetBatchToCategory
+from tests.factories import AnEvent
+
+
+def test_events_carry_category_and_tenant_of_their_stream(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    with sqlalchemy_sqlite() as session:
+        backend = SQLAlchemyBackendFactory(session).build()
+        tenant_store = backend.event_store.scoped_for_tenant("tenant")
+        tenant_store.append(AnEvent(), stream_id=StreamId(category="orders"))
+        session.commit()
+
+        stored = session.scalars(select(Event)).one()
+
+    assert (stored.category, stored.tenant_id) == ("orders", "tenant")
+
+
+def test_category_subscription_scans_index_without_joining_streams(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    queries: list[tuple[str, Any]] = []
+
+    def capture(*args: Any) -> None:
+        _connection, _cursor, statement, parameters, _context, _many = args
+        queries.append((statement, parameters))
+
+    with sqlalchemy_sqlite() as session:
+        event.listen(session.get_bind(), "before_cursor_execute", capture)
+        GetBatchToCategory(session, 10, "orders")(Position(0))
+        event.remove(session.get_bind(), "before_cursor_execute", capture)
+        statement, parameters = queries[0]
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        )
+        details = " ".join(row[-1] for row in plan)
+
+    assert "ix_events_category_id" in details
+    assert "event_sourcery_streams" not in details
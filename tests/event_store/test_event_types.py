@@ -0,0 +1,74 @@
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import EventStore, StreamId
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory
+from event_sourcery_sqlalchemy.models import Event, EventType
+from tests.factories import AnEvent
+
+
+def test_stores_each_event_name_once(sqlalchemy_sqlite: sessionmaker) -> None:
+    with sqlalchemy_sqlite() as session:
+        store = SQLAlchemyBackendFactory(session).build().event_store
+        store.append(AnEvent(), AnEvent(), stream_id=(first := StreamId()))
+        store.append(AnEvent(), stream_id=StreamId())
+
+        types = session.scalar(select(func.count()).select_from(EventType))
+        type_ids = session.scalars(select(Event._type_id).distinct()).all()
+        loaded = store.load_stream(first)
+
+    assert types == 1
+    assert len(type_ids) == 1
+    assert [wrapped.event for wrapped in loaded] == [AnEvent(), AnEvent()]
+
+
+def test_does_not_reuse_ids_of_rolled_back_event_types(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    with sqlalchemy_sqlite() as session:
+        store: EventStore = SQLAlchemyBackendFactory(session).build().event_store
+        store.append(AnEvent(), stream_id=StreamId())
+        session.rollback()
+        store.append(AnEvent(), stream_id=(stream_id := StreamId()))
+        session.commit()
+
+        loaded = store.load_stream(stream_id)
+
+    assert [wrapped.event for wrapped in loaded] == [AnEvent()]
+
+
+def test_registers_event_types_without_waiting_for_other_writers(
+    sqlalchemy_postgres: sessionmaker,
+) -> None:
+    with sqlalchemy_postgres() as pending, sqlalchemy_postgres() as session:
+        SQLAlchemyBackendFactory(pending).build().event_store.append(
+            AnEvent(), stream_id=StreamId()
+        )
+        store = SQLAlchemyBackendFactory(session).build().event_store
+        store.append(AnEvent(), stream_id=(stream_id := StreamId()))
+        session.commit()
+        pending.rollback()
+
+        loaded = store.load_stream(stream_id)
+
+    assert [wrapped.event for wrapped in loaded] == [AnEvent()]
+
+
+@pytest.mark.skip_backend(
+    backend=["esdb", "in_memory", "sqlalchemy_sqlite", "sqlalchemy_postgres"],
+    reason="Checks tables of Django backend",
+)
+def test_stores_each_event_name_once_on_django(event_store: EventStore) -> None:
+    from event_sourcery_django import models  # noqa: PLC0415
+
+    event_store.append(AnEvent(), AnEvent(), stream_id=(first := StreamId()))
+    event_store.append(AnEvent(), stream_id=StreamId())
+
+    types = models.EventType.objects.count()
+    type_ids = models.Event.objects.values_list("type", flat=True).distinct()
+    loaded = event_store.load_stream(first)
+
+    assert types == 1
+    assert len(type_ids) == 1
+    assert [wrapped.event for wrapped in loaded] == [AnEvent()] * 2
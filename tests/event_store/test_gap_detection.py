@@ -0,0 +1,105 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import (
+    PollingPolicy,
+    Position,
+    RawEvent,
+    RecordedRaw,
+    StreamId,
+)
+from event_sourcery.event_store.gap_detection import (
+    GapDetectingIterator,
+    Horizon,
+    Visibility,
+)
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory
+from tests.factories import AnEvent
+
+
+def test_postgres_awaits_writer_in_progress_below_committed_events(
+    sqlalchemy_postgres: sessionmaker,
+) -> None:
+    with sqlalchemy_postgres() as pending, sqlalchemy_postgres() as session:
+        SQLAlchemyBackendFactory(pending).build().event_store.append(
+            AnEvent(), stream_id=StreamId()
+        )
+        backend = SQLAlchemyBackendFactory(session).build()
+        backend.event_store.append(AnEvent(), stream_id=StreamId())
+        session.commit()
+        subscription = backend.subscriber.start_from(0).build_batch(
+            size=10, timelimit=5
+        )
+        committing = threading.Timer(0.5, pending.commit)
+
+        start = time.monotonic()
+        committing.start()
+        batch = next(subscription)
+        committing.join()
+
+    assert len(batch) == 2
+    assert 0.5 <= time.monotonic() - start < 2
+
+
+class WritersEndingAfter(Visibility):
+    def __init__(self, horizon: Horizon, checks: int) -> None:
+        self._horizon = horizon
+        self._checks = checks
+
+    def horizon(self) -> Horizon | None:
+        return self._horizon
+
+    def is_settled(self, horizon: Horizon) -> bool:
+        self._checks -= 1
+        return self._checks < 0
+
+
+def a_record(position: Position) -> RecordedRaw:
+    raw = RawEvent(
+        uuid=uuid4(),
+        stream_id=StreamId(),
+        created_at=datetime.now(),
+        name="AnEvent",
+        data={},
+        context={},
+    )
+    return RecordedRaw(entry=raw, position=position)
+
+
+def subscription(
+    records: list[RecordedRaw], visibility: Visibility
+) -> GapDetectingIterator:
+    return GapDetectingIterator(
+        get_batch=lambda position: [r for r in records if r.position > position],
+        polling=PollingPolicy(min_interval=timedelta(seconds=0.01), jitter=0),
+        visibility=visibility,
+        start_from=0,
+        batch_size=10,
+        timelimit=timedelta(seconds=5),
+    )
+
+
+def test_releases_events_up_to_settled_horizon_without_waiting() -> None:
+    records = [a_record(1), a_record(2), a_record(4)]
+    visibility = WritersEndingAfter(Horizon(position=2), checks=0)
+
+    start = time.monotonic()
+    batch = next(subscription(records, visibility))
+
+    assert batch == records[:2]
+    assert time.monotonic() - start < 1
+
+
+def test_awaits_gap_until_writers_below_horizon_end() -> None:
+    records = [a_record(1), a_record(2), a_record(4)]
+    visibility = WritersEndingAfter(Horizon(position=4, writers=(7,)), checks=3)
+
+    start = time.monotonic()
+    batch = next(subscription(records, visibility))
+
+    assert batch == records
+    assert time.monotonic() - start < 1
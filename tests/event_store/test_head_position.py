@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import StreamId
+from event_sourcery.event_store.head_position import ALL_TENANTS, HeadPosition
+from event_sourcery_sqlalchemy import Config, SQLAlchemyBackendFactory
+from tests.factories import AnEvent
+
+
+def test_fetches_position_again_after_ttl() -> None:
+    positions = iter([1, 2])
+    head = HeadPosition(ttl=timedelta(0))
+
+    assert head.get(ALL_TENANTS, lambda: next(positions)) == 1
+    assert head.get(ALL_TENANTS, lambda: next(positions)) == 2
+
+
+def test_caches_position_of_each_tenant() -> None:
+    head = HeadPosition(ttl=timedelta(hours=1))
+    head.get(ALL_TENANTS, lambda: 5)
+    head.get("tenant", lambda: 3)
+
+    assert head.get(ALL_TENANTS, lambda: 100) == 5
+    assert head.get("tenant", lambda: 100) == 3
+
+
+def test_advances_position_of_all_tenants_and_of_tenant() -> None:
+    head = HeadPosition(ttl=timedelta(hours=1))
+    head.get(ALL_TENANTS, lambda: 5)
+    head.get("other", lambda: 5)
+
+    head.advance("tenant", 7)
+
+    assert head.get(ALL_TENANTS, lambda: 100) == 7
+    assert head.get("tenant", lambda: 100) == 7
+    assert head.get("other", lambda: 100) == 5
+
+
+def test_does_not_advance_position_of_rolled_back_events(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    config = Config(head_position_ttl=timedelta(hours=1))
+    with sqlalchemy_sqlite() as writer, sqlalchemy_sqlite() as reader:
+        reading = SQLAlchemyBackendFactory(reader, config).build()
+        position_before = reading.event_store.position
+        reader.commit()
+
+        writing = SQLAlchemyBackendFactory(writer, config).build()
+        writing.event_store.append(AnEvent(), stream_id=StreamId())
+        position_in_transaction = writing.event_store.position
+        writer.rollback()
+
+        assert position_in_transaction == 1
+        assert reading.event_store.position == position_before == 0
+
+
+def test_shares_position_between_backends_of_engine(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    config = Config(head_position_ttl=timedelta(hours=1))
+    with sqlalchemy_sqlite() as writer, sqlalchemy_sqlite() as reader:
+        reading = SQLAlchemyBackendFactory(reader, config).build()
+        position_before = reading.event_store.position
+        reader.commit()
+
+        writing = SQLAlchemyBackendFactory(writer, config).build()
+        writing.event_store.append(AnEvent(), stream_id=StreamId())
+        writer.commit()
+
+        assert (position_before, reading.event_store.position) == (0, 1)
@@ -0,0 +1,67 @@
+import pytest
+
+from event_sourcery.event_store import NO_VERSIONING, EventStore, StreamId
+from tests.bdd import Given, Then
+from tests.factories import AnEvent, a_snapshot, an_event
+from tests.matchers import any_wrapped_event
+
+
+@pytest.mark.parametrize("page_size", [1, 2, 3, 100])
+def test_iterates_over_whole_stream_page_by_page(
+    page_size: int,
+    given: Given,
+    then: Then,
+) -> None:
+    given.stream(stream_id := StreamId())
+    given.events(*(events := [an_event() for _ in range(5)]), on=stream_id)
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=page_size))
+
+    assert iterated == events
+
+
+def test_iterates_over_events_after_latest_snapshot(
+    given: Given,
+    then: Then,
+) -> None:
+    given.stream(stream_id := StreamId())
+    given.events(an_event(), an_event(), on=stream_id)
+    given.snapshot(snapshot := a_snapshot(), on=stream_id)
+    given.events(first := an_event(), second := an_event(), on=stream_id)
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=1))
+
+    assert iterated == [snapshot, first, second]
+
+
+def test_iterates_over_versionless_stream(given: Given, then: Then) -> None:
+    given.stream(stream_id := StreamId())
+    events = [AnEvent() for _ in range(3)]
+    for event in events:
+        given.store.append(event, stream_id=stream_id, expected_version=NO_VERSIONING)
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=2))
+
+    assert iterated == [any_wrapped_event(for_event=event) for event in events]
+
+
+def test_iterating_not_existing_stream_yields_nothing(
+    event_store: EventStore,
+) -> None:
+    assert list(event_store.iter_stream(StreamId())) == []
+
+
+def test_iterates_over_same_events_as_loaded_from_versionless_stream_with_snapshot(
+    given: Given,
+    then: Then,
+) -> None:
+    given.stream(stream_id := StreamId())
+    for _ in range(3):
+        given.store.append(
+            AnEvent(), stream_id=stream_id, expected_version=NO_VERSIONING
+        )
+    given.store.save_snapshot(stream_id, a_snapshot(version=3))
+
+    iterated = list(then.store.iter_stream(stream_id, page_size=2))
+
+    assert iterated == list(then.store.load_stream(stream_id))
@@ -0,0 +1,54 @@
+from event_sourcery.event_store import EventStore, StreamId
+from tests.bdd import Given, Then
+from tests.factories import a_snapshot, an_event
+
+
+def test_loads_many_streams(given: Given, then: Then) -> None:
+    given.stream(first_stream_id := StreamId())
+    given.events(first := an_event(), second := an_event(), on=first_stream_id)
+    given.stream(second_stream_id := StreamId(name="second", category="Category"))
+    given.event(third := an_event(), on=second_stream_id)
+
+    loaded = then.store.load_streams([first_stream_id, second_stream_id])
+
+    assert loaded == {
+        first_stream_id: [first, second],
+        second_stream_id: [third],
+    }
+
+
+def test_not_existing_streams_are_loaded_empty(
+    given: Given,
+    event_store: EventStore,
+) -> None:
+    given.stream(stream_id := StreamId())
+    given.event(event := an_event(), on=stream_id)
+
+    loaded = event_store.load_streams([stream_id, not_existing := StreamId()])
+
+    assert loaded == {stream_id: [event], not_existing: []}
+
+
+def test_loads_events_after_latest_snapshot_of_each_stream(
+    given: Given,
+    then: Then,
+) -> None:
+    given.stream(first_stream_id := StreamId())
+    given.events(an_event(), an_event(), on=first_stream_id)
+    given.snapshot(a_snapshot(), on=first_stream_id)
+    given.event(an_event(), on=first_stream_id)
+    given.snapshot(snapshot := a_snapshot(), on=first_stream_id)
+    given.event(newer := an_event(), on=first_stream_id)
+    given.stream(second_stream_id := StreamId())
+    given.events(first := an_event(), second := an_event(), on=second_stream_id)
+
+    loaded = then.store.load_streams([first_stream_id, second_stream_id])
+
+    assert loaded == {
+        first_stream_id: [snapshot, newer],
+        second_stream_id: [first, second],
+    }
+
+
+def test_loads_nothing_for_no_streams(event_store: EventStore) -> None:
+    assert event_store.load_streams([]) == {}
@@ -42,3 +42,16 @@ def test_esdb_cant_use_tenant_id_with_dash(esdb: BackendFactory) -> None:
 
     with pytest.raises(IllegalTenantId):
         illegal_tenant_event_store.append(AnEvent(), stream_id=StreamId())
+
+
+def test_tracks_position_of_each_tenant(given: Given, then: Then) -> None:
+    given.in_tenant_mode("first").event(an_event(), on=StreamId())
+    given.in_tenant_mode("second").event(an_event(), on=StreamId())
+
+    first = then.in_tenant_mode("first").store.tenant_position
+    second = then.in_tenant_mode("second").store.tenant_position
+
+    assert first is not None
+    assert second is not None
+    assert first < second
+    assert (then.without_tenant().store.position or 0) >= second
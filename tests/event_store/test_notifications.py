@@ -0,0 +1,89 @@
+import gc
+import threading
+import time
+import weakref
+from datetime import timedelta
+from unittest.mock import Mock
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import PollingPolicy, StreamId
+from event_sourcery_sqlalchemy import Config, SQLAlchemyBackendFactory
+from event_sourcery_sqlalchemy.notifications import notifications_for
+from tests.factories import AnEvent
+
+CONFIG = Config(
+    notify_channel="event_sourcery_test",
+    polling=PollingPolicy(
+        min_interval=timedelta(seconds=10),
+        max_interval=timedelta(seconds=10),
+    ),
+)
+
+
+def test_wakes_up_postgres_subscription_on_notification(
+    sqlalchemy_postgres: sessionmaker,
+) -> None:
+    with sqlalchemy_postgres() as session, sqlalchemy_postgres() as other_session:
+        subscription = (
+            SQLAlchemyBackendFactory(session, CONFIG)
+            .build()
+            .subscriber.start_from(0)
+            .build_batch(size=1, timelimit=5)
+        )
+        store = SQLAlchemyBackendFactory(other_session, CONFIG).build().event_store
+
+        def append() -> None:
+            store.append(AnEvent(), stream_id=StreamId())
+            other_session.commit()
+
+        appending = threading.Timer(0.5, append)
+        start = time.monotonic()
+        appending.start()
+        batch = next(subscription)
+
+    assert len(batch) == 1
+    assert time.monotonic() - start < 2
+
+
+def test_polls_on_dialects_without_notifications(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    with sqlalchemy_sqlite() as session:
+        backend = SQLAlchemyBackendFactory(session, CONFIG).build()
+        backend.event_store.append(AnEvent(), stream_id=StreamId())
+        session.commit()
+
+        batch = next(backend.subscriber.start_from(0).build_batch(size=1, timelimit=1))
+
+    assert len(batch) == 1
+
+
+def test_backs_off_listening_after_failed_connection() -> None:
+    connecting = threading.Event()
+
+    def raw_connection() -> None:
+        connecting.set()
+        raise ConnectionRefusedError
+
+    engine = Mock(spec=Engine)
+    engine.raw_connection.side_effect = raw_connection
+    notifications = notifications_for(engine, "event_sourcery_test")
+
+    generation = notifications.generation
+    assert connecting.wait(timeout=1)
+    notifications.wait(generation, timeout=0.1)
+    notifications.wait(notifications.generation, timeout=0.1)
+
+    engine.raw_connection.assert_called_once()
+
+
+def test_releases_notifications_of_collected_engines() -> None:
+    engine = create_engine("sqlite://")
+    notifications = weakref.ref(notifications_for(engine, "event_sourcery_test"))
+
+    del engine
+    gc.collect()
+
+    assert notifications() is None
@@ -0,0 +1,73 @@
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from event_sourcery.event_store import PollingPolicy
+from event_sourcery.event_store.polling import RateLimiter
+from event_sourcery_django import Config as DjangoConfig
+from event_sourcery_sqlalchemy import Config as SqlAlchemyConfig
+
+
+def test_backs_off_exponentially_up_to_max_interval() -> None:
+    backoff = PollingPolicy(
+        min_interval=timedelta(seconds=1),
+        max_interval=timedelta(seconds=5),
+        jitter=0,
+    ).backoff()
+
+    delays = [backoff.next_delay() for _ in range(5)]
+
+    assert delays == [1, 2, 4, 5, 5]
+
+
+def test_starts_from_min_interval_after_reset() -> None:
+    backoff = PollingPolicy(min_interval=timedelta(seconds=1), jitter=0).backoff()
+    backoff.next_delay()
+    backoff.next_delay()
+
+    backoff.reset()
+
+    assert backoff.next_delay() == 1
+
+
+def test_jitters_delays_within_bounds() -> None:
+    policy = PollingPolicy(min_interval=timedelta(seconds=1), multiplier=1, jitter=0.5)
+    backoff = policy.backoff()
+
+    delays = {backoff.next_delay() for _ in range(100)}
+
+    assert all(0.5 <= delay <= 1.5 for delay in delays)
+    assert len(delays) > 1
+
+
+def test_limits_rate_of_calls_from_all_threads() -> None:
+    limiter = RateLimiter(rate=100)
+
+    def acquire_five_times() -> None:
+        for _ in range(5):
+            limiter.acquire()
+
+    threads = [threading.Thread(target=acquire_five_times) for _ in range(4)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert time.monotonic() - start >= 0.19
+
+
+@pytest.mark.parametrize("config", [SqlAlchemyConfig, DjangoConfig])
+def test_maps_deprecated_gap_retry_interval_to_min_interval(
+    config: type[SqlAlchemyConfig] | type[DjangoConfig],
+) -> None:
+    with pytest.deprecated_call():
+        polling = config(  # type: ignore[call-arg]
+            gap_retry_interval=timedelta(seconds=1),
+            polling=PollingPolicy(jitter=0),
+        ).polling
+
+    assert polling == PollingPolicy(min_interval=timedelta(seconds=1), jitter=0)
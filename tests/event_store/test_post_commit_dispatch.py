@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from sqlalchemy.orm import sessionmaker
+
+from event_sourcery.event_store import StreamId
+from event_sourcery_sqlalchemy import SQLAlchemyBackendFactory
+from tests.factories import AnEvent
+
+
+def test_delivers_records_after_commit(sqlalchemy_sqlite: sessionmaker) -> None:
+    listener = Mock()
+    with sqlalchemy_sqlite() as session, ThreadPoolExecutor() as executor:
+        backend = (
+            SQLAlchemyBackendFactory(session)
+            .with_post_commit_dispatch(executor)
+            .build()
+        )
+        backend.in_transaction.register(listener, to=AnEvent)
+        backend.event_store.append(AnEvent(), stream_id=StreamId())
+        delivered_before_commit = listener.call_count
+
+        session.commit()
+        executor.shutdown()
+
+    assert delivered_before_commit == 0
+    listener.assert_called_once()
+
+
+def test_discards_records_on_rollback(sqlalchemy_sqlite: sessionmaker) -> None:
+    listener = Mock()
+    with sqlalchemy_sqlite() as session, ThreadPoolExecutor() as executor:
+        backend = (
+            SQLAlchemyBackendFactory(session)
+            .with_post_commit_dispatch(executor)
+            .build()
+        )
+        backend.in_transaction.register(listener, to=AnEvent)
+        backend.event_store.append(AnEvent(), stream_id=StreamId())
+        session.rollback()
+        backend.event_store.append(AnEvent(), stream_id=(stream_id := StreamId()))
+
+        session.commit()
+        executor.shutdown()
+
+    listener.assert_called_once()
+    assert listener.call_args.args[1] == stream_id
+
+
+def test_registers_session_hooks_once(sqlalchemy_sqlite: sessionmaker) -> None:
+    with sqlalchemy_sqlite() as session, ThreadPoolExecutor() as executor:
+        factory = SQLAlchemyBackendFactory(session).with_post_commit_dispatch(executor)
+        factory.build()
+        hooks = len(session.dispatch.after_commit)
+        factory.build()
+
+        assert len(session.dispatch.after_commit) == hooks
+
+
+def test_delivers_records_after_commit_of_outermost_transaction(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    listener = Mock()
+    with sqlalchemy_sqlite() as session, ThreadPoolExecutor() as executor:
+        backend = (
+            SQLAlchemyBackendFactory(session)
+            .with_post_commit_dispatch(executor)
+            .build()
+        )
+        backend.in_transaction.register(listener, to=AnEvent)
+        with session.begin_nested():
+            backend.event_store.append(AnEvent(), stream_id=StreamId())
+        delivered_before_commit = listener.call_count
+
+        session.commit()
+        executor.shutdown()
+
+    assert delivered_before_commit == 0
+    listener.assert_called_once()
+
+
+def test_keeps_records_of_outer_transaction_on_savepoint_rollback(
+    sqlalchemy_sqlite: sessionmaker,
+) -> None:
+    listener = Mock()
+    with sqlalchemy_sqlite() as session, ThreadPoolExecutor() as executor:
+        backend = (
+            SQLAlchemyBackendFactory(session)
+            .with_post_commit_dispatch(executor)
+            .build()
+        )
+        backend.in_transaction.register(listener, to=AnEvent)
+        backend.event_store.append(AnEvent(), stream_id=(stream_id := StreamId()))
+        savepoint = session.begin_nested()
+        backend.event_store.append(AnEvent(), stream_id=StreamId())
+        savepoint.rollback()
+
+        session.commit()
+        executor.shutdown()
+
+    listener.assert_called_once()
+    assert listener.call_args.args[1] == stream_id
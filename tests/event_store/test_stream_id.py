@@ -43,6 +43,23 @@ def test_forbids_creating_stream_id_with_not_matching_uuid() -> None:
         StreamId(random_uuid, name="name")
 
 
+def test_trusted_stream_id_equals_validated_one() -> None:
+    stream_id = StreamId(name="name", category="category")
+
+    trusted = StreamId.trusted(stream_id, "name", category="category")
+
+    assert trusted == stream_id
+    assert hash(trusted) == hash(stream_id)
+    assert (trusted.name, trusted.category) == ("name", "category")
+
+
+def test_interns_trusted_stream_ids() -> None:
+    uuid = uuid4()
+
+    assert StreamId.trusted(uuid) is StreamId.trusted(uuid)
+    assert StreamId.trusted(uuid) is not StreamId.trusted(uuid, category="Cat")
+
+
 class TestStreamIdEQ:
     def test_auto_init_equality(self) -> None:
         assert StreamId() != StreamId()